@@ -53,13 +53,23 @@ from .core.calldata import (
     set_dump_slang_intermediates,
     set_print_generated_shaders,
 )
+from .core.kernelcache import set_kernel_cache_path
+from .core.autotune import AutotuneConfig, set_autotune_path
+from .builtin.numpy import set_numpy_staging_pool
+from .core.bufferpool import set_buffer_pool, get_buffer_pool
 
 # Core slangpy interface
-from .core.function import Function
+from .core.function import Function, CallOrder
 from .core.struct import Struct
-from .core.module import Module
+from .core.module import Module, set_hot_reload_recompile
 from .core.instance import InstanceList, InstanceBuffer
 from .core.packedarg import pack
+from .core.warmup import ArgSpec, CallSpec, set_compile_workers
+from .core.callgraph import CallGraph, GraphInput
+from .core import profiling
+from .core.lazy import lazy, LazyValue
+from .core.reduce import reduce
+from . import primitives
 
 # Py torch integration
 from .torchintegration import *
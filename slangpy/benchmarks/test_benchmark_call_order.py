@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy.testing import helpers
+from slangpy.testing.benchmark import BenchmarkSlangFunction
+
+SIZE = 4096
+
+ORDERS = ["row_major", "tiled", "morton", "hilbert"]
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("order", ORDERS)
+def test_box_blur(
+    device_type: spy.DeviceType, order: str, benchmark_slang_function: BenchmarkSlangFunction
+):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(SIZE, SIZE).astype(np.float32)
+    input = spy.Tensor.from_numpy(device, data)
+    result = spy.Tensor.empty(device, shape=(SIZE, SIZE), dtype=float)
+
+    module = spy.Module(device.load_module("test_benchmark_tensor.slang"))
+    func = module.require_function("box_blur<4>").call_order(order)
+
+    benchmark_slang_function(device, func, tid=spy.call_id(), input=input, _result=result)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("order", ORDERS)
+def test_transpose(
+    device_type: spy.DeviceType, order: str, benchmark_slang_function: BenchmarkSlangFunction
+):
+    # Reads walk down columns, so row major order has the worst locality.
+    device = helpers.get_device(device_type)
+    data = np.random.rand(SIZE, SIZE).astype(np.float32)
+    input = spy.Tensor.from_numpy(device, data)
+    result = spy.Tensor.empty(device, shape=(SIZE, SIZE), dtype=float)
+
+    module = spy.Module(device.load_module("test_benchmark_tensor.slang"))
+    func = module.require_function("transpose").call_order(order)
+
+    benchmark_slang_function(device, func, tid=spy.call_id(), input=input, _result=result)
+    assert np.array_equal(result.to_numpy(), data.T)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
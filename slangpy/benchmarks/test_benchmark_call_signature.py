@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy.core.native import NativeFunctionNode
+from slangpy.testing import helpers
+from slangpy.testing.benchmark import BenchmarkPythonFunction
+
+ADD_FLOATS = """
+float add_floats(float a, float b) {
+    return a + b;
+}
+"""
+
+SCALE_FLOATS = """
+void scale_floats(uint3 dispatchThreadID, RWStructuredBuffer<float> buffer, float amount) {
+    buffer[dispatchThreadID.x] *= amount;
+}
+"""
+
+
+@pytest.fixture
+def call_guards(request: pytest.FixtureRequest):
+    # Compare repeat call resolution with and without call guards.
+    enabled = NativeFunctionNode.is_call_guards_enabled()
+    NativeFunctionNode.set_call_guards_enabled(request.param)
+    yield request.param
+    NativeFunctionNode.set_call_guards_enabled(enabled)
+
+
+@pytest.mark.parametrize("call_guards", [True, False], indirect=True)
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_resolve_scalars(
+    device_type: spy.DeviceType,
+    call_guards: bool,
+    benchmark_python_function: BenchmarkPythonFunction,
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_floats", ADD_FLOATS)
+
+    def resolve():
+        func.debug_build_call_data(1.0, 2.0)
+
+    benchmark_python_function(device, resolve)
+
+
+@pytest.mark.parametrize("call_guards", [True, False], indirect=True)
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_resolve_buffers(
+    device_type: spy.DeviceType,
+    call_guards: bool,
+    benchmark_python_function: BenchmarkPythonFunction,
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_floats", ADD_FLOATS)
+
+    a = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    b = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    res = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+
+    def resolve():
+        func.debug_build_call_data(a, b, _result=res)
+
+    benchmark_python_function(device, resolve)
+
+
+@pytest.mark.parametrize("call_guards", [True, False], indirect=True)
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_resolve_numpy(
+    device_type: spy.DeviceType,
+    call_guards: bool,
+    benchmark_python_function: BenchmarkPythonFunction,
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_floats", ADD_FLOATS)
+
+    a = np.zeros((10,), dtype=np.float32)
+    b = np.zeros((10,), dtype=np.float32)
+
+    def resolve():
+        func.debug_build_call_data(a, b)
+
+    benchmark_python_function(device, resolve)
+
+
+@pytest.mark.parametrize("call_guards", [True, False], indirect=True)
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_buffers(
+    device_type: spy.DeviceType,
+    call_guards: bool,
+    benchmark_python_function: BenchmarkPythonFunction,
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_floats", ADD_FLOATS)
+
+    a = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    b = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    res = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+
+    def call():
+        func(a, b, _result=res)
+
+    benchmark_python_function(device, call)
+
+
+@pytest.mark.parametrize("call_guards", [True, False], indirect=True)
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_raw_dispatch(
+    device_type: spy.DeviceType,
+    call_guards: bool,
+    benchmark_python_function: BenchmarkPythonFunction,
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "scale_floats", SCALE_FLOATS)
+
+    buffer = device.create_buffer(
+        size=32 * 4, struct_size=4, usage=spy.BufferUsage.unordered_access
+    )
+
+    def dispatch():
+        func.dispatch(spy.uint3(32, 1, 1), buffer=buffer, amount=1.0)
+
+    benchmark_python_function(device, dispatch)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compiled_call_buffers(
+    device_type: spy.DeviceType, benchmark_python_function: BenchmarkPythonFunction
+):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_floats", ADD_FLOATS)
+
+    a = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    b = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    res = spy.NDBuffer.empty(device, shape=(10,), dtype=float)
+    handle = func.compile(a, b, _result=res)
+
+    def call():
+        handle(a, b, _result=res)
+
+    benchmark_python_function(device, call)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
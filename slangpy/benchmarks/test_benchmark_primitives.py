@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy.testing import helpers
+from slangpy.testing.benchmark import BenchmarkPythonFunction
+
+COUNT = 1 << 20
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_radix_sort(
+    device_type: spy.DeviceType, benchmark_python_function: BenchmarkPythonFunction
+):
+    device = helpers.get_device(device_type)
+    keys = spy.NDBuffer.from_numpy(device, np.random.rand(COUNT).astype(np.float32))
+    values = spy.NDBuffer.from_numpy(device, np.arange(COUNT, dtype=np.uint32))
+
+    def sort():
+        spy.primitives.radix_sort(keys, values)
+        device.wait()
+
+    benchmark_python_function(device, sort, iterations=5, sub_iterations=4)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_exclusive_scan(
+    device_type: spy.DeviceType, benchmark_python_function: BenchmarkPythonFunction
+):
+    device = helpers.get_device(device_type)
+    data = spy.NDBuffer.from_numpy(device, np.ones(COUNT, dtype=np.uint32))
+
+    def scan():
+        spy.primitives.exclusive_scan(data)
+        device.wait()
+
+    benchmark_python_function(device, scan, iterations=5, sub_iterations=10)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_histogram(device_type: spy.DeviceType, benchmark_python_function: BenchmarkPythonFunction):
+    device = helpers.get_device(device_type)
+    data = spy.NDBuffer.from_numpy(device, np.random.rand(COUNT).astype(np.float32))
+
+    def histogram():
+        spy.primitives.histogram(data, 256, range=(0.0, 1.0))
+        device.wait()
+
+    benchmark_python_function(device, histogram, iterations=5, sub_iterations=10)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compact(device_type: spy.DeviceType, benchmark_python_function: BenchmarkPythonFunction):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(COUNT).astype(np.float32)
+    values = spy.NDBuffer.from_numpy(device, data)
+    mask = spy.NDBuffer.from_numpy(device, (data > 0.5).astype(np.uint32))
+
+    def compact():
+        spy.primitives.compact(values, mask)
+        device.wait()
+
+    benchmark_python_function(device, compact, iterations=5, sub_iterations=10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
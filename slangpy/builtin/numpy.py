@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import os
 from typing import Any
 
 from slangpy.bindings.boundvariable import BoundVariable
@@ -137,6 +138,21 @@ def create_vr_type_for_value(layout: SlangProgramLayout, value: Any):
 PYTHON_TYPES[np.ndarray] = create_vr_type_for_value
 
 
+def set_numpy_staging_pool(enabled: bool):
+    """
+    Enable or disable pooling of the buffers used to pass numpy arrays to kernels. When
+    enabled, device buffers and read back buffers are drawn from the device's buffer pool
+    (see set_buffer_pool) and reused between calls with arrays of the same size, even if
+    pooling of other transient buffers is disabled. Can also be enabled via the
+    SLANGPY_NUMPY_STAGING_POOL environment variable.
+    """
+    NativeNumpyMarshall.set_staging_pool_enabled(enabled)
+
+
+if os.environ.get("SLANGPY_NUMPY_STAGING_POOL", "false").lower() in ("true", "1"):
+    set_numpy_staging_pool(True)
+
+
 def hash_numpy(value: npt.NDArray[Any]) -> str:
     return f"numpy.ndarray[{value.dtype},{value.ndim}]"
 
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Adaptive specialization (see FunctionNode.adaptive_constants). Calls track how many times
+in a row each scalar or vector argument has had the same value. Once a set of arguments
+has been stable for long enough, calls with those values use a variant of the kernel with
+the values baked in as constants. Calls with other values use the generic kernel.
+"""
+import math
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from slangpy.core.callsignature import is_slangpy_vector
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+TArgKey = Union[int, str]
+
+
+def _is_specializable(value: Any) -> bool:
+    if isinstance(value, float):
+        # Literals can't represent infinities or nans.
+        return math.isfinite(value)
+    return isinstance(value, (bool, int)) or is_slangpy_vector(value)
+
+
+def _value_key(value: Any) -> Any:
+    # Include the type, so eg 1, 1.0 and True are distinct.
+    if is_slangpy_vector(value):
+        return (type(value).__name__, tuple(value))
+    return (type(value).__name__, value)
+
+
+class AdaptiveConstants:
+    """
+    Specialization state of an adaptive function node.
+    """
+
+    def __init__(self, node: "FunctionNode", threshold: int, max_variants: int):
+        super().__init__()
+        if threshold < 1:
+            raise ValueError(f"Adaptive constant threshold must be at least 1, got {threshold}")
+        if max_variants < 1:
+            raise ValueError(f"Adaptive constant variants must be at least 1, got {max_variants}")
+        self.node = node
+        self.threshold = threshold
+        self.max_variants = max_variants
+
+        # Last value of each argument and the number of calls in a row it had it.
+        self.last_values: dict[TArgKey, Any] = {}
+        self.stable_counts: dict[TArgKey, int] = {}
+
+        # Specialized nodes by the signatures of the nodes called between this one and the
+        # adaptive node (such as return types), then by the (argument, value key) pairs
+        # they're specialized on.
+        self.variants: dict[
+            tuple[str, ...], dict[tuple[tuple[TArgKey, Any], ...], "FunctionNode"]
+        ] = {}
+        self.variant_count = 0
+
+    def select(
+        self, function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Optional["FunctionNode"]:
+        """
+        Record the values of a call's arguments and get the specialized node to call, or
+        None to call the generic kernel.
+        """
+        values: dict[TArgKey, Any] = {}
+        for i, arg in enumerate(args):
+            if _is_specializable(arg):
+                values[i] = arg
+        for name, arg in kwargs.items():
+            if not name.startswith("_") and _is_specializable(arg):
+                values[name] = arg
+
+        # Update the number of calls in a row each argument has had its value.
+        keys = {k: _value_key(v) for k, v in values.items()}
+        for k in list(self.last_values):
+            if k not in keys:
+                del self.last_values[k]
+                del self.stable_counts[k]
+        for k, key in keys.items():
+            if self.last_values.get(k) == key:
+                self.stable_counts[k] += 1
+            else:
+                self.last_values[k] = key
+                self.stable_counts[k] = 1
+
+        chain = []
+        node = function
+        while node is not self.node:
+            chain.append(node.slangpy_signature)
+            node = node.parent
+        variants = self.variants.setdefault(tuple(chain), {})
+
+        # Use an existing variant if the call matches its values.
+        for variant_key, node in variants.items():
+            if all(keys.get(k) == key for k, key in variant_key):
+                return node
+
+        # Otherwise create a variant for the stable arguments, unless the limit is reached,
+        # so arguments that keep changing don't cause a compile per value.
+        stable = tuple(
+            sorted(
+                ((k, key) for k, key in keys.items() if self.stable_counts[k] >= self.threshold),
+                key=lambda x: str(x[0]),
+            )
+        )
+        if len(stable) == 0 or self.variant_count >= self.max_variants:
+            return None
+        node = function.specialize_args({k: values[k] for k, _ in stable})
+        variants[stable] = node
+        self.variant_count += 1
+        return node
@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import hashlib
+import json
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence, Union
+
+import numpy as np
+
+from slangpy import Device, QueryType, uint3
+from slangpy.core.function import PipelineType
+from slangpy.core.native import NativeCallRuntimeOptions, SignatureBuilder
+from slangpy.slangpy import Shape
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+# Bump whenever the format of the table changes.
+AUTOTUNE_VERSION = 1
+
+#: Thread group sizes tried for calls without a call group shape.
+DEFAULT_THREAD_GROUP_SIZES = (32, 64, 128, 256)
+
+#: Shapes of the innermost 2 call dimensions tried as call group shapes.
+DEFAULT_CALL_GROUP_TILES = ((4, 8), (8, 8), (8, 16), (16, 16), (4, 32), (8, 32))
+
+
+class AutotuneConfig:
+    """
+    Group configuration of a vectorized call: either a thread group size for the flat
+    dispatch of the call shape, or a call group shape. At most one is set.
+    """
+
+    def __init__(
+        self,
+        thread_group_size: Optional[int] = None,
+        call_group_shape: Optional[Sequence[int]] = None,
+    ):
+        super().__init__()
+        if thread_group_size is not None and call_group_shape is not None:
+            raise ValueError("Specify a thread group size or a call group shape, not both")
+        self.thread_group_size = thread_group_size
+        self.call_group_shape = tuple(call_group_shape) if call_group_shape is not None else None
+
+    def apply(self, function: "FunctionNode") -> "FunctionNode":
+        """
+        Get a function node that calls function with this configuration.
+        """
+        if self.call_group_shape is not None:
+            return function.call_group_shape(Shape(self.call_group_shape))
+        if self.thread_group_size is not None:
+            return function.thread_group_size(uint3(self.thread_group_size, 1, 1))
+        return function
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "thread_group_size": self.thread_group_size,
+            "call_group_shape": (
+                list(self.call_group_shape) if self.call_group_shape is not None else None
+            ),
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "AutotuneConfig":
+        return AutotuneConfig(data.get("thread_group_size"), data.get("call_group_shape"))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, AutotuneConfig)
+            and self.thread_group_size == other.thread_group_size
+            and self.call_group_shape == other.call_group_shape
+        )
+
+    def __repr__(self) -> str:
+        if self.call_group_shape is not None:
+            return f"AutotuneConfig(call_group_shape={self.call_group_shape})"
+        return f"AutotuneConfig(thread_group_size={self.thread_group_size})"
+
+
+class AutotuneTable:
+    """
+    Table of the best group configuration found by autotune for each call signature on
+    each graphics adapter. Calls consult it when generating their kernel, unless they set
+    their own thread group size or call group shape.
+
+    If a path is given, the table is loaded from and saved to a JSON file there, so
+    results persist between processes. Otherwise it only lives for the process.
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike[str]]] = None):
+        super().__init__()
+        self.path = Path(path).absolute() if path is not None else None
+        self.entries: dict[str, dict[str, dict[str, Any]]] = {}
+        if self.path is not None:
+            self.entries = self._load()
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        assert self.path is not None
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == AUTOTUNE_VERSION:
+                return data["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def __len__(self) -> int:
+        return sum(len(x) for x in self.entries.values())
+
+    @staticmethod
+    def adapter_key(device: Device) -> str:
+        info = device.info
+        return f"{info.type.name}:{info.api_name}:{info.adapter_name}"
+
+    @staticmethod
+    def signature_key(signature: str) -> str:
+        return hashlib.sha256(signature.encode()).hexdigest()
+
+    def find(self, device: Device, signature: str) -> Optional[AutotuneConfig]:
+        """
+        Get the configuration stored for a call signature on a device's adapter, if any.
+        """
+        adapter = self.entries.get(self.adapter_key(device))
+        if adapter is None:
+            return None
+        entry = adapter.get(self.signature_key(signature))
+        return AutotuneConfig.from_dict(entry) if entry is not None else None
+
+    def store(self, device: Device, signature: str, config: AutotuneConfig):
+        """
+        Store the configuration for a call signature on a device's adapter, saving the
+        table if it has a path. Saving merges the entry into the file's current contents
+        under a file lock, so processes may share a table without losing each other's
+        results.
+        """
+        adapter_key = self.adapter_key(device)
+        signature_key = self.signature_key(signature)
+        entry = config.to_dict()
+        self.entries.setdefault(adapter_key, {})[signature_key] = entry
+        if self.path is None:
+            return
+        try:
+            os.makedirs(self.path.parent, exist_ok=True)
+            with _file_lock(self.path.with_suffix(".lock")):
+                # Pick up entries other processes stored since the table was loaded.
+                entries = self._load()
+                entries.setdefault(adapter_key, {})[signature_key] = entry
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"version": AUTOTUNE_VERSION, "entries": entries}, f, indent=1)
+                os.replace(tmp_path, self.path)
+            self.entries = entries
+        except OSError:
+            # Failing to save the table should never break a call.
+            pass
+
+    def clear(self):
+        """
+        Remove all entries from the table, and its file if it has one.
+        """
+        self.entries = {}
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Generator[None, None, None]:
+    # Exclusive lock on a file shared between processes, held for the duration.
+    with open(path, "a+") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 attempts, so keep trying.
+                    pass
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+_AUTOTUNE_TABLE = AutotuneTable(os.environ.get("SLANGPY_AUTOTUNE_PATH"))
+
+
+def set_autotune_path(path: Optional[Union[str, os.PathLike[str]]]):
+    """
+    Load and save autotune results in a JSON file at the given path, or keep them in
+    memory only if None. Can also be controlled via the SLANGPY_AUTOTUNE_PATH environment
+    variable.
+    """
+    global _AUTOTUNE_TABLE
+    _AUTOTUNE_TABLE = AutotuneTable(path)
+
+
+def get_autotune_table() -> AutotuneTable:
+    """
+    Get the active autotune table.
+    """
+    return _AUTOTUNE_TABLE
+
+
+def call_signature(function: "FunctionNode", *args: Any, **kwargs: Any) -> str:
+    """
+    Get the signature identifying a call of function with the given arguments, as used
+    by the call data and kernel caches.
+    """
+    builder = SignatureBuilder()
+    function.read_signature(builder)
+    function.module.call_data_cache.get_args_signature(builder, *args, **kwargs)
+    return builder.str
+
+
+def default_candidates(function: "FunctionNode", *args: Any, **kwargs: Any):
+    """
+    Get the configurations autotune tries for a call: each default thread group size
+    and, for calls of 2 or more dimensions, call group shapes tiling the innermost 2.
+    """
+    candidates = [AutotuneConfig(thread_group_size=x) for x in DEFAULT_THREAD_GROUP_SIZES]
+    build_info = function.calc_build_info()
+    if build_info.indirect or build_info.gather:
+        # Indirect and gather calls don't support call group shapes.
+        return candidates
+    call_data = function.debug_build_call_data(*args, **kwargs)
+    dims = call_data.call_dimensionality
+    if dims >= 2:
+        for tile in DEFAULT_CALL_GROUP_TILES:
+            candidates.append(AutotuneConfig(call_group_shape=(1,) * (dims - 2) + tile))
+    return candidates
+
+
+def autotune(
+    function: "FunctionNode",
+    *args: Any,
+    candidates: Optional[Sequence[AutotuneConfig]] = None,
+    iterations: int = 10,
+    warmup_iterations: int = 3,
+    **kwargs: Any,
+) -> AutotuneConfig:
+    """
+    Time a call of function with the given arguments under each candidate group
+    configuration (by default, see default_candidates) using GPU timestamps, and store
+    the fastest in the autotune table for the device's adapter. Later calls with the
+    same signature then use it automatically. Returns the configuration chosen.
+
+    The call is run warmup_iterations + iterations times per candidate, so its
+    arguments should tolerate being written repeatedly.
+    """
+    if function.calc_build_info().pipeline_type != PipelineType.compute:
+        raise ValueError("Only compute calls can be autotuned")
+    if candidates is None:
+        candidates = default_candidates(function, *args, **kwargs)
+    if len(candidates) == 0:
+        raise ValueError("No autotune candidates given")
+
+    device = function.module.device
+    timings = []
+    for candidate in candidates:
+        node = candidate.apply(function)
+        for _ in range(warmup_iterations):
+            node(*args, **kwargs)
+
+        query_pool = device.create_query_pool(type=QueryType.timestamp, count=iterations * 2)
+        for i in range(iterations):
+            command_encoder = device.create_command_encoder()
+            command_encoder.write_timestamp(query_pool, i * 2)
+            node.append_to(command_encoder, *args, **kwargs)
+            command_encoder.write_timestamp(query_pool, i * 2 + 1)
+            device.submit_command_buffer(command_encoder.finish())
+        device.wait()
+        queries = np.array(query_pool.get_results(0, iterations * 2))
+        timings.append(float(np.median(queries[1::2] - queries[0::2])))
+
+    best = candidates[int(np.argmin(timings))]
+
+    # Call data is built and cached with 'this' (if any) as the first argument, so the
+    # signature must include it to match later calls.
+    opts = NativeCallRuntimeOptions()
+    function.gather_runtime_options(opts)
+    this = opts._native_this
+    if this is not None:
+        args = (this,) + args
+    signature = call_signature(function, *args, **kwargs)
+    get_autotune_table().store(device, signature, best)
+
+    # Call data already generated for the signature doesn't use the new configuration.
+    function.module.call_data_cache.remove_call_data(signature)
+    return best
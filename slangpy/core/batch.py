@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Sequence, Union
+
+from slangpy import Buffer, CommandEncoder, Texture
+from slangpy.core.callgraph import CallGraph
+from slangpy.core.native import (
+    AccessType,
+    NativeBoundVariableRuntime,
+    NativeCallData,
+    NativeCallRuntimeOptions,
+    NativePendingCall,
+)
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+TCallArgs = Union[Mapping[str, Any], Sequence[Any]]
+
+
+def encode_call(
+    call_data: NativeCallData,
+    opts: NativeCallRuntimeOptions,
+    command_encoder: CommandEncoder,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> NativePendingCall:
+    """
+    Append a call to a command encoder, allocating its return value if need be. Appending
+    normally skips allocation of implicit return values and reading back results, so this
+    allocates them up front the same way a normal call would, and keeps the state needed
+    by read_result to read them back.
+    """
+    return call_data.append_pending(opts, command_encoder, *args, **kwargs)
+
+
+def read_result(call_data: NativeCallData, pending: NativePendingCall) -> Any:
+    """
+    Read the result of a call encoded by encode_call, once it has been submitted. This
+    also copies back outputs (such as numpy arrays) and updates 'this' values.
+    """
+    return call_data.read_pending(pending)
+
+
+def _resources(value: Any) -> Iterator[Union[Buffer, Texture]]:
+    # Buffers and textures an argument value binds, including the storage of NDBuffers
+    # and tensors (and their gradients).
+    if isinstance(value, (Buffer, Texture)):
+        yield value
+    elif isinstance(value, dict):
+        for x in value.values():
+            yield from _resources(x)
+    elif hasattr(value, "storage"):
+        storage = value.storage
+        if isinstance(storage, Buffer):
+            yield storage
+        for grad in (getattr(value, "grad_in", None), getattr(value, "grad_out", None)):
+            if grad is not None:
+                yield from _resources(grad)
+
+
+def _gather_access(
+    binding: NativeBoundVariableRuntime,
+    value: Any,
+    reads: set[Any],
+    writes: set[Any],
+):
+    # Record the resources a bound argument reads and writes. The sets hold the resource
+    # objects rather than ids so they stay alive, and the same native resource keeps
+    # mapping to the same python object. Children are
+    # visited where the value is a dictionary, so eg a struct with one output field only
+    # marks that field's buffer as written.
+    children = getattr(binding, "children", None)
+    if children and isinstance(value, dict):
+        for name, child in children.items():
+            if name in value:
+                _gather_access(child, value[name], reads, writes)
+        return
+    written = any(x in (AccessType.write, AccessType.readwrite) for x in binding.access)
+    for resource in _resources(value):
+        (writes if written else reads).add(resource)
+
+
+def call_many(function: "FunctionNode", calls: Iterable[TCallArgs]) -> list[Any]:
+    """
+    Dispatch a function once per set of arguments, encoding all dispatches into a single
+    command encoder with one submit. Each set of arguments is a dictionary of keyword
+    arguments or a sequence of positional arguments. Returns the result of each call.
+
+    A barrier is inserted before a call only if it reads or writes a buffer or texture
+    written by an earlier call (or writes one read by an earlier call) since the last
+    barrier, so independent calls can overlap on the GPU.
+    """
+    if CallGraph.active() is not None:
+        raise ValueError("call_many cannot be used while a call graph is being captured")
+
+    module = function.module
+    device = module.device
+    cache = module.call_data_cache
+    adaptive = function.calc_build_info().adaptive
+
+    # Runtime options (uniforms, 'this' etc.) are the same for every call to a node, but
+    # adaptive functions may pick a different variant per call.
+    node_opts: dict[int, NativeCallRuntimeOptions] = {}
+
+    command_encoder = device.create_command_encoder()
+    pending: list[tuple[NativeCallData, NativePendingCall]] = []
+    reads: set[Any] = set()
+    writes: set[Any] = set()
+    for call in calls:
+        if isinstance(call, Mapping):
+            args: tuple[Any, ...] = ()
+            kwargs = dict(call)
+        else:
+            args = tuple(call)
+            kwargs = {}
+        if isinstance(kwargs.get("_result"), (type, str)):
+            raise ValueError("Result type overrides are not supported by call_many")
+
+        node = function
+        if adaptive is not None:
+            variant = adaptive.select(function, args, kwargs)
+            if variant is not None:
+                node = variant
+        opts = node_opts.get(id(node))
+        if opts is None:
+            opts = NativeCallRuntimeOptions()
+            node.gather_runtime_options(opts)
+            node_opts[id(node)] = opts
+
+        # Signature building and lookup happen natively and hit the cache after the first
+        # call, so only calls with new argument types pay for kernel generation.
+        call_data = node._native_build_call_data(cache, *args, **kwargs)
+        if call_data.torch_integration:
+            raise ValueError(
+                "call_many does not support calls with torch tensors, call the function directly"
+            )
+        this = opts._native_this
+        if this is not None:
+            args = (this,) + args
+
+        # Implicitly allocated results are new buffers, so only passed values can alias.
+        call_reads: set[Any] = set()
+        call_writes: set[Any] = set()
+        runtime = call_data.runtime
+        for binding, value in zip(runtime.args, args):
+            _gather_access(binding, value, call_reads, call_writes)
+        for name, value in kwargs.items():
+            binding = runtime.find_kwarg(name)
+            if binding is not None:
+                _gather_access(binding, value, call_reads, call_writes)
+        if not writes.isdisjoint(call_reads | call_writes) or not reads.isdisjoint(call_writes):
+            command_encoder.global_barrier()
+            reads.clear()
+            writes.clear()
+        reads |= call_reads
+        writes |= call_writes
+
+        pending.append((call_data, encode_call(call_data, opts, command_encoder, args, kwargs)))
+
+    device.submit_command_buffer(command_encoder.finish())
+
+    return [read_result(call_data, x) for call_data, x in pending]
+
+
+def map_calls(function: "FunctionNode", *iterables: Iterable[Any]) -> list[Any]:
+    """
+    Dispatch a function once per element of the given iterables, in the same way as the
+    built in map, with all dispatches submitted together as in call_many.
+    """
+    return call_many(function, zip(*iterables))
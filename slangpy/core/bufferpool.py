@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import os
+
+from slangpy import Device
+from slangpy.core.native import BufferPool
+
+
+def set_buffer_pool(enabled: bool):
+    """
+    Enable or disable pooling of transient device buffers. When enabled, implicit call
+    outputs (NDBuffer and Tensor return values), and the device and read back buffers used
+    to pass numpy arrays and torch tensors to kernels, are drawn from a per device pool and
+    reused once they are no longer referenced and the GPU has finished with them. Free
+    buffers are released once idle for the pool's max_idle_submits submits, or while they
+    exceed its max_free_bytes. Can also be enabled via the SLANGPY_BUFFER_POOL environment
+    variable.
+    """
+    BufferPool.set_enabled(enabled)
+
+
+def get_buffer_pool(device: Device) -> BufferPool:
+    """
+    Get the transient buffer pool for a device, e.g. to read its hit and peak byte stats,
+    adjust its limits or trim unused buffers.
+    """
+    return BufferPool.get(device)
+
+
+if os.environ.get("SLANGPY_BUFFER_POOL", "false").lower() in ("true", "1"):
+    set_buffer_pool(True)
@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import copy
 import hashlib
 import os
 import re
@@ -16,8 +17,13 @@ from slangpy.core.native import (
     NativeCallRuntimeOptions,
     TensorRef,
 )
+from slangpy.core.kernelcache import get_kernel_cache
+from slangpy.core.autotune import call_signature, get_autotune_table
+from slangpy.core import profiling
 
-from slangpy import SlangCompileError, SlangLinkOptions, NativeHandle, DeviceType
+from slangpy import SlangCompileError, SlangLinkOptions, NativeHandle, DeviceType, uint3
+from slangpy.core.function import PipelineType
+from slangpy.slangpy import Shape
 from slangpy.bindings import (
     BindContext,
     BoundCallRuntime,
@@ -113,6 +119,27 @@ class CallData(NativeCallData):
             # Read temps from function
             function = func
             build_info = function.calc_build_info()
+            timer = profiling.begin(build_info.module.name, function.name)
+
+            # Use the group configuration autotune found for this call, unless the call
+            # sets its own.
+            tuned_config = None
+            autotune_table = get_autotune_table()
+            if (
+                len(autotune_table) > 0
+                and build_info.pipeline_type == PipelineType.compute
+                and build_info.thread_group_size is None
+                and build_info.call_group_shape is None
+            ):
+                tuned_config = autotune_table.find(
+                    build_info.module.device, call_signature(function, *args, **kwargs)
+                )
+                if tuned_config is not None:
+                    build_info = copy.copy(build_info)
+                    if tuned_config.call_group_shape is not None:
+                        build_info.call_group_shape = Shape(tuned_config.call_group_shape)
+                    elif tuned_config.thread_group_size is not None:
+                        build_info.thread_group_size = uint3(tuned_config.thread_group_size, 1, 1)
             return_type = build_info.return_type
             positional_mapping = build_info.map_args
             keyword_mapping = build_info.map_kwargs
@@ -183,9 +210,11 @@ class CallData(NativeCallData):
             apply_explicit_vectorization(context, bindings, positional_mapping, keyword_mapping)
 
             # Perform specialization to get a concrete function reflection
-            resolve_result = specialize(
-                context, bindings, build_info.function, diagnostics, build_info.this_type
-            )
+            # Specialization goes through the Slang session, which isn't thread safe.
+            with build_info.module.build_lock:
+                resolve_result = specialize(
+                    context, bindings, build_info.function, diagnostics, build_info.this_type
+                )
             if resolve_result is None:
                 raise ResolveException(
                     f"Could not call function '{function.name}':\n\n"
@@ -236,24 +265,57 @@ class CallData(NativeCallData):
             # Calculate differentiability of all variables.
             calculate_differentiability(context, bindings)
 
-            # Generate code.
-            codegen = CodeGen()
-            generate_code(context, build_info, bindings, codegen)
-            for link in build_info.module.link:
-                codegen.add_import(link.name)
-            code = codegen.finish(
-                call_data=True,
-                input_load_store=True,
-                header=True,
-                kernel=True,
-                imports=True,
-                trampoline=True,
-                context=True,
-                snippets=True,
-                call_data_structs=True,
-                constants=True,
-                use_param_block_for_call_data=context.call_data_mode == CallDataMode.global_data,
-            )
+            if timer:
+                timer.mark("bind")
+
+            # Check the persistent kernel cache for previously generated code.
+            kernel_cache = get_kernel_cache()
+            kernel_cache_signature = None
+            cached_kernel = None
+            if kernel_cache is not None:
+                kernel_cache_signature = call_signature(function, *args, **kwargs)
+                if tuned_config is not None:
+                    kernel_cache_signature += f"\n{tuned_config}"
+                cached_kernel = kernel_cache.load(build_info.module, kernel_cache_signature)
+
+            if cached_kernel is not None:
+                hash, code = cached_kernel
+                self.log_debug(f"  Loaded generated code from kernel cache")
+            else:
+                # Generate code.
+                codegen = CodeGen()
+                generate_code(context, build_info, bindings, codegen)
+                for link in build_info.module.link:
+                    codegen.add_import(link.name)
+                code = codegen.finish(
+                    call_data=True,
+                    input_load_store=True,
+                    header=True,
+                    kernel=True,
+                    imports=True,
+                    trampoline=True,
+                    context=True,
+                    snippets=True,
+                    call_data_structs=True,
+                    constants=True,
+                    use_param_block_for_call_data=context.call_data_mode
+                    == CallDataMode.global_data,
+                )
+
+                # Hash the code to get a unique identifier for the module.
+                # We add type conformances to the start of the code to ensure that the hash is unique
+                assert function.slangpy_signature is not None
+                code_minus_header = (
+                    "[CallData]\n" + str(build_info.type_conformances) + code[len(codegen.header) :]
+                )
+                hash = hashlib.sha256(code_minus_header.encode()).hexdigest()
+
+                if kernel_cache is not None:
+                    assert kernel_cache_signature is not None
+                    kernel_cache.store(build_info.module, kernel_cache_signature, hash, code)
+
+            if timer:
+                timer.mark("codegen")
 
             # Optionally write the shader to a file for debugging.
             sanitized = ""
@@ -301,107 +363,117 @@ class CallData(NativeCallData):
                 print("=" * 80)
                 print()
 
-            # Hash the code to get a unique identifier for the module.
-            # We add type conformances to the start of the code to ensure that the hash is unique
-            assert function.slangpy_signature is not None
-            code_minus_header = (
-                "[CallData]\n" + str(build_info.type_conformances) + code[len(codegen.header) :]
-            )
-            hash = hashlib.sha256(code_minus_header.encode()).hexdigest()
-
-            # Check if we've already built this module.
-            if hash in build_info.module.pipeline_cache:
-                # Get pipeline from cache if we have
-                self.pipeline = build_info.module.pipeline_cache[hash]
-                # Get shader table from cache if the pipeline is a raytracing pipeline
-                if build_info.pipeline_type == PipelineType.ray_tracing:
-                    self.shader_table = build_info.module.shader_table_cache[hash]
-                self.device = build_info.module.device
-                self.log_debug(f"  Found cached pipeline with hash {hash}")
+            # Loading, linking and creating the pipeline use the Slang session, so are
+            # serialized per device. Checking the pipeline cache under the same lock ensures
+            # concurrent builds of the same kernel (e.g. via compile_async) only compile it once.
+            with build_info.module.build_lock:
+                # Check if we've already built this module.
+                if hash in build_info.module.pipeline_cache:
+                    # Get pipeline from cache if we have
+                    self.pipeline = build_info.module.pipeline_cache[hash]
+                    # Get shader table from cache if the pipeline is a raytracing pipeline
+                    if build_info.pipeline_type == PipelineType.ray_tracing:
+                        self.shader_table = build_info.module.shader_table_cache[hash]
+                    self.device = build_info.module.device
+                    self.log_debug(f"  Found cached pipeline with hash {hash}")
 
-            else:
-                # Build new module and link it with the one that contains the function being called.
-                self.log_debug(f"  Building new pipeline with hash {hash}")
-                session = build_info.module.session
-                device = session.device
-                module = session.load_module_from_source(hash, code)
-                opts = SlangLinkOptions()
-                opts.dump_intermediates = _DUMP_SLANG_INTERMEDIATES
-                opts.dump_intermediates_prefix = sanitized
-                if build_info.pipeline_type == PipelineType.compute:
-                    # Create compute pipeline
-                    ep = module.entry_point(f"compute_main", type_conformances)
-                    program = session.link_program(
-                        [module, build_info.module.device_module] + build_info.module.link,
-                        [ep],
-                        opts,
-                    )
-                    self.pipeline = device.create_compute_pipeline(
-                        program,
-                        defer_target_compilation=True,
-                        label=f"{build_info.module.name}_{build_info.name}_compute_call",
-                    )
-                    build_info.module.pipeline_cache[hash] = self.pipeline
-                elif build_info.pipeline_type == PipelineType.ray_tracing:
-                    # Create ray tracing pipeline
-                    eps = [module.entry_point(f"raygen_main", type_conformances)]
-                    hit_group_names: list[str] = []
-                    for hit_group in build_info.ray_tracing_hit_groups:
-                        hit_group_names.append(hit_group.hit_group_name)
-                        if hit_group.closest_hit_entry_point != "":
-                            eps.append(
-                                build_info.module.device_module.entry_point(
-                                    hit_group.closest_hit_entry_point
+                else:
+                    # Build new module and link it with the one that contains the function being called.
+                    self.log_debug(f"  Building new pipeline with hash {hash}")
+                    session = build_info.module.session
+                    device = session.device
+                    if timer:
+                        timer.skip()
+                    module = session.load_module_from_source(hash, code)
+                    opts = SlangLinkOptions()
+                    opts.dump_intermediates = _DUMP_SLANG_INTERMEDIATES
+                    opts.dump_intermediates_prefix = sanitized
+                    if build_info.pipeline_type == PipelineType.compute:
+                        # Create compute pipeline
+                        ep = module.entry_point(f"compute_main", type_conformances)
+                        program = session.link_program(
+                            [module, build_info.module.device_module] + build_info.module.link,
+                            [ep],
+                            opts,
+                        )
+                        if timer:
+                            timer.mark("load_link")
+                        self.pipeline = device.create_compute_pipeline(
+                            program,
+                            defer_target_compilation=True,
+                            label=f"{build_info.module.name}_{build_info.name}_compute_call",
+                        )
+                        build_info.module.pipeline_cache[hash] = self.pipeline
+                        if timer:
+                            timer.mark("pipeline")
+                    elif build_info.pipeline_type == PipelineType.ray_tracing:
+                        # Create ray tracing pipeline
+                        eps = [module.entry_point(f"raygen_main", type_conformances)]
+                        hit_group_names: list[str] = []
+                        for hit_group in build_info.ray_tracing_hit_groups:
+                            hit_group_names.append(hit_group.hit_group_name)
+                            if hit_group.closest_hit_entry_point != "":
+                                eps.append(
+                                    build_info.module.device_module.entry_point(
+                                        hit_group.closest_hit_entry_point
+                                    )
                                 )
-                            )
-                        if hit_group.any_hit_entry_point != "":
-                            eps.append(
-                                build_info.module.device_module.entry_point(
-                                    hit_group.any_hit_entry_point
+                            if hit_group.any_hit_entry_point != "":
+                                eps.append(
+                                    build_info.module.device_module.entry_point(
+                                        hit_group.any_hit_entry_point
+                                    )
                                 )
-                            )
-                        if hit_group.intersection_entry_point != "":
-                            eps.append(
-                                build_info.module.device_module.entry_point(
-                                    hit_group.intersection_entry_point
+                            if hit_group.intersection_entry_point != "":
+                                eps.append(
+                                    build_info.module.device_module.entry_point(
+                                        hit_group.intersection_entry_point
+                                    )
                                 )
+                        for miss_entry_point in build_info.ray_tracing_miss_entry_points:
+                            eps.append(
+                                build_info.module.device_module.entry_point(miss_entry_point)
                             )
-                    for miss_entry_point in build_info.ray_tracing_miss_entry_points:
-                        eps.append(build_info.module.device_module.entry_point(miss_entry_point))
-
-                    program = session.link_program(
-                        [module, build_info.module.device_module] + build_info.module.link,
-                        eps,
-                        opts,
-                    )
-                    self.pipeline = device.create_ray_tracing_pipeline(
-                        program,
-                        hit_groups=build_info.ray_tracing_hit_groups,
-                        max_recursion=build_info.ray_tracing_max_recursion,
-                        max_ray_payload_size=build_info.ray_tracing_max_ray_payload_size,
-                        max_attribute_size=build_info.ray_tracing_max_attribute_size,
-                        flags=build_info.ray_tracing_flags,
-                        defer_target_compilation=True,
-                        label=f"{build_info.module.name}_{build_info.name}_rt_call",
-                    )
-                    build_info.module.pipeline_cache[hash] = self.pipeline
-                    self.shader_table = device.create_shader_table(
-                        program,
-                        ray_gen_entry_points=["raygen_main"],
-                        miss_entry_points=build_info.ray_tracing_miss_entry_points,
-                        hit_group_names=hit_group_names,
-                        callable_entry_points=build_info.ray_tracing_callable_entry_points,
-                    )
-                    build_info.module.shader_table_cache[hash] = self.shader_table
-                else:
-                    raise RuntimeError("Unknown pipeline type")
-                self.device = device
-                self.log_debug(f"  Build succesful")
+
+                        program = session.link_program(
+                            [module, build_info.module.device_module] + build_info.module.link,
+                            eps,
+                            opts,
+                        )
+                        if timer:
+                            timer.mark("load_link")
+                        self.pipeline = device.create_ray_tracing_pipeline(
+                            program,
+                            hit_groups=build_info.ray_tracing_hit_groups,
+                            max_recursion=build_info.ray_tracing_max_recursion,
+                            max_ray_payload_size=build_info.ray_tracing_max_ray_payload_size,
+                            max_attribute_size=build_info.ray_tracing_max_attribute_size,
+                            flags=build_info.ray_tracing_flags,
+                            defer_target_compilation=True,
+                            label=f"{build_info.module.name}_{build_info.name}_rt_call",
+                        )
+                        build_info.module.pipeline_cache[hash] = self.pipeline
+                        self.shader_table = device.create_shader_table(
+                            program,
+                            ray_gen_entry_points=["raygen_main"],
+                            miss_entry_points=build_info.ray_tracing_miss_entry_points,
+                            hit_group_names=hit_group_names,
+                            callable_entry_points=build_info.ray_tracing_callable_entry_points,
+                        )
+                        build_info.module.shader_table_cache[hash] = self.shader_table
+                        if timer:
+                            timer.mark("pipeline")
+                    else:
+                        raise RuntimeError("Unknown pipeline type")
+                    self.device = device
+            self.log_debug(f"  Build succesful")
 
             # Store the bindings and runtime for later use.
             self.debug_only_bindings = bindings
             self.runtime = BoundCallRuntime(bindings)
 
+            build_info.module._record_build(func, *args, **kwargs)
+
         except BoundVariableException as e:
             if bindings is not None:
                 ref = (
@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+from slangpy import CommandEncoder, Device
+from slangpy.core.native import (
+    NativeCallData,
+    NativeCallDataCache,
+    NativeCallRuntimeOptions,
+    SignatureBuilder,
+)
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+
+class GraphInput:
+    """
+    A named, replaceable argument of a captured call graph. Pass it in place of a value
+    to calls made during capture, then supply new values by name to CallGraph.replay.
+    """
+
+    def __init__(self, name: str, value: Any):
+        super().__init__()
+        self.name = name
+        self.value = value
+
+        #: Signature of the value calls were captured with, set once it's used by a call.
+        self.signature: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"GraphInput(name={self.name}, value={self.value})"
+
+
+class _CapturedCall:
+    def __init__(
+        self,
+        call_data: NativeCallData,
+        opts: NativeCallRuntimeOptions,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ):
+        super().__init__()
+        self.call_data = call_data
+        self.opts = opts
+        self.args = args
+        self.kwargs = kwargs
+
+        # Positions of graph inputs, so calls without any can be replayed as recorded.
+        self.input_args = [i for i, x in enumerate(args) if isinstance(x, GraphInput)]
+        self.input_kwargs = [k for k, x in kwargs.items() if isinstance(x, GraphInput)]
+
+    def append_to(self, command_encoder: CommandEncoder):
+        args = self.args
+        kwargs = self.kwargs
+        if self.input_args:
+            args = tuple(_resolve(x) for x in args)
+        if self.input_kwargs:
+            kwargs = kwargs.copy()
+            for k in self.input_kwargs:
+                kwargs[k] = kwargs[k].value
+        self.call_data.append_to(self.opts, command_encoder, *args, **kwargs)
+
+
+def _resolve(value: Any) -> Any:
+    return value.value if isinstance(value, GraphInput) else value
+
+
+def _value_signature(cache: NativeCallDataCache, value: Any) -> str:
+    builder = SignatureBuilder()
+    cache.get_value_signature(builder, value)
+    return builder.str
+
+
+class _CaptureState(threading.local):
+    # Graph being captured by the current thread.
+    graph: Optional["CallGraph"] = None
+
+
+_CAPTURE = _CaptureState()
+
+
+class CallGraph:
+    """
+    A recorded sequence of function calls that can be replayed with a single command
+    encoder and submit. Signatures are built, call data resolved and runtime options
+    gathered once at capture time, so a replay only re-encodes the dispatches.
+
+    Calls made inside a capture block on the capturing thread are recorded rather than
+    dispatched, so any return values must be passed explicitly via ``_result``. Values
+    that change between replays are declared with ``input`` and must keep the signature
+    (type, dtype and dimensionality) they were captured with, as the recorded kernels are
+    reused as-is.
+
+    with module.capture() as graph:
+        x = graph.input("x", initial_tensor)
+        module.step(x, weights, _result=out)
+        module.update(out, _result=weights)
+    graph.replay(x=new_tensor)
+    """
+
+    def __init__(self, device: Device):
+        super().__init__()
+        self.device = device
+        self.inputs: dict[str, GraphInput] = {}
+        self._calls: list[_CapturedCall] = []
+
+        # Cache used to build the signatures of graph inputs.
+        self._signature_cache: Optional[NativeCallDataCache] = None
+
+    @staticmethod
+    def active() -> Optional["CallGraph"]:
+        """
+        Get the graph being captured by the current thread, checked by FunctionNode.call.
+        """
+        return _CAPTURE.graph
+
+    def __enter__(self) -> "CallGraph":
+        if _CAPTURE.graph is not None:
+            raise RuntimeError("Call graph captures cannot be nested")
+        _CAPTURE.graph = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        _CAPTURE.graph = None
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def input(self, name: str, value: Any) -> GraphInput:
+        """
+        Declare a named input to the graph, with the value to capture calls with.
+        """
+        if name in self.inputs:
+            raise ValueError(f"Graph input '{name}' already exists")
+        res = GraphInput(name, value)
+        self.inputs[name] = res
+        return res
+
+    def record(self, function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]):
+        """
+        Resolve the call data for a call and add it to the graph. Called by FunctionNode.call
+        while the graph is being captured.
+        """
+        if "_append_to" in kwargs:
+            raise ValueError("Cannot use _append_to with calls captured in a call graph")
+
+        # Build (or find) call data using the captured values of any graph inputs.
+        values = tuple(_resolve(x) for x in args)
+        kwvalues = {k: _resolve(v) for k, v in kwargs.items()}
+        call_data = function._native_build_call_data(
+            function.module.call_data_cache, *values, **kwvalues
+        )
+        if call_data.device != self.device:
+            raise ValueError("Calls captured in a call graph must all use the graph's device")
+        if call_data.runtime.find_kwarg("_result") is not None and kwvalues.get("_result") is None:
+            raise ValueError(
+                f"Calls captured in a call graph must pass _result explicitly ({function.name})"
+            )
+
+        # Remember the signatures inputs were captured with, to check replaced values against.
+        cache = function.module.call_data_cache
+        for x in list(args) + list(kwargs.values()):
+            if isinstance(x, GraphInput) and x.signature is None:
+                x.signature = _value_signature(cache, x.value)
+        self._signature_cache = cache
+
+        # Runtime options (uniforms, 'this' etc.) are gathered once, as for a normal call.
+        opts = NativeCallRuntimeOptions()
+        function.gather_runtime_options(opts)
+        this = opts._native_this
+        if this is not None:
+            args = (this,) + args
+
+        self._calls.append(_CapturedCall(call_data, opts, args, kwargs))
+
+    def append_to(self, command_encoder: CommandEncoder, **new_values: Any):
+        """
+        Encode all captured calls to a command encoder, optionally replacing graph inputs.
+        """
+        self._set_inputs(new_values)
+        for call in self._calls:
+            call.append_to(command_encoder)
+
+    def replay(self, command_encoder: Optional[CommandEncoder] = None, **new_values: Any):
+        """
+        Replay all captured calls, optionally replacing graph inputs. If no command encoder
+        is provided, the calls are encoded into a single new one and submitted.
+        """
+        if command_encoder is not None:
+            self.append_to(command_encoder, **new_values)
+            return
+        command_encoder = self.device.create_command_encoder()
+        self.append_to(command_encoder, **new_values)
+        self.device.submit_command_buffer(command_encoder.finish())
+
+    def _set_inputs(self, new_values: dict[str, Any]):
+        for name, value in new_values.items():
+            graph_input = self.inputs.get(name)
+            if graph_input is None:
+                raise ValueError(f"Call graph has no input named '{name}'")
+            if type(value) != type(graph_input.value):
+                raise ValueError(
+                    f"Graph input '{name}' was captured as {type(graph_input.value).__name__}, "
+                    f"got {type(value).__name__}"
+                )
+            if graph_input.signature is not None:
+                assert self._signature_cache is not None
+                signature = _value_signature(self._signature_cache, value)
+                if signature != graph_input.signature:
+                    raise ValueError(
+                        f"Graph input '{name}' was captured with signature "
+                        f"{graph_input.signature!r}, got {signature!r}"
+                    )
+        for name, value in new_values.items():
+            self.inputs[name].value = value
@@ -2,7 +2,7 @@
 from typing import TYPE_CHECKING, Any, Optional
 
 from slangpy.core.native import AccessType, CallMode, CallDataMode
-from slangpy.core.function import PipelineType
+from slangpy.core.function import CallOrder, PipelineType
 
 import slangpy.bindings.typeregistry as tr
 from slangpy import ModifierID, TypeReflection
@@ -202,24 +202,62 @@ def is_slangpy_vector(type: Any) -> bool:
     )
 
 
+def constant_literal(name: str, value: Any) -> tuple[str, str]:
+    """
+    Get the Slang type name and literal of a constant value.
+    """
+    if isinstance(value, bool):
+        return "bool", "true" if value else "false"
+    elif isinstance(value, (int, float)):
+        return type(value).__name__, str(value)
+    elif is_slangpy_vector(value):
+        # Cheeky logic to take, eg, {0,0,0} -> float3(0,0,0)
+        tn = type(value).__name__
+        return tn, f"{tn}({str(value)[1:-1]})"
+    else:
+        raise KernelGenException(
+            f"Constant value '{name}' must be an int, float or bool, not {type(value).__name__}"
+        )
+
+
 def generate_constants(build_info: "FunctionBuildInfo", cg: CodeGen):
     if build_info.constants is not None:
         for k, v in build_info.constants.items():
-            if isinstance(v, bool):
-                cg.constants.append_statement(
-                    f"export static const bool {k} = {'true' if v else 'false'}"
-                )
-            elif isinstance(v, (int, float)):
-                cg.constants.append_statement(f"export static const {type(v).__name__} {k} = {v}")
-            elif is_slangpy_vector(v):
-                # Cheeky logic to take, eg, {0,0,0} -> float3(0,0,0)
-                tn = type(v).__name__
-                txt = f"{tn}({str(v)[1:-1]})"
-                cg.constants.append_statement(f"export static const {tn} {k} = {txt}")
-            else:
-                raise KernelGenException(
-                    f"Constant value '{k}' must be an int, float or bool, not {type(v).__name__}"
-                )
+            tn, literal = constant_literal(k, v)
+            cg.constants.append_statement(f"export static const {tn} {k} = {literal}")
+
+
+def generate_specialized_args(
+    build_info: "FunctionBuildInfo", signature: BoundCall, cg: CodeGen
+) -> dict[str, str]:
+    """
+    Declare constants for the argument values a call is specialized on (see
+    FunctionNode.adaptive_constants). Returns the constant for each root variable that
+    loads from one instead of from the call data. Arguments that aren't plain read only
+    values are loaded as usual.
+    """
+    # Integer keys index the positional arguments passed by the caller, which don't
+    # include the instance methods are called on.
+    positional = [x for x in signature.args if x.variable_name != "_this"]
+    res: dict[str, str] = {}
+    for key, value in build_info.specialized_args.items():
+        if isinstance(key, int):
+            variable = positional[key] if key < len(positional) else None
+        else:
+            variable = signature.kwargs.get(key)
+        if (
+            variable is None
+            or variable.children is not None
+            or variable.vector_type is None
+            or variable.access != (AccessType.read, AccessType.none)
+        ):
+            continue
+        tn = variable.vector_type.full_name
+        _, literal = constant_literal(variable.variable_name, value)
+        name = f"_spec_{variable.variable_name}"
+        cg.constants.append_statement(f"static const {tn} {name} = {tn}({literal})")
+        res[variable.variable_name] = name
+    return res
 
 
 def generate_code(
@@ -323,6 +361,25 @@ def generate_code(
     cg.constants.dec_indent()
     cg.constants.append_statement("}")
 
+    # The order threads visit the innermost dimensions of the call shape, also read by
+    # init_thread_local_call_shape_info.
+    call_order, call_order_dims, call_order_tile = CallOrder.row_major, 2, 1
+    if build_info.call_order is not None:
+        call_order, call_order_dims, call_order_tile = build_info.call_order
+        if call_order_dims > call_data_len:
+            raise KernelGenException(
+                f"call_order over {call_order_dims} dimensions requires a call shape with at "
+                f"least {call_order_dims} dimensions, but the call has {call_data_len}."
+            )
+        if build_info.indirect or build_info.gather:
+            raise KernelGenException(
+                "call_order cannot be combined with indirect or gather calls, which index "
+                "the call shape in row major order."
+            )
+    cg.constants.append_statement(f"export static const int call_order = {call_order.value}")
+    cg.constants.append_statement(f"export static const int call_order_dims = {call_order_dims}")
+    cg.constants.append_statement(f"export static const int call_order_tile = {call_order_tile}")
+
     # Generate call data inputs if vector call
     if call_data_len > 0:
         # A group can be thought of as a "window" looking at a
@@ -340,6 +397,25 @@ def generate_code(
 
     cg.call_data.append_statement(f"uint3 _thread_count")
 
+    # Indirect calls read the outermost dimension of the call shape from a device buffer.
+    if build_info.indirect:
+        if call_data_len == 0:
+            raise ValueError("Indirect calls require a vectorized call shape")
+        if build_info.pipeline_type != PipelineType.compute:
+            raise ValueError("Indirect calls are only supported by compute pipelines")
+        cg.call_data.append_statement(f"StructuredBuffer<uint> _indirect_count")
+        cg.call_data.append_statement(f"uint _indirect_offset")
+
+    # Gather calls run a thread per entry of an index list, mapped to the call shape.
+    if build_info.gather:
+        if call_data_len == 0:
+            raise ValueError("Gather calls require a vectorized call shape")
+        if build_info.pipeline_type != PipelineType.compute:
+            raise ValueError("Gather calls are only supported by compute pipelines")
+        cg.call_data.append_statement(f"StructuredBuffer<uint> _gather_indices")
+        cg.call_data.append_statement(f"uint _gather_offset")
+        cg.call_data.append_statement(f"uint _gather_count")
+
     # Generate call data definitions for all inputs to the kernel
     for node in signature.values():
         node.gen_call_data_code(cg, context)
@@ -347,6 +423,9 @@ def generate_code(
     # Get sorted list of root parameters for trampoline function
     root_params = sorted(signature.values(), key=lambda x: x.param_index)
 
+    # Arguments the call is specialized on are loaded from constants instead.
+    specialized_args = generate_specialized_args(build_info, signature, cg)
+
     # Generate the trampoline function
     trampoline_fn = "_trampoline"
     if context.call_mode != CallMode.prim:
@@ -366,7 +445,11 @@ def generate_code(
         assert x.vector_type is not None
         cg.trampoline.declare(x.vector_type.full_name, x.variable_name)
     for x in root_params:
-        if x.access[0] == AccessType.read or x.access[0] == AccessType.readwrite:
+        if x.variable_name in specialized_args:
+            cg.trampoline.append_statement(
+                f"{x.variable_name} = {specialized_args[x.variable_name]}"
+            )
+        elif x.access[0] == AccessType.read or x.access[0] == AccessType.readwrite:
             if is_entry_point:
                 data_name = (
                     f"_param_{x.variable_name}"
@@ -440,6 +523,14 @@ def generate_code(
         cg.kernel.append_line('[shader("compute")]')
         if call_group_size != 1:
             cg.kernel.append_line(f"[numthreads({call_group_size}, 1, 1)]")
+        elif (
+            build_info.thread_group_size is not None
+            and build_info.thread_group_size.y == 1
+            and build_info.thread_group_size.z == 1
+        ):
+            # Calls are dispatched as a flat list of threads, so only a 1D thread group size
+            # applies. Others are meant for raw dispatches and are ignored, as they always were.
+            cg.kernel.append_line(f"[numthreads({build_info.thread_group_size.x}, 1, 1)]")
         else:
             cg.kernel.append_line("[numthreads(32, 1, 1)]")
         # Note: While flat_call_thread_id is 3-dimensional, we consider it "flat" and 1-dimensional because of the
@@ -466,6 +557,21 @@ def generate_code(
     if build_info.pipeline_type == PipelineType.ray_tracing:
         cg.kernel.append_statement("int3 flat_call_thread_id = DispatchRaysIndex();")
 
+    # Map the thread to the flat index of its element of the call shape, which is then
+    # checked against the thread count like any other thread. An indirect count limits
+    # the number of indices used.
+    if build_info.gather:
+        cg.kernel.append_statement(
+            "if (uint(flat_call_thread_id.x) >= call_data._gather_count) return"
+        )
+        if build_info.indirect:
+            cg.kernel.append_statement(
+                "if (uint(flat_call_thread_id.x) >= call_data._indirect_count[call_data._indirect_offset]) return"
+            )
+        cg.kernel.append_statement(
+            "flat_call_thread_id = int3(int(call_data._gather_indices[call_data._gather_offset + flat_call_thread_id.x]), 0, 0)"
+        )
+
     cg.kernel.append_statement("if (any(flat_call_thread_id >= call_data._thread_count)) return")
 
     # Loads / initializes call id
@@ -492,6 +598,11 @@ def generate_code(
             )
         context_args += ", CallShapeInfo::get_call_id().shape"
 
+    if build_info.indirect and not build_info.gather:
+        cg.kernel.append_statement(
+            "if (CallShapeInfo::get_call_id().shape[0] >= int(call_data._indirect_count[call_data._indirect_offset])) return"
+        )
+
     cg.kernel.append_statement(f"Context __slangpy_context__ = {{{context_args}}}")
 
     # Call the trampoline function
@@ -1,11 +1,22 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union, cast, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+    Protocol,
+    Union,
+    cast,
+    Sequence,
+)
 from enum import Enum
 
 from slangpy.core.native import (
     CallMode,
     SignatureBuilder,
     NativeCallRuntimeOptions,
+    NativeCompiledCall,
     NativeFunctionNode,
     FunctionNodeType,
 )
@@ -23,9 +34,17 @@ from slangpy import (
 )
 from slangpy.slangpy import Shape
 from slangpy.bindings.typeregistry import PYTHON_SIGNATURES
+from slangpy.core.callgraph import CallGraph
+from slangpy.core import lazy, profiling
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from slangpy.core.adaptive import AdaptiveConstants
+    from slangpy.core.autotune import AutotuneConfig
+    from slangpy.core.batch import TCallArgs
+    from slangpy.core.stream import StreamingCall
     from slangpy.core.calldata import CallData
+    from slangpy.core.warmup import TCallSpec
     from slangpy.core.module import Module
     from slangpy.core.struct import Struct
     from slangpy import HitGroupDescParam
@@ -55,6 +74,22 @@ class PipelineType(Enum):
     ray_tracing = 1
 
 
+class CallOrder(Enum):
+    """
+    Order in which the threads of a vectorized call visit the innermost dimensions of
+    the call shape (or, with a call group shape, of the grid of call groups).
+    """
+
+    #: Row major order, the default.
+    row_major = 0
+    #: Row major order within square tiles, visited in row major order.
+    tiled = 1
+    #: Morton (Z) order within tiles.
+    morton = 2
+    #: Hilbert curve order within tiles (2 dimensions only).
+    hilbert = 3
+
+
 class FunctionBuildInfo:
     def __init__(self) -> None:
         super().__init__()
@@ -76,6 +111,11 @@ class FunctionBuildInfo:
         self.return_type: Optional[Union[type, str]] = None
         self.logger: Optional[Logger] = None
         self.call_group_shape: Optional[Shape] = None
+        self.call_order: Optional[tuple[CallOrder, int, int]] = None
+        self.specialized_args: dict[Union[int, str], Any] = {}
+        self.adaptive: Optional["AdaptiveConstants"] = None
+        self.indirect: bool = False
+        self.gather: bool = False
         self.pipeline_type: PipelineType = PipelineType.compute
         self.ray_tracing_hit_groups: list[HitGroupDesc] = []
         self.ray_tracing_miss_entry_points: list[str] = []
@@ -87,6 +127,8 @@ class FunctionBuildInfo:
 
 
 class FunctionNode(NativeFunctionNode):
+    _build_info: Optional[FunctionBuildInfo] = None
+
     @property
     def root(self):
         """
@@ -231,11 +273,52 @@ class FunctionNode(NativeFunctionNode):
 
     def thread_group_size(self, thread_group_size: uint3):
         """
-        Override the default thread group size for the function. Currently only used for
-        raw dispatch.
+        Override the default thread group size for the function. Used for raw dispatch and
+        for vectorized calls without a call group shape. Vectorized calls dispatch their
+        threads as a flat list, so only use sizes of the form uint3(x, 1, 1) and ignore others.
         """
         return FunctionNodeThreadGroupSize(self, thread_group_size)
 
+    def indirect(self, count: Any, offset: int = 0):
+        """
+        Take the outermost dimension of the call shape from a uint on the device, such as the
+        count returned by spy.primitives.compact, so the call can follow a GPU step that
+        decides how many elements to process without reading it back. count is a Buffer
+        (offset is the index of the uint in it) or a 1 element uint NDBuffer/Tensor.
+
+        The call shape is still calculated from the arguments and acts as the capacity: the
+        kernel is dispatched indirectly for min(count, capacity) rows, and skips elements
+        beyond the count. Results allocated by the call have the full capacity shape.
+        """
+        return FunctionNodeIndirect(self, count, offset)
+
+    def gather(self, indices: Any, count: Any = None):
+        """
+        Run the call only for the elements of the call shape listed in indices, a uint
+        Buffer, NDBuffer or Tensor of flat (row major) indices into the call shape. One
+        thread is dispatched per index, and arguments such as NDBuffers and Tensors read and
+        write the element each index maps to. Elements that are not listed are untouched,
+        so results allocated by the call are undefined there: pass _result to keep them.
+
+        If count is given, it is a 1 element uint buffer on the device limiting how many
+        of the indices are used, as returned by spy.primitives.nonzero.
+        """
+        node = FunctionNodeGather(self, indices)
+        if count is not None:
+            return node.indirect(count)
+        return node
+
+    def where(self, mask: Any):
+        """
+        Run the call only for the elements of the call shape whose element of mask, a
+        contiguous NDBuffer or Tensor with one element per call shape element, is non
+        zero. The selected indices are found on the device when where is called, so a
+        node returned by where does not follow later changes to the mask. See gather.
+        """
+        from slangpy.primitives import nonzero
+
+        return self.gather(*nonzero(mask))
+
     def as_func(self) -> "FunctionNode":
         """
         Typing helper to cast the function to a function (i.e. a no-op)
@@ -257,6 +340,54 @@ class FunctionNode(NativeFunctionNode):
             self._native_build_call_data(self.module.call_data_cache, *args, **kwargs),
         )
 
+    def precompile(
+        self, signatures: Sequence["TCallSpec"], compile_targets: bool = True
+    ) -> list["CallData"]:
+        """
+        Generate and compile kernels ahead of time for a list of call descriptions, so the
+        first real call does not pay the code generation and compilation cost. Each description
+        is a CallSpec, a list of positional arguments or a dictionary of keyword arguments,
+        made up of ArgSpecs (abstract descriptions such as dtype and ndim) and/or example values.
+
+        myfunc.precompile([[ArgSpec(Tensor, dtype="float", ndim=2), 1.0]])
+        """
+        from slangpy.core.warmup import precompile
+
+        return precompile(self, signatures, compile_targets)
+
+    def compile_async(self, *args: Any, **kwargs: Any) -> "Future[CallData]":
+        """
+        Generate and compile the kernel for a set of arguments on a background thread, returning
+        a future that resolves to the call data. Arguments may be real values or ArgSpecs. Once
+        complete, calls with matching arguments hit the call data cache.
+
+        future = myfunc.compile_async(ArgSpec(Tensor, dtype="float", ndim=2), 1.0)
+        """
+        from slangpy.core.warmup import compile_async
+
+        return compile_async(self, *args, **kwargs)
+
+    def compile(self, *args: Any, **kwargs: Any) -> NativeCompiledCall:
+        """
+        Resolve the function for a set of example arguments, returning a callable bound to
+        their types. The kernel, function chain (map/set/constants etc.) and runtime options
+        are resolved once, so each call goes straight to dispatch without the per call
+        argument handling and cache lookups. Calls with different argument types raise a
+        TypeError rather than generating a new kernel. Uniforms set on the chain are still
+        read on every call.
+
+        handle = myfunc.compile(a, b, _result=res)
+        for i in range(1000):
+            handle(a, b, _result=res)
+        """
+        resval = kwargs.get("_result", None)
+        if isinstance(resval, (type, str)):
+            del kwargs["_result"]
+            return self.return_type(resval).compile(*args, **kwargs)
+        if "_append_to" in kwargs:
+            raise ValueError("Compiled calls are appended with append_to, not _append_to")
+        return NativeCompiledCall(self, self.module.call_data_cache, args, kwargs)
+
     def call(self, *args: Any, **kwargs: Any) -> Any:
         """
         Call the function with a given set of arguments. This will generate and compile
@@ -270,6 +401,17 @@ class FunctionNode(NativeFunctionNode):
             del kwargs["_result"]
             return self.return_type(resval).call(*args, **kwargs)
 
+        # If a call graph is being captured, record the call rather than dispatching it.
+        graph = CallGraph.active()
+        if graph is not None:
+            return graph.record(self, args, kwargs)
+
+        # In lazy mode, calls are deferred so chains of them can be fused. Outside it, any
+        # deferred values passed as arguments are evaluated as they're unpacked.
+        lazy_context = lazy.LazyContext.active()
+        if lazy_context is not None:
+            return lazy_context.record(self, args, kwargs)
+
         # Handle specifying a command encoder to append to, rather than using the func.append_to
         # syntax.
         if "_append_to" in kwargs:
@@ -282,7 +424,16 @@ class FunctionNode(NativeFunctionNode):
                     )
                 return self.append_to(app_to, *args, **kwargs)
 
+        # Adaptive nodes may redirect the call to a variant specialized on its arguments.
+        adaptive = self.calc_build_info().adaptive
+        if adaptive is not None:
+            variant = adaptive.select(self, args, kwargs)
+            if variant is not None:
+                return variant.call(*args, **kwargs)
+
         try:
+            if profiling.ENABLED:
+                return profiling.profiled_call(self, args, kwargs)
             return self._native_call(self.module.call_data_cache, *args, **kwargs)
         except ValueError as e:
             # If runtime returned useful information, reformat it and raise a new exception
@@ -319,8 +470,50 @@ class FunctionNode(NativeFunctionNode):
         this will generate and compile a new kernel if need be. However the dispatch
         is just added to the command list and no results are returned.
         """
+        adaptive = self.calc_build_info().adaptive
+        if adaptive is not None:
+            variant = adaptive.select(self, args, kwargs)
+            if variant is not None:
+                return variant.append_to(command_encoder, *args, **kwargs)
         self._native_append_to(self.module.call_data_cache, command_encoder, *args, **kwargs)
 
+    def call_many(self, calls: Iterable["TCallArgs"]) -> list[Any]:
+        """
+        Call the function once per set of arguments, with all dispatches encoded into a
+        single command encoder and submitted together. Each set of arguments is either a
+        dictionary of keyword arguments or a list of positional arguments. Returns a list
+        of the results of each call.
+
+        results = myfunc.call_many([{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+        """
+        from slangpy.core.batch import call_many
+
+        return call_many(self, calls)
+
+    def map_calls(self, *iterables: Iterable[Any]) -> list[Any]:
+        """
+        Call the function once per element of the given iterables of positional arguments,
+        in the same way as the built in map, submitting all dispatches together.
+
+        results = myfunc.map_calls([1, 3], [2, 4])
+        """
+        from slangpy.core.batch import map_calls
+
+        return map_calls(self, *iterables)
+
+    def stream(self, chunk: int, depth: int = 2) -> "StreamingCall":
+        """
+        Get a callable that runs the function over numpy arrays (e.g. memmaps) in chunks of
+        the outermost dimension, with up to depth chunks in flight so uploads, dispatches and
+        read backs overlap. Results are written to _result if given, otherwise returned as a
+        generator of result chunks.
+
+        myfunc.stream(chunk=1 << 20)(big_array, 2.0, _result=out_memmap)
+        """
+        from slangpy.core.stream import StreamingCall
+
+        return StreamingCall(self, chunk, depth)
+
     def dispatch(
         self,
         thread_count: uint3,
@@ -334,6 +527,16 @@ class FunctionNode(NativeFunctionNode):
         as a kernel entry point directly.
         """
         if ENABLE_CALLDATA_CACHE:
+            # Repeat dispatches with the same argument types reuse the node's last dispatch
+            # data without building a signature.
+            cache = self.module.call_data_cache
+            dispatch_data = self._native_find_dispatch_data(cache, kwargs)
+            if dispatch_data is not None:
+                opts = NativeCallRuntimeOptions()
+                self.gather_runtime_options(opts)
+                dispatch_data.dispatch(opts, thread_count, vars, command_encoder, **kwargs)
+                return
+
             if self.slangpy_signature == "":
                 build_info = self.calc_build_info()
                 lines = []
@@ -353,7 +556,7 @@ class FunctionNode(NativeFunctionNode):
                 self.slangpy_signature = "\n".join(lines)
 
             builder = SignatureBuilder()
-            self.module.call_data_cache.get_args_signature(builder, self, **kwargs)
+            cache.get_args_signature(builder, self, **kwargs)
             sig = builder.str
 
             if sig in self.module.dispatch_data_cache:
@@ -365,6 +568,7 @@ class FunctionNode(NativeFunctionNode):
 
                 dispatch_data = DispatchData(self, **kwargs)
                 self.module.dispatch_data_cache[sig] = dispatch_data
+            self._native_set_dispatch_data(cache, dispatch_data, kwargs)
         else:
             from slangpy.core.dispatchdata import DispatchData
 
@@ -375,9 +579,15 @@ class FunctionNode(NativeFunctionNode):
         dispatch_data.dispatch(opts, thread_count, vars, command_encoder, **kwargs)
 
     def calc_build_info(self):
-        info = FunctionBuildInfo()
-        self._populate_build_info_recurse(info)
-        return info
+        """
+        Get the build info for the function chain. Nodes are immutable once created, so it
+        is only calculated once per node, and the result is shared so must not be modified.
+        """
+        if self._build_info is None:
+            info = FunctionBuildInfo()
+            self._populate_build_info_recurse(info)
+            self._build_info = info
+        return self._build_info
 
     def _populate_build_info_recurse(self, info: FunctionBuildInfo):
         if self._native_parent is not None:
@@ -414,6 +624,54 @@ class FunctionNode(NativeFunctionNode):
         """
         return FunctionNodeCallGroupShape(self, call_group_shape)
 
+    def specialize_args(self, values: dict[Union[int, str], Any]):
+        """
+        Bake the values of scalar or vector arguments into the kernel as constants. values
+        maps the index of each positional argument, or the name of each keyword argument,
+        to its value. Calls must pass the same values for those arguments.
+        """
+        return FunctionNodeSpecializeArgs(self, values)
+
+    def adaptive_constants(self, threshold: int = 16, max_variants: int = 4):
+        """
+        Specialize calls on the values of scalar and vector arguments that don't change.
+        Once a set of arguments has had the same values for threshold calls in a row, a
+        kernel with those values baked in as constants is generated (see specialize_args)
+        and used by every later call with the same values. Calls with other values use the
+        generic kernel. At most max_variants specialized kernels are generated, so arguments
+        that keep changing don't cause a compile per value.
+        """
+        return FunctionNodeAdaptiveConstants(self, threshold, max_variants)
+
+    def call_order(
+        self, order: Union[CallOrder, str], dims: int = 2, tile_size: Optional[int] = None
+    ):
+        """
+        Specify the order in which threads visit the innermost dims (2 or 3) dimensions of
+        the call shape, or of the grid of call groups if a call group shape is set. Those
+        dimensions are split into tiles of tile_size along each axis (a power of 2, by
+        default 16 in 2D and 8 in 3D), and threads visit each tile in the given order, which
+        keeps neighbouring elements close in time for kernels that read their neighbours.
+        """
+        return FunctionNodeCallOrder(self, order, dims, tile_size)
+
+    def autotune(
+        self,
+        *args: Any,
+        candidates: Optional[Sequence["AutotuneConfig"]] = None,
+        iterations: int = 10,
+        **kwargs: Any,
+    ) -> "AutotuneConfig":
+        """
+        Benchmark calls with the given arguments under candidate thread group sizes and call
+        group shapes, and store the fastest for the device's adapter so later calls with the
+        same signature use it automatically. Set spy.set_autotune_path (or the
+        SLANGPY_AUTOTUNE_PATH environment variable) to keep results between processes.
+        """
+        from slangpy.core.autotune import autotune
+
+        return autotune(self, *args, candidates=candidates, iterations=iterations, **kwargs)
+
 
 class FunctionNodeBind(FunctionNode):
     def __init__(self, parent: NativeFunctionNode, this: IThis) -> None:
@@ -603,6 +861,93 @@ class FunctionNodeCallGroupShape(FunctionNode):
         info.call_group_shape = self.call_group_shape
 
 
+class FunctionNodeSpecializeArgs(FunctionNode):
+    def __init__(self, parent: NativeFunctionNode, values: dict[Union[int, str], Any]) -> None:
+        super().__init__(parent, FunctionNodeType.kernelgen, dict(values))
+        # Types are part of the signature so, eg, 1 and 1.0 don't share a kernel.
+        self.slangpy_signature = "specialize:" + str(
+            sorted((str(k), type(v).__name__, str(v)) for k, v in values.items())
+        )
+
+    @property
+    def specialized_args(self):
+        return cast(dict[Union[int, str], Any], self._native_data)
+
+    def _populate_build_info(self, info: FunctionBuildInfo):
+        info.specialized_args = {**info.specialized_args, **self.specialized_args}
+        # Specialized variants are called directly rather than through an adaptive node.
+        info.adaptive = None
+
+
+class FunctionNodeAdaptiveConstants(FunctionNode):
+    def __init__(self, parent: NativeFunctionNode, threshold: int, max_variants: int) -> None:
+        from slangpy.core.adaptive import AdaptiveConstants
+
+        super().__init__(parent, FunctionNodeType.kernelgen, None)
+        self.adaptive = AdaptiveConstants(self, threshold, max_variants)
+
+    def _populate_build_info(self, info: FunctionBuildInfo):
+        info.adaptive = self.adaptive
+
+
+class FunctionNodeCallOrder(FunctionNode):
+    def __init__(
+        self,
+        parent: NativeFunctionNode,
+        order: Union[CallOrder, str],
+        dims: int,
+        tile_size: Optional[int],
+    ) -> None:
+        if isinstance(order, str):
+            if order not in CallOrder.__members__:
+                raise ValueError(f"Unknown call order '{order}'")
+            order = CallOrder[order]
+        if dims not in (2, 3):
+            raise ValueError(f"Call orders apply to 2 or 3 dimensions, got {dims}")
+        if order == CallOrder.hilbert and dims != 2:
+            raise ValueError("Hilbert call order only supports 2 dimensions")
+        if tile_size is None:
+            tile_size = 16 if dims == 2 else 8
+        if tile_size < 2 or tile_size & (tile_size - 1) != 0 or tile_size > 1024:
+            raise ValueError(
+                f"Call order tile size must be a power of 2 up to 1024, got {tile_size}"
+            )
+        call_order = (order, dims, tile_size)
+        super().__init__(parent, FunctionNodeType.kernelgen, call_order)
+        self.slangpy_signature = str(call_order)
+
+    @property
+    def call_order(self):
+        return cast(tuple[CallOrder, int, int], self._native_data)
+
+    def _populate_build_info(self, info: FunctionBuildInfo):
+        info.call_order = self.call_order
+
+
+class FunctionNodeIndirect(FunctionNode):
+    def __init__(self, parent: NativeFunctionNode, count: Any, offset: int) -> None:
+        from slangpy.core.indirect import create_indirect_args
+
+        super().__init__(
+            parent, FunctionNodeType.indirect, create_indirect_args(parent, count, offset)
+        )
+        self.slangpy_signature = "indirect"
+
+    def _populate_build_info(self, info: FunctionBuildInfo):
+        info.indirect = True
+
+
+class FunctionNodeGather(FunctionNode):
+    def __init__(self, parent: NativeFunctionNode, indices: Any) -> None:
+        from slangpy.core.indirect import create_gather_indices
+
+        super().__init__(parent, FunctionNodeType.gather, create_gather_indices(indices))
+        self.slangpy_signature = "gather"
+
+    def _populate_build_info(self, info: FunctionBuildInfo):
+        info.gather = True
+
+
 class Function(FunctionNode):
     def __init__(
         self,
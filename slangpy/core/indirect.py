@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Support for indirect calls (see FunctionNode.indirect), whose outermost call dimension is
+read from a count on the device. Before each dispatch a single thread kernel converts the
+count to thread group counts in an argument buffer, which the call is then dispatched
+from, so no host read back is needed.
+
+Gather calls (see FunctionNode.gather) run for a list of indices on the device instead,
+and may be combined with an indirect count of the indices.
+"""
+from typing import TYPE_CHECKING, Any
+
+from slangpy import Buffer, BufferUsage
+from slangpy.core.native import NativeNDBuffer, NativeTensor
+from slangpy.primitives.kernels import check_contiguous, get_kernels
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+_ARGS_SOURCE = """
+[shader("compute")]
+[numthreads(1, 1, 1)]
+void indirect_args(
+    uniform StructuredBuffer<uint> count,
+    uniform uint count_index,
+    uniform uint capacity,
+    uniform uint inner_threads,
+    uniform uint group_size,
+    uniform RWStructuredBuffer<uint> args)
+{
+    uint threads = min(count[count_index], capacity) * inner_threads;
+    args[0] = (threads + group_size - 1) / group_size;
+    args[1] = 1;
+    args[2] = 1;
+}
+"""
+
+
+def create_indirect_args(function: "FunctionNode", count: Any, offset: int) -> tuple[Any, ...]:
+    """
+    Get the native data of an indirect function node: the count buffer, the index of the
+    count in it, the kernel that writes dispatch arguments and the buffer they go in.
+    """
+    if isinstance(count, (NativeNDBuffer, NativeTensor)):
+        if count.dtype.full_name not in ("uint", "int"):
+            raise ValueError(f"Indirect counts must be uints, got {count.dtype.full_name}")
+        offset += count.offset
+        count = count.storage
+    if not isinstance(count, Buffer):
+        raise ValueError(
+            f"Indirect counts must be in a Buffer, NDBuffer or Tensor, got {type(count)}"
+        )
+    if offset < 0 or (offset + 1) * 4 > count.size:
+        raise ValueError(f"Indirect count offset {offset} is out of range of the buffer")
+
+    device = function.module.device
+    kernel = get_kernels(device, _ARGS_SOURCE, ("indirect_args",))["indirect_args"]
+    args = device.create_buffer(
+        element_count=3,
+        struct_size=4,
+        usage=BufferUsage.indirect_argument
+        | BufferUsage.shader_resource
+        | BufferUsage.unordered_access,
+    )
+    return (count, offset, kernel, args)
+
+
+def create_gather_indices(indices: Any) -> tuple[Any, ...]:
+    """
+    Get the native data of a gather function node: the index buffer, the index of the
+    first entry in it and the number of entries.
+    """
+    offset = 0
+    if isinstance(indices, (NativeNDBuffer, NativeTensor)):
+        if indices.dtype.full_name not in ("uint", "int"):
+            raise ValueError(f"Gather indices must be uints, got {indices.dtype.full_name}")
+        count = check_contiguous(indices, "Gather indices")
+        offset = indices.offset
+        indices = indices.storage
+    elif isinstance(indices, Buffer):
+        count = indices.size // 4
+    else:
+        raise ValueError(
+            f"Gather indices must be in a Buffer, NDBuffer or Tensor, got {type(indices)}"
+        )
+    return (indices, offset, count)
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from slangpy import SGL_VERSION
+
+if TYPE_CHECKING:
+    from slangpy.core.module import Module
+
+# Bump whenever the format of the cache entries or the kernel generator changes
+# in a way that would make previously generated code invalid.
+KERNEL_CACHE_VERSION = 2
+
+
+class KernelCache:
+    """
+    Persistent on-disk cache mapping a call signature to the Slang code generated for it.
+
+    Entries are keyed by the full call signature together with a fingerprint of the
+    module (name, device type, linked modules and the source of each, including the
+    files they import), so a warm process can skip kernel generation entirely. The
+    compiled binaries for the resulting programs are cached separately by the device's
+    ``shader_cache_path``, so pairing the two removes both code generation and
+    downstream compilation from the cold path.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]):
+        super().__init__()
+        self.path = Path(path).absolute()
+        self.hits = 0
+        self.misses = 0
+
+    def module_fingerprint(self, module: "Module") -> str:
+        """
+        Calculate a fingerprint that identifies a module and the state of its sources.
+        """
+        lines = [
+            f"version:{KERNEL_CACHE_VERSION}:{SGL_VERSION}",
+            f"device:{module.device.info.type}",
+        ]
+        for slang_module in [module.slangpy_device_module, module.device_module] + module.link:
+            lines.append(f"module:{slang_module.name}")
+            source = slang_module.source
+            if source is not None:
+                lines.append(f"source:{hashlib.sha256(source.encode()).hexdigest()}")
+            for path in sorted(str(x) for x in slang_module.dependency_file_paths):
+                if os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        lines.append(f"file:{path}:{hashlib.sha256(f.read()).hexdigest()}")
+        return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+    def _entry_path(self, module: "Module", signature: str) -> Path:
+        # The fingerprint is calculated once per module, and reset when it's hot reloaded.
+        fingerprint = module._fingerprints.get("kernel_cache")
+        if fingerprint is None:
+            fingerprint = self.module_fingerprint(module)
+            module._fingerprints["kernel_cache"] = fingerprint
+        key = hashlib.sha256((fingerprint + "\n" + signature).encode()).hexdigest()
+        return self.path / key[0:2] / f"{key}.json"
+
+    def load(self, module: "Module", signature: str) -> Optional[tuple[str, str]]:
+        """
+        Load the code hash and generated code for a signature, or None if not cached.
+        """
+        path = self._entry_path(module, signature)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            res = (entry["hash"], entry["code"])
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return res
+
+    def store(self, module: "Module", signature: str, hash: str, code: str):
+        """
+        Store the code hash and generated code for a signature. Writes are atomic, so
+        multiple processes may safely share a cache directory.
+        """
+        path = self._entry_path(module, signature)
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"hash": hash, "code": code}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Failing to write the cache should never break a call.
+            pass
+
+    def clear(self):
+        """
+        Remove all entries from the cache directory.
+        """
+        if not self.path.exists():
+            return
+        for entry in self.path.glob("*/*.json"):
+            entry.unlink(missing_ok=True)
+
+
+_KERNEL_CACHE: Optional[KernelCache] = None
+if os.environ.get("SLANGPY_KERNEL_CACHE_PATH"):
+    _KERNEL_CACHE = KernelCache(os.environ["SLANGPY_KERNEL_CACHE_PATH"])
+
+
+def set_kernel_cache_path(path: Optional[Union[str, os.PathLike[str]]]):
+    """
+    Enable the persistent kernel generation cache in the given directory, or disable it
+    if None. Can also be controlled via the SLANGPY_KERNEL_CACHE_PATH environment variable.
+    For best results, also create the device with a ``shader_cache_path`` so compiled
+    programs are cached too.
+    """
+    global _KERNEL_CACHE
+    _KERNEL_CACHE = KernelCache(path) if path is not None else None
+
+
+def get_kernel_cache() -> Optional[KernelCache]:
+    """
+    Get the active persistent kernel cache, or None if disabled.
+    """
+    return _KERNEL_CACHE
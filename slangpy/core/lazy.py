@@ -0,0 +1,312 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Lazy execution of chains of elementwise calls. Inside a ``spy.lazy()`` block, calls to
+plain module functions return deferred LazyValues rather than dispatching. When a value
+is evaluated, the chain of calls that produces it is fused into a single generated
+function, so only one kernel is dispatched and no intermediate buffers are written.
+
+with spy.lazy():
+    a = module.f(x)
+    b = module.g(a, y)
+    c = module.h(b)
+result = c.eval()
+
+Deferred calls read their inputs when evaluated, not when made. LazyValues passed to
+normal calls, including ones appended to a command encoder, are evaluated automatically.
+"""
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+from slangpy import Device
+from slangpy.reflection.reflectiontypes import IOType
+
+if TYPE_CHECKING:
+    from slangpy.core.function import Function, FunctionNode
+    from slangpy.core.module import Module
+
+
+class _LazyState(threading.local):
+    # Lazy context active on the current thread.
+    context: Optional["LazyContext"] = None
+
+
+_STATE = _LazyState()
+
+_FUSED_FUNCTION_NAME = "slangpy_fused"
+
+#: Maximum number of fused modules kept, least recently used first out.
+_MAX_FUSED_MODULES = 64
+
+# (device, generated source) -> fused module, or None if it failed to compile.
+_fused_modules: OrderedDict[tuple[Device, str], Optional["Module"]] = OrderedDict()
+
+# Devices whose close callback removes their fused modules.
+_registered_devices: "weakref.WeakSet[Device]" = weakref.WeakSet()
+
+
+class LazyValue:
+    """
+    Deferred result of a call made in lazy mode. Call eval to get the actual value.
+    """
+
+    def __init__(self, function: "Function", values: list[Any]):
+        super().__init__()
+        self.function = function
+        #: Argument for each parameter of the function, in order.
+        self.values = values
+        self._evaluated = False
+        self._result: Any = None
+
+    @property
+    def is_evaluated(self) -> bool:
+        return self._evaluated
+
+    def eval(self) -> Any:
+        """
+        Evaluate the value, dispatching a single fused kernel for the chain of deferred
+        calls it depends on. The result is kept, so later evaluations return it directly.
+        """
+        if not self._evaluated:
+            _evaluate(self)
+        return self._result
+
+    def get_this(self) -> Any:
+        # Arguments are unpacked through get_this, so values passed to any call are
+        # evaluated before it's resolved or dispatched.
+        return self.eval()
+
+    def _set_result(self, result: Any):
+        self._result = result
+        self._evaluated = True
+
+    def __repr__(self) -> str:
+        state = "evaluated" if self._evaluated else "pending"
+        return f"LazyValue(function={self.function.name}, {state})"
+
+
+class LazyContext:
+    """
+    Context in which calls to plain module functions are deferred. See lazy.
+    """
+
+    @staticmethod
+    def active() -> Optional["LazyContext"]:
+        """
+        Get the lazy context active on the current thread, checked by FunctionNode.call.
+        """
+        return _STATE.context
+
+    def __enter__(self) -> "LazyContext":
+        if _STATE.context is not None:
+            raise RuntimeError("Lazy contexts cannot be nested")
+        _STATE.context = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        _STATE.context = None
+
+    def record(self, function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]):
+        """
+        Defer a call if it can be fused, otherwise make it immediately. Called by
+        FunctionNode.call while the context is active.
+        """
+        values = _bind_parameters(function, args, kwargs)
+        if values is None:
+            args, kwargs = resolve(args, kwargs)
+            return _call_now(function, args, kwargs)
+        return LazyValue(cast("Function", function), values)
+
+
+def lazy() -> LazyContext:
+    """
+    Get a context in which calls to module functions are deferred and fused on evaluation.
+    """
+    return LazyContext()
+
+
+def resolve(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """
+    Evaluate any LazyValues in a set of call arguments.
+    """
+    if any(isinstance(x, LazyValue) for x in args):
+        args = tuple(x.eval() if isinstance(x, LazyValue) else x for x in args)
+    if any(isinstance(x, LazyValue) for x in kwargs.values()):
+        kwargs = {k: v.eval() if isinstance(v, LazyValue) else v for k, v in kwargs.items()}
+    return args, kwargs
+
+
+def _bind_parameters(
+    function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Optional[list[Any]]:
+    # Only plain free functions with a single signature, a return value and input-only
+    # parameters can be fused. Anything else (methods, mappings, _result etc.) runs as normal.
+    from slangpy.core.function import Function
+
+    if type(function) is not Function or function._this_type is not None:
+        return None
+    slang_func = function._slang_func
+    if slang_func.is_overloaded or not slang_func.have_return_value:
+        return None
+    params = slang_func.parameters
+    if len(args) > len(params) or any(k.startswith("_") for k in kwargs):
+        return None
+    if any(p.io_type != IOType.inn for p in params):
+        return None
+    values = list(args)
+    for param in params[len(args) :]:
+        if param.name not in kwargs:
+            return None
+        values.append(kwargs[param.name])
+    if len(values) != len(args) + len(kwargs):
+        return None
+    return values
+
+
+def _call_now(function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    context = _STATE.context
+    _STATE.context = None
+    try:
+        return function.call(*args, **kwargs)
+    finally:
+        _STATE.context = context
+
+
+def _collect(root: LazyValue) -> list[LazyValue]:
+    # Gather the unevaluated values root depends on, in dependency order. Producers whose
+    # return type doesn't match the consuming parameter, or whose module can't be imported
+    # by the fused module, can't be inlined, so are evaluated up front and treated as inputs.
+    order: list[LazyValue] = []
+    visited: set[int] = set()
+    root_importable = _is_importable(root)
+
+    def visit(node: LazyValue):
+        visited.add(id(node))
+        params = node.function._slang_func.parameters
+        for param, value in zip(params, node.values):
+            if not isinstance(value, LazyValue) or value.is_evaluated or id(value) in visited:
+                continue
+            return_type = value.function._slang_func.return_type
+            if (
+                return_type is None
+                or return_type.full_name != param.type.full_name
+                or value.function.module.device != root.function.module.device
+                or not root_importable
+                or not _is_importable(value)
+            ):
+                value.eval()
+                continue
+            visit(value)
+        order.append(node)
+
+    visit(root)
+    return order
+
+
+def _is_importable(node: LazyValue) -> bool:
+    # Fused modules import modules by name, which must be a plain identifier to not be
+    # mistaken for a file path.
+    return node.function.module.name.isidentifier()
+
+
+def _generate(order: list[LazyValue]) -> tuple[str, list[Any]]:
+    # Generate a function that makes every call in order, passing intermediate results
+    # as locals. Returns the source and the argument for each of its parameters.
+    local_names = {id(node): f"t{i}" for i, node in enumerate(order)}
+    param_names: dict[tuple[int, str], str] = {}
+    param_decls: list[str] = []
+    inputs: list[Any] = []
+    body: list[str] = []
+    imports: dict[str, None] = {}
+
+    for node in order:
+        slang_func = node.function._slang_func
+        imports[node.function.module.name] = None
+        call_args: list[str] = []
+        for param, value in zip(slang_func.parameters, node.values):
+            if id(value) in local_names:
+                call_args.append(local_names[id(value)])
+                continue
+            if isinstance(value, LazyValue):
+                value = value.eval()
+            key = (id(value), param.type.full_name)
+            name = param_names.get(key)
+            if name is None:
+                name = f"p{len(param_decls)}"
+                param_names[key] = name
+                param_decls.append(f"{param.type.full_name} {name}")
+                inputs.append(value)
+            call_args.append(name)
+        assert slang_func.return_type is not None
+        body.append(
+            f"    {slang_func.return_type.full_name} {local_names[id(node)]} = "
+            f"{slang_func.full_name}({', '.join(call_args)});"
+        )
+
+    root = order[-1]
+    root_type = root.function._slang_func.return_type
+    assert root_type is not None
+    lines = [f"import {x};" for x in imports]
+    lines.append(f"{root_type.full_name} {_FUSED_FUNCTION_NAME}({', '.join(param_decls)}) {{")
+    lines.extend(body)
+    lines.append(f"    return {local_names[id(root)]};")
+    lines.append("}")
+    return "\n".join(lines) + "\n", inputs
+
+
+def _get_fused_module(order: list[LazyValue], source: str) -> Optional["Module"]:
+    from slangpy.core.module import Module
+
+    root_module = order[-1].function.module
+    device = root_module.device
+    key = (device, source)
+    if key in _fused_modules:
+        _fused_modules.move_to_end(key)
+        return _fused_modules[key]
+
+    if device not in _registered_devices:
+        device.register_device_close_callback(_on_device_close)
+        _registered_devices.add(device)
+
+    modules = list({id(x.function.module): x.function.module for x in order}.values())
+    name = f"slangpy_fused_{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+    try:
+        fused: Optional[Module] = Module.load_from_source(
+            device, name, source, options=root_module.options, link=modules
+        )
+    except Exception as e:
+        # Fall back to unfused evaluation, e.g. if a module can't be imported by name.
+        if root_module.logger is not None:
+            root_module.logger.warn(f"Failed to fuse lazy calls, evaluating separately: {e}")
+        fused = None
+    _fused_modules[key] = fused
+    if len(_fused_modules) > _MAX_FUSED_MODULES:
+        _fused_modules.popitem(last=False)
+    return fused
+
+
+def _on_device_close(device: Device):
+    _registered_devices.discard(device)
+    for key in [x for x in _fused_modules if x[0] == device]:
+        del _fused_modules[key]
+
+
+def _evaluate(root: LazyValue):
+    order = _collect(root)
+    if len(order) > 1:
+        source, inputs = _generate(order)
+        fused = _get_fused_module(order, source)
+        if fused is not None:
+            root._set_result(
+                _call_now(fused.require_function(_FUSED_FUNCTION_NAME), tuple(inputs), {})
+            )
+            return
+
+    # Single calls (or chains that could not be fused) are made one at a time.
+    for node in order:
+        values = [x.eval() if isinstance(x, LazyValue) else x for x in node.values]
+        node._set_result(_call_now(node.function, tuple(values), {}))
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 from typing import TYPE_CHECKING, Any, Optional, Union, Sequence
 
+from slangpy.core.callgraph import CallGraph
 from slangpy.core.function import Function
 from slangpy.core.struct import Struct
 
@@ -9,26 +10,95 @@ from slangpy.core.native import NativeCallDataCache
 from slangpy.reflection import SlangProgramLayout
 from slangpy.bindings.typeregistry import PYTHON_SIGNATURES
 
+import hashlib
+import os
+import threading
 import weakref
+from collections import OrderedDict
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from slangpy.core.calldata import CallData
     from slangpy.core.dispatchdata import DispatchData
+    from slangpy.core.function import FunctionNode
+    from slangpy.core.warmup import CallSpec, TCallSpec
 
 LOADED_MODULES = weakref.WeakValueDictionary()
 
+# Every loaded module. LOADED_MODULES only holds the last module loaded with each name, but
+# a hot reload has to reach all of them.
+_ALL_MODULES: "weakref.WeakSet[Module]" = weakref.WeakSet()
+
+# Modules by (device module, linked modules, options), that later modules with the same
+# key share their layout and caches with.
+_SHARED_MODULES: "weakref.WeakValueDictionary[tuple[Any, ...], Module]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Modules loaded from source by (device id, name, source hash), so identical source isn't
+# recompiled.
+_SOURCE_MODULES: "weakref.WeakValueDictionary[tuple[int, str, str], Module]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Locks serializing kernel builds for each device (see Module.build_lock).
+_BUILD_LOCKS: "weakref.WeakKeyDictionary[Device, threading.RLock]" = weakref.WeakKeyDictionary()
+_BUILD_LOCKS_LOCK = threading.Lock()
+
+# Attributes of a module that are shared by modules with the same key.
+_SHARED_ATTRIBUTES = (
+    "slangpy_device_module",
+    "layout",
+    "call_data_cache",
+    "dispatch_data_cache",
+    "pipeline_cache",
+    "shader_table_cache",
+    "dependencies",
+    "_fingerprints",
+    "_recent_builds",
+    "_recent_builds_lock",
+)
+
+_HOT_RELOAD_RECOMPILE = int(os.environ.get("SLANGPY_HOT_RELOAD_RECOMPILE", "0"))
+
+
+def set_hot_reload_recompile(count: int):
+    """
+    Set the number of kernels per module, most recently built first, that are recompiled
+    on background threads when a hot reload invalidates them, so they're ready by the time
+    they're next called. Only kernels whose arguments can be described by a CallSpec are
+    recompiled. 0 (the default) disables recompilation. Can also be controlled via the
+    SLANGPY_HOT_RELOAD_RECOMPILE environment variable.
+    """
+    global _HOT_RELOAD_RECOMPILE
+    if count < 0:
+        raise ValueError("Hot reload recompile count must not be negative")
+    _HOT_RELOAD_RECOMPILE = count
+
+
+def _normalize_path(path: Any) -> str:
+    return os.path.normcase(os.path.normpath(str(path)))
+
 
 def _check_for_hot_reload(event_info: Any = None):
     global LOADED_MODULES
-    for module in LOADED_MODULES.values():
-        if module is not None:
-            module.on_hot_reload()
+    # Only modules depending on the changed files need invalidating. An explicit reload
+    # doesn't say which files changed, so invalidates everything.
+    changed_files = getattr(event_info, "changed_files", None)
+    changed = {_normalize_path(x) for x in changed_files} if changed_files else None
+
+    # Modules sharing a layout share their caches, so only one of them needs reloading.
+    reloaded: set[int] = set()
+    for module in list(_ALL_MODULES):
+        if id(module.layout) not in reloaded:
+            reloaded.add(id(module.layout))
+            module.on_hot_reload(changed)
 
 
 def _register_hot_reload_hook(device: Device):
-    for x in LOADED_MODULES.values():
-        if isinstance(x, Module):
-            if x.device == device:
-                return
+    for x in _ALL_MODULES:
+        if x.device == device:
+            return
     device.register_shader_hot_reload_callback(_check_for_hot_reload)
 
 
@@ -58,28 +128,57 @@ class Module:
         self.device_module = device_module
         self.options = options
 
-        #: The slangpy device module.
-        self.slangpy_device_module = device_module.session.load_module("slangpy")
-
         # Extract linked modules, dict.fromkeys is used to remove duplicates while preserving order.
         self.link = list(dict.fromkeys([x.module if isinstance(x, Module) else x for x in link]))
+        self.logger: Optional[Logger] = None
+
+        # Functions and structs hold the module they were found in, so aren't shared.
+        self._attr_cache: dict[str, Union[Function, Struct]] = {}
+
+        # Modules wrapping the same device module with the same links and options share
+        # reflection and caches, rather than each relinking the program.
+        key = (device_module, tuple(self.link), repr(sorted(options.items())))
+        shared = _SHARED_MODULES.get(key)
+        if shared is not None:
+            for name in _SHARED_ATTRIBUTES:
+                setattr(self, name, getattr(shared, name))
+        else:
+            with self.build_lock:
+                self._init_shared()
+            _SHARED_MODULES[key] = self
+
+        LOADED_MODULES[self.device_module.name] = self
+        _ALL_MODULES.add(self)
+
+    def _init_shared(self):
+        #: The slangpy device module.
+        self.slangpy_device_module = self.device_module.session.load_module("slangpy")
 
         #: Reflection / layout information for the module.
         # Link the user- and device module together so we can reflect combined types
         # This should be solved by the combined object API in the future
         module_list = [self.slangpy_device_module, self.device_module] + self.link
-        combined_program = device_module.session.link_program(module_list, [])
+        combined_program = self.device_module.session.link_program(module_list, [])
         self.layout = SlangProgramLayout(combined_program.layout)
 
+        #: Cache of call data keyed by call signature. Unbounded by default, set
+        #: ``call_data_cache.capacity`` to limit it to a number of entries with LRU eviction.
         self.call_data_cache = CallDataCache()
         self.dispatch_data_cache: dict[str, "DispatchData"] = {}
         self.pipeline_cache: dict[str, Pipeline] = {}
         self.shader_table_cache: dict[str, ShaderTable] = {}
-        self.logger: Optional[Logger] = None
 
-        self._attr_cache: dict[str, Union[Function, Struct]] = {}
+        #: Source files the module's kernels are built from.
+        self.dependencies = self._find_dependencies()
 
-        LOADED_MODULES[self.device_module.name] = self
+        # Fingerprints of the module's sources by use (e.g. the kernel cache), which are
+        # cleared when the module is hot reloaded.
+        self._fingerprints: dict[str, str] = {}
+
+        # Recently built kernels, as the function and a description of its arguments keyed
+        # by call signature, for recompiling after a hot reload.
+        self._recent_builds: OrderedDict[str, tuple["FunctionNode", "CallSpec"]] = OrderedDict()
+        self._recent_builds_lock = threading.Lock()
 
     @staticmethod
     def load_from_source(
@@ -90,10 +189,18 @@ class Module:
         link: Sequence[Union["Module", SlangModule]] = [],
     ):
         """
-        Load a module from a string.
+        Load a module from a string. Loading the same source with the same name again
+        reuses the already compiled module.
         """
-        module = device.load_module_from_source(name, source)
-        return Module(module, options=options, link=link)
+        key = (id(device), name, hashlib.sha256(source.encode()).hexdigest())
+        loaded = _SOURCE_MODULES.get(key)
+        if loaded is not None and loaded.device == device:
+            module = loaded.device_module
+        else:
+            module = device.load_module_from_source(name, source)
+        res = Module(module, options=options, link=link)
+        _SOURCE_MODULES[key] = res
+        return res
 
     @staticmethod
     def load_from_file(
@@ -199,21 +306,130 @@ class Module:
             return None
         return child.as_func()
 
-    def on_hot_reload(self):
+    def warmup(
+        self,
+        manifest: dict[str, Sequence["TCallSpec"]],
+        compile_targets: bool = True,
+    ):
         """
-        Called by device when the module is hot reloaded.
+        Generate and compile kernels ahead of time for a set of functions. The manifest maps
+        function names (or 'Struct.method' names) to lists of call descriptions, as accepted
+        by Function.precompile.
         """
-        # Relink combined program
-        module_list = [self.slangpy_device_module, self.device_module] + self.link
-        combined_program = self.device_module.session.link_program(module_list, [])
-        self.layout.on_hot_reload(combined_program.layout)
+        from slangpy.core.warmup import warmup
 
-        # Clear all caches
-        self.call_data_cache = CallDataCache()
-        self.dispatch_data_cache = {}
-        self.pipeline_cache = {}
-        self.shader_table_cache = {}
-        self._attr_cache = {}
+        return warmup(self, manifest, compile_targets)
+
+    def compile_async(
+        self,
+        manifest: dict[str, Sequence["TCallSpec"]],
+    ) -> dict[str, list["Future[CallData]"]]:
+        """
+        Generate and compile kernels for a set of functions on background threads. Takes the
+        same manifest as warmup, and returns a matching dictionary of lists of futures that
+        resolve to the built call data.
+        """
+        from slangpy.core.warmup import warmup_async
+
+        return warmup_async(self, manifest)
+
+    def capture(self) -> CallGraph:
+        """
+        Capture a sequence of calls into a graph that can be replayed with a single command
+        encoder and submit. Use as a context manager:
+
+        with module.capture() as graph:
+            module.step(graph.input("x", x), _result=out)
+        graph.replay(x=new_x)
+        """
+        return CallGraph(self.device)
+
+    @property
+    def build_lock(self) -> threading.RLock:
+        """
+        The lock that serializes use of the Slang session of the module's device while
+        building kernels, i.e. specializing functions and loading, linking and creating
+        pipelines. Sessions aren't thread safe.
+        """
+        device = self.device
+        with _BUILD_LOCKS_LOCK:
+            lock = _BUILD_LOCKS.get(device)
+            if lock is None:
+                lock = threading.RLock()
+                _BUILD_LOCKS[device] = lock
+            return lock
+
+    def _find_dependencies(self) -> set[str]:
+        # Kernels import the slangpy module, this module and any linked modules.
+        dependencies: set[str] = set()
+        for module in [self.slangpy_device_module, self.device_module] + self.link:
+            dependencies.update(_normalize_path(x) for x in module.dependency_file_paths)
+        return dependencies
+
+    def _record_build(self, function: "FunctionNode", *args: Any, **kwargs: Any):
+        """
+        Record a kernel built for a call, for recompiling after a hot reload.
+        """
+        if _HOT_RELOAD_RECOMPILE == 0:
+            return
+        from slangpy.core.autotune import call_signature
+        from slangpy.core.warmup import CallSpec
+
+        spec = CallSpec.describe(*args, **kwargs)
+        if spec is None:
+            return
+        signature = call_signature(function, *args, **kwargs)
+        with self._recent_builds_lock:
+            self._recent_builds[signature] = (function, spec)
+            self._recent_builds.move_to_end(signature)
+            while len(self._recent_builds) > _HOT_RELOAD_RECOMPILE:
+                self._recent_builds.popitem(last=False)
+
+    def on_hot_reload(self, changed_files: Optional[set[str]] = None):
+        """
+        Called by device when the module is hot reloaded. If the changed source files are
+        given (as normalized absolute paths), the module's kernels and call data are only
+        discarded if it depends on one of them.
+        """
+        # Relink combined program
+        with self.build_lock:
+            module_list = [self.slangpy_device_module, self.device_module] + self.link
+            combined_program = self.device_module.session.link_program(module_list, [])
+            self.layout.on_hot_reload(combined_program.layout)
+
+        affected = changed_files is None or not self.dependencies.isdisjoint(changed_files)
+        dependencies = self._find_dependencies()
+        self.dependencies.clear()
+        self.dependencies.update(dependencies)
+        self._fingerprints.clear()
+
+        # Kernels and call data of unaffected modules are unchanged. Their pipelines are
+        # rebuilt in place by the device, and the reflection their marshalls use is updated
+        # in place by the layout. Caches are cleared in place, as they're shared with other
+        # modules with the same key (and the call data cache keeps its capacity and stats).
+        if not affected:
+            return
+        self.call_data_cache.clear()
+        self.dispatch_data_cache.clear()
+        self.pipeline_cache.clear()
+        self.shader_table_cache.clear()
+
+        # Functions and structs aren't shared, so reset those of every module sharing the
+        # caches.
+        for module in list(_ALL_MODULES):
+            if module.layout is self.layout:
+                module._attr_cache = {}
+
+        # Rebuild the most recently built call data in the background. Rebuilding records
+        # them again, and any that fail (eg as the function was removed) are dropped.
+        with self._recent_builds_lock:
+            builds = list(self._recent_builds.values())
+            self._recent_builds.clear()
+        if len(builds) > 0:
+            from slangpy.core.warmup import compile_async
+
+            for function, spec in reversed(builds):
+                compile_async(function, *spec.args, **spec.kwargs)
 
     def __getattr__(self, name: str):
         """
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
-from typing import Any, cast
-from slangpy import Module
+from typing import Any, Sequence, Union, cast
+from slangpy import Module, ShaderCursor
 from slangpy.core.native import (
     get_value_signature,
     CallMode,
@@ -11,6 +11,11 @@ from slangpy.core.native import (
 from slangpy.bindings import get_or_create_type, BindContext
 import hashlib
 
+#: Path of a field in a packed value.
+TPath = Union[str, int, Sequence[Union[str, int]]]
+
+_NO_VALUE = object()
+
 
 class PackedArg(NativePackedArg):
     """
@@ -19,7 +24,13 @@ class PackedArg(NativePackedArg):
     """
 
     def __init__(self, module: Module, python_object: Any):
+        shader_object, python = PackedArg._build(module, python_object)
+        super().__init__(python, shader_object, python_object)
+        self.module = module
+        self._update_signature()
 
+    @staticmethod
+    def _build(module: Module, python_object: Any) -> tuple[Any, Any]:
         # Confusing terminology: use 'unpack_arg' to convert object to plain-old-type (dict/list etc)
         unpacked_obj = unpack_arg(python_object)
 
@@ -37,13 +48,112 @@ class PackedArg(NativePackedArg):
             raise ValueError(
                 f"Cannot build shader object for {python_object} of type {type(python_object)}"
             )
-        super().__init__(python, shader_object, python_object)
+        return shader_object, python
 
+    def _update_signature(self):
         # Read full signature then turn into shorter hash
-        full_signature = get_value_signature(python_object)
+        full_signature = get_value_signature(self.python_object)
         signature_hash = hashlib.sha256(full_signature.encode("utf-8")).hexdigest()[:16]
         self.slangpy_signature = f"PK[H:{signature_hash}]"
 
+    def update(self, path: Union[TPath, dict[TPath, Any]], value: Any = _NO_VALUE):
+        """
+        Update fields of the packed value in place, either as update(path, value) or
+        update({path: value, ...}). A path is a '.' separated string or a sequence of
+        dictionary keys and list indices, eg "lights.2.color" or ("lights", 2, "color").
+        An empty path replaces the whole value.
+
+        The packed Python object is modified to match. If the new values have the same
+        types as the ones they replace, only those fields of the shader object are
+        written and the signature is unchanged, so calls reuse their existing kernels.
+        Otherwise the value is packed again.
+
+        Calls appended to a command encoder that hasn't been submitted yet may see the
+        new values.
+        """
+        if value is _NO_VALUE:
+            if not isinstance(path, dict):
+                raise ValueError("PackedArg.update requires a value or a dictionary of values")
+            updates = list(path.items())
+        else:
+            updates = [(cast(TPath, path), value)]
+
+        # Resolve and check every path before changing anything, so a bad path leaves the
+        # Python object and shader object untouched.
+        resolved = [(_parse_path(p), v) for p, v in updates]
+        for i, (keys, _) in enumerate(resolved):
+            for other, _ in resolved[:i]:
+                if keys[: len(other)] == other or other[: len(keys)] == keys:
+                    raise ValueError(
+                        f"Cannot update overlapping fields '{_path_str(other)}' and "
+                        f"'{_path_str(keys)}' of a packed argument at once"
+                    )
+        patches: list[tuple[list[Union[str, int]], Any]] = []
+        repack = False
+        for keys, field_value in resolved:
+            old_value = self._lookup(keys)
+            if get_value_signature(old_value) == get_value_signature(field_value):
+                patches.append((keys, field_value))
+            else:
+                repack = True
+
+        for keys, field_value in resolved:
+            self._replace(keys, field_value)
+
+        # Values with a ValueType layout (scalars, vectors, structs and arrays) can be
+        # patched, whereas eg buffers and tensors are cheap to pack again anyway.
+        cursor = ShaderCursor(self.shader_object)
+        if repack or not cursor.has_field("value"):
+            self.shader_object, self.python = PackedArg._build(self.module, self.python_object)
+            if repack:
+                self._update_signature()
+            return
+
+        for keys, field_value in patches:
+            field = cursor["value"]
+            for key in keys:
+                field = field[key]
+            field.write(unpack_arg(field_value))
+
+    def _lookup(self, keys: list[Union[str, int]]) -> Any:
+        # Get the value at a path in the Python object.
+        value = self.python_object
+        for i, key in enumerate(keys):
+            if isinstance(value, dict):
+                found = key in value
+            elif isinstance(value, list) and isinstance(key, int):
+                found = -len(value) <= key < len(value)
+            else:
+                raise ValueError(
+                    f"Cannot update {type(value).__name__} at '{_path_str(keys[:i])}' "
+                    "of a packed argument, only dicts and lists can be updated"
+                )
+            if not found:
+                raise KeyError(f"No field '{_path_str(keys[:i + 1])}' in packed argument")
+            value = value[key]
+        return value
+
+    def _replace(self, keys: list[Union[str, int]], value: Any):
+        # Replace the value at a path in the Python object, which must have been looked up.
+        if len(keys) == 0:
+            self.python_object = value
+        else:
+            self._lookup(keys[:-1])[keys[-1]] = value
+
+
+def _parse_path(path: TPath) -> list[Union[str, int]]:
+    if isinstance(path, str):
+        parts: Sequence[Union[str, int]] = path.split(".") if path else []
+    elif isinstance(path, int):
+        parts = [path]
+    else:
+        parts = path
+    return [int(x) if isinstance(x, str) and x.lstrip("-").isdigit() else x for x in parts]
+
+
+def _path_str(keys: Sequence[Union[str, int]]) -> str:
+    return ".".join(str(x) for x in keys)
+
 
 def pack(module: Module, arg_value: Any) -> PackedArg:
     """
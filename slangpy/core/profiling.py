@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Opt-in profiling of the SlangPy call path. When enabled, every call records the wall time
+spent in each phase (signature build, cache lookup, kernel build, argument preparation,
+encoding, submit, read back and optionally GPU execution), aggregated per module and function.
+
+import slangpy as spy
+spy.profiling.enable()
+module.myfunc(a, b)
+print(spy.profiling.report())
+spy.profiling.export_chrome_trace("trace.json")
+"""
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+
+from slangpy import Device, QueryPool, QueryType
+from slangpy.core.native import NativeCallData, NativeCallRuntimeOptions, SignatureBuilder
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+#: Whether profiling is enabled, checked by FunctionNode.call and CallData.
+ENABLED = False
+
+_GPU_TIMESTAMPS = False
+_MAX_EVENTS = 100000
+_LOCK = threading.Lock()
+_EPOCH = time.perf_counter()
+
+
+class PhaseStats:
+    """
+    Aggregated timings for one phase of calls to one function. Times are in seconds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+
+    def __repr__(self) -> str:
+        return f"PhaseStats(count={self.count}, total={self.total}, mean={self.mean})"
+
+
+# (module, function, phase) -> stats
+_STATS: dict[tuple[str, str, str], PhaseStats] = {}
+
+# (module, function, phase, start, duration, thread id) for trace export
+_EVENTS: list[tuple[str, str, str, float, float, int]] = []
+
+
+def enable(gpu_timestamps: bool = False, max_events: int = 100000):
+    """
+    Enable profiling. If gpu_timestamps is set, each call also measures GPU execution time
+    with timestamp queries, which requires waiting for every call to complete. At most
+    max_events individual events are kept for trace export, aggregated stats are unbounded.
+    """
+    global ENABLED, _GPU_TIMESTAMPS, _MAX_EVENTS
+    ENABLED = True
+    _GPU_TIMESTAMPS = gpu_timestamps
+    _MAX_EVENTS = max_events
+    NativeCallData.set_profiling_enabled(True)
+
+
+def disable():
+    """
+    Disable profiling. Recorded data is kept until reset.
+    """
+    global ENABLED
+    ENABLED = False
+    NativeCallData.set_profiling_enabled(False)
+
+
+def is_enabled() -> bool:
+    """
+    Check whether profiling is enabled.
+    """
+    return ENABLED
+
+
+def reset():
+    """
+    Clear all recorded data.
+    """
+    with _LOCK:
+        _STATS.clear()
+        _EVENTS.clear()
+
+
+def record(module: str, function: str, phase: str, start: float, end: float):
+    """
+    Record a phase of a call, with start and end times from time.perf_counter.
+    """
+    duration = end - start
+    with _LOCK:
+        key = (module, function, phase)
+        stats = _STATS.get(key)
+        if stats is None:
+            stats = PhaseStats()
+            _STATS[key] = stats
+        stats.add(duration)
+        if len(_EVENTS) < _MAX_EVENTS:
+            _EVENTS.append((module, function, phase, start, duration, threading.get_ident()))
+
+
+def stats() -> dict[tuple[str, str, str], PhaseStats]:
+    """
+    Get aggregated stats, keyed by (module name, function name, phase).
+    """
+    with _LOCK:
+        return dict(_STATS)
+
+
+def report() -> str:
+    """
+    Format aggregated stats as a table, sorted by total time.
+    """
+    rows = sorted(stats().items(), key=lambda x: x[1].total, reverse=True)
+    lines = [
+        f"{'Module':<24} {'Function':<32} {'Phase':<12} {'Count':>8} {'Total (ms)':>12} {'Mean (ms)':>12} {'Max (ms)':>12}"
+    ]
+    for (module, function, phase), s in rows:
+        lines.append(
+            f"{module[:24]:<24} {function[:32]:<32} {phase:<12} {s.count:>8} "
+            f"{s.total * 1000.0:>12.3f} {s.mean * 1000.0:>12.3f} {s.max * 1000.0:>12.3f}"
+        )
+    return "\n".join(lines)
+
+
+def export_chrome_trace(path: Union[str, os.PathLike[str]]):
+    """
+    Write recorded events as Chrome trace JSON, viewable in chrome://tracing or Perfetto.
+    """
+    with _LOCK:
+        events = list(_EVENTS)
+    trace: list[dict[str, Any]] = []
+    for module, function, phase, start, duration, tid in events:
+        trace.append(
+            {
+                "name": phase,
+                "cat": f"{module}::{function}",
+                "ph": "X",
+                "ts": (start - _EPOCH) * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"module": module, "function": function},
+            }
+        )
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+class CallTimer:
+    """
+    Times consecutive phases of a single call. Each mark records the time since the
+    previous mark (or creation) against the given phase.
+    """
+
+    def __init__(self, module: str, function: str):
+        super().__init__()
+        self.module = module
+        self.function = function
+        self.last = time.perf_counter()
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        record(self.module, self.function, phase, self.last, now)
+        self.last = now
+
+    def skip(self):
+        self.last = time.perf_counter()
+
+
+def begin(module: str, function: str) -> Optional[CallTimer]:
+    """
+    Start timing a call, or return None if profiling is disabled.
+    """
+    return CallTimer(module, function) if ENABLED else None
+
+
+def profiled_call(function: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """
+    Equivalent of FunctionNode.call that runs each phase separately so it can be timed.
+    Used by FunctionNode.call while profiling is enabled.
+    """
+    module = function.module
+    cache = module.call_data_cache
+    timer = CallTimer(module.name, function.name)
+
+    opts = NativeCallRuntimeOptions()
+    function.gather_runtime_options(opts)
+    this = opts._native_this
+    full_args = (this,) + args if this is not None else args
+    builder = SignatureBuilder()
+    function.read_signature(builder)
+    cache.get_args_signature(builder, *full_args, **kwargs)
+    signature = builder.str
+    timer.mark("signature")
+
+    call_data = cache.find_call_data(signature)
+    timer.mark("lookup")
+
+    if call_data is None:
+        # Build and add it directly rather than through _native_build_call_data, which would
+        # look the signature up again and count the miss twice. Build phases are recorded by
+        # CallData itself.
+        call_data = function.generate_call_data(full_args, kwargs)
+        cache.add_call_data(signature, call_data)
+        timer.skip()
+
+    # Torch integration has its own dispatch path, so just time the call.
+    if call_data.torch_integration:
+        res = function._native_call(cache, *args, **kwargs)
+        timer.mark("dispatch")
+        return res
+
+    device = call_data.device
+    query_pool = None
+    if _GPU_TIMESTAMPS:
+        query_pool = _write_timestamp(device, None, 0)
+        timer.skip()
+
+    # Remaining phases are timed natively.
+    res = call_data.call(opts, *full_args, **kwargs)
+    now = time.perf_counter()
+    start = timer.last
+    for phase, duration in call_data.last_call_timings.items():
+        record(timer.module, timer.function, phase, start, start + duration)
+        start += duration
+    timer.last = now
+
+    if query_pool is not None:
+        _write_timestamp(device, query_pool, 1)
+        device.wait()
+        timer.mark("wait")
+        queries = np.array(query_pool.get_results(0, 2))
+        gpu_time = float(queries[1] - queries[0]) / float(device.info.timestamp_frequency)
+        record(timer.module, timer.function, "gpu", timer.last - gpu_time, timer.last)
+
+    return res
+
+
+def _write_timestamp(device: Device, query_pool: Optional[QueryPool], index: int) -> QueryPool:
+    # Timestamps are written in their own command buffers either side of the call's, so the
+    # GPU time includes any gaps between the submits.
+    if query_pool is None:
+        query_pool = device.create_query_pool(type=QueryType.timestamp, count=2)
+    command_encoder = device.create_command_encoder()
+    command_encoder.write_timestamp(query_pool, index)
+    device.submit_command_buffer(command_encoder.finish())
+    return query_pool
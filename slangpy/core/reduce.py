@@ -0,0 +1,426 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+GPU reductions (sum/min/max/mean/argmax/argmin) over axes of an NDBuffer or Tensor.
+
+Kernels are generated per element type, operation and dimensionality. Long reductions
+run as a hierarchical workgroup reduction: each group reduces a block of the reduced
+range to a partial result in shared memory, and further passes reduce the partials
+until one value per output element remains. Short reductions use one thread per output
+element instead. All passes can be appended to a command encoder, so a reduction can
+follow a vectorized call without a host round trip.
+"""
+import math
+from typing import Any, Optional, Sequence, Union
+
+from slangpy import Buffer, CommandEncoder, ComputeKernel, Device
+from slangpy.core.native import NativeNDBuffer, NativeTensor
+from slangpy.primitives.kernels import (
+    GROUP_SIZE,
+    create_scratch,
+    dispatch_groups,
+    div_up,
+    get_kernels,
+)
+from slangpy.reflection.reflectiontypes import FLOAT_TYPES, ScalarType, SlangType, VectorType
+from slangpy.types.buffer import NDBuffer
+from slangpy.types.tensor import Tensor
+
+TReduceValue = Union[NDBuffer, Tensor]
+
+#: Supported reduction operations.
+REDUCE_OPS = ("sum", "min", "max", "mean", "argmax", "argmin")
+
+#: Elements each thread of a group reduces before the shared memory pass.
+_ITEMS_PER_THREAD = 16
+
+#: Reductions no longer than this use one thread per output element.
+_SERIAL_THRESHOLD = 64
+
+_COMBINE = {
+    "sum": "value = value + other;",
+    "mean": "value = value + other;",
+    "min": "value = min(value, other);",
+    "max": "value = max(value, other);",
+    "argmax": "if (other > value || (other == value && other_index < index)) { value = other; index = other_index; }",
+    "argmin": "if (other < value || (other == value && other_index < index)) { value = other; index = other_index; }",
+}
+
+
+def reduce(
+    value: TReduceValue,
+    op: str,
+    dim: Optional[Union[int, Sequence[int]]] = None,
+    keepdim: bool = False,
+    _append_to: Optional[CommandEncoder] = None,
+) -> TReduceValue:
+    """
+    Reduce an NDBuffer or Tensor along one or more axes on the GPU, returning a new
+    NDBuffer or Tensor of the same kind. If dim is None all axes are reduced and the
+    result has shape (1,). Reduced axes are removed from the result unless keepdim is set.
+
+    Element types may be scalars or vectors (reduced component wise). argmax/argmin need
+    scalar elements and return int indices into the reduced axes, flattened in row major
+    order when reducing more than one. mean needs floating point elements.
+
+    If _append_to is given, the reduction is appended to the command encoder rather than
+    dispatched immediately, and the result is valid once it has been submitted.
+
+    total = spy.reduce(buffer, "sum")
+    row_max = spy.reduce(buffer, "max", dim=1)
+    """
+    if op not in REDUCE_OPS:
+        raise ValueError(f"Unknown reduction '{op}', expected one of {REDUCE_OPS}")
+    if not isinstance(value, (NativeNDBuffer, NativeTensor)):
+        raise ValueError(f"Can only reduce NDBuffers and Tensors, got {type(value)}")
+
+    shape = value.shape.as_tuple()
+    strides = value.strides.as_tuple()
+    ndim = len(shape)
+    dims = _resolve_dims(dim, ndim)
+
+    dtype = value.dtype
+    _check_dtype(dtype, op)
+    is_arg = op.startswith("arg")
+
+    kept = [i for i in range(ndim) if i not in dims]
+    output_count = math.prod(shape[i] for i in kept)
+    reduce_count = math.prod(shape[i] for i in dims)
+    if output_count == 0 or reduce_count == 0:
+        raise ValueError("Cannot reduce an empty buffer")
+
+    if keepdim:
+        out_shape = tuple(1 if i in dims else shape[i] for i in range(ndim))
+    else:
+        out_shape = tuple(shape[i] for i in kept) or (1,)
+
+    device = value.device
+    out_dtype = dtype.program.find_type_by_name("int") if is_arg else dtype
+    if isinstance(value, NativeTensor):
+        result: TReduceValue = Tensor.empty(device, out_shape, out_dtype)
+    else:
+        result = NDBuffer.empty(device, out_shape, out_dtype)
+
+    kernels = _get_kernels(device, dtype, op, ndim)
+    command_encoder = _append_to if _append_to is not None else device.create_command_encoder()
+
+    # First pass reads the (possibly strided) input through its layout.
+    params: dict[str, Any] = {
+        "input": value.storage,
+        "offset": value.offset,
+        "kept_shape": _pad([shape[i] for i in kept], ndim, 1),
+        "kept_strides": _pad([strides[i] for i in kept], ndim, 0),
+        "reduce_shape": _pad([shape[i] for i in dims], ndim, 1),
+        "reduce_strides": _pad([strides[i] for i in dims], ndim, 0),
+        "output_count": output_count,
+        "reduce_count": reduce_count,
+        "group_count": 1,
+        "items_per_group": reduce_count,
+        "divisor": reduce_count if op == "mean" else 0,
+    }
+    if is_arg:
+        # Indices of the first pass are positions in the reduced range, so the index
+        # input is unused and only bound to keep the layout valid.
+        params["input_indices"] = create_scratch(device, 4, 1)
+        params["use_input_indices"] = 0
+
+    if reduce_count <= _SERIAL_THRESHOLD:
+        params.update(_final_outputs(result, is_arg, dtype.buffer_layout.stride))
+        dispatch_groups(
+            kernels["reduce_serial"], command_encoder, div_up(output_count, GROUP_SIZE), **params
+        )
+    else:
+        items_per_group = GROUP_SIZE * _ITEMS_PER_THREAD
+        while True:
+            group_count = div_up(reduce_count, items_per_group)
+            params["group_count"] = group_count
+            params["items_per_group"] = items_per_group
+            if group_count == 1:
+                params.update(_final_outputs(result, is_arg, dtype.buffer_layout.stride))
+                dispatch_groups(
+                    kernels["reduce_groups"],
+                    command_encoder,
+                    output_count,
+                    **params,
+                )
+                break
+
+            # Reduce blocks of the range to partials, which the next pass reads as a
+            # contiguous [output_count, group_count] buffer.
+            partial_count = output_count * group_count
+            partials = create_scratch(device, dtype.buffer_layout.stride, partial_count)
+            partial_indices = create_scratch(device, 4, partial_count) if is_arg else None
+            divisor = params["divisor"]
+            params["divisor"] = 0
+            params["output"] = partials
+            if partial_indices is not None:
+                params["output_indices"] = partial_indices
+            dispatch_groups(
+                kernels["reduce_groups"],
+                command_encoder,
+                partial_count,
+                **params,
+            )
+
+            params = {
+                "input": partials,
+                "offset": 0,
+                "kept_shape": _pad([output_count], ndim, 1),
+                "kept_strides": _pad([group_count], ndim, 0),
+                "reduce_shape": _pad([group_count], ndim, 1),
+                "reduce_strides": _pad([1], ndim, 0),
+                "output_count": output_count,
+                "reduce_count": group_count,
+                "divisor": divisor,
+            }
+            if partial_indices is not None:
+                params["input_indices"] = partial_indices
+                params["use_input_indices"] = 1
+            reduce_count = group_count
+            if reduce_count <= _SERIAL_THRESHOLD:
+                params.update(_final_outputs(result, is_arg, dtype.buffer_layout.stride))
+                dispatch_groups(
+                    kernels["reduce_serial"],
+                    command_encoder,
+                    div_up(output_count, GROUP_SIZE),
+                    **params,
+                )
+                break
+
+    if _append_to is None:
+        device.submit_command_buffer(command_encoder.finish())
+    return result
+
+
+def _resolve_dims(dim: Optional[Union[int, Sequence[int]]], ndim: int) -> list[int]:
+    if dim is None:
+        return list(range(ndim))
+    dims = [dim] if isinstance(dim, int) else list(dim)
+    resolved: set[int] = set()
+    for d in dims:
+        if d < -ndim or d >= ndim:
+            raise ValueError(f"Dimension {d} out of range for {ndim} dimensional buffer")
+        resolved.add(d % ndim)
+    if len(resolved) == 0:
+        raise ValueError("At least one dimension must be reduced")
+    return sorted(resolved)
+
+
+def _check_dtype(dtype: SlangType, op: str):
+    if isinstance(dtype, VectorType):
+        if op.startswith("arg"):
+            raise ValueError(f"{op} requires scalar elements, got {dtype.full_name}")
+        scalar = dtype.slang_scalar_type
+    elif isinstance(dtype, ScalarType):
+        scalar = dtype.slang_scalar_type
+    else:
+        raise ValueError(f"Can only reduce scalar or vector elements, got {dtype.full_name}")
+    if op == "mean" and scalar not in FLOAT_TYPES:
+        raise ValueError(f"mean requires floating point elements, got {dtype.full_name}")
+
+
+def _pad(values: list[int], ndim: int, fill: int) -> list[int]:
+    # Axes are passed as fixed size arrays, padded at the front so the last axis of the
+    # list stays innermost.
+    return [fill] * (ndim - len(values)) + values
+
+
+def _final_outputs(result: TReduceValue, is_arg: bool, value_stride: int) -> dict[str, Buffer]:
+    if not is_arg:
+        return {"output": result.storage}
+    # Arg reductions return indices. Values are only needed by earlier passes, so the
+    # final one writes them to scratch.
+    output_count = result.element_count
+    return {
+        "output": create_scratch(result.device, value_stride, output_count),
+        "output_indices": result.storage,
+    }
+
+
+def _get_kernels(device: Device, dtype: SlangType, op: str, ndim: int) -> dict[str, ComputeKernel]:
+    return get_kernels(device, _generate(dtype, op, ndim), ("reduce_groups", "reduce_serial"))
+
+
+def _generate(dtype: SlangType, op: str, ndim: int) -> str:
+    is_arg = op.startswith("arg")
+    scalar = dtype.scalar_type if isinstance(dtype, VectorType) else dtype
+    if is_arg:
+        entry_index_params = (
+            "uniform StructuredBuffer<uint> input_indices,\n"
+            "    uniform RWStructuredBuffer<uint> output_indices,\n"
+            "    uniform uint use_input_indices,"
+        )
+        range_index_params = "StructuredBuffer<uint> input_indices,\n    uint use_input_indices,"
+        index_args = "input_indices, use_input_indices, "
+        load_index = "index = use_input_indices != 0 ? input_indices[e] : r;"
+        load_other_index = "other_index = use_input_indices != 0 ? input_indices[e] : r;"
+        store_index = "output_indices[dst] = index;"
+    else:
+        entry_index_params = range_index_params = index_args = ""
+        load_index = load_other_index = store_index = ""
+    return _KERNEL_SOURCE.format(
+        group_size=GROUP_SIZE,
+        ndim=ndim,
+        dtype=dtype.full_name,
+        scalar=scalar.full_name,
+        combine=_COMBINE[op],
+        entry_index_params=entry_index_params,
+        range_index_params=range_index_params,
+        index_args=index_args,
+        load_index=load_index,
+        load_other_index=load_other_index,
+        store_index=store_index,
+    )
+
+
+_KERNEL_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+static const int D = {ndim};
+typealias T = {dtype};
+
+groupshared T s_values[GROUP_SIZE];
+groupshared uint s_indices[GROUP_SIZE];
+
+void combine(inout T value, inout uint index, T other, uint other_index)
+{{
+    {combine}
+}}
+
+int element_offset(uint i, uint shape[D], int strides[D])
+{{
+    int offset = 0;
+    [ForceUnroll]
+    for (int d = D - 1; d >= 0; d--) {{
+        offset += int(i % shape[d]) * strides[d];
+        i /= shape[d];
+    }}
+    return offset;
+}}
+
+T finalize(T value, uint divisor)
+{{
+    if (divisor != 0)
+        return value / T({scalar}(divisor));
+    return value;
+}}
+
+// Each thread reduces a strided subset of [begin, end) of one output's reduced range.
+void reduce_range(
+    StructuredBuffer<T> input,
+    {range_index_params}
+    int base,
+    uint reduce_shape[D],
+    int reduce_strides[D],
+    uint begin,
+    uint end,
+    uint step,
+    out T value,
+    out uint index)
+{{
+    value = T(0);
+    index = 0;
+    if (begin >= end)
+        return;
+    uint r = begin;
+    int e = base + element_offset(r, reduce_shape, reduce_strides);
+    value = input[e];
+    {load_index}
+    for (r = begin + step; r < end; r += step) {{
+        e = base + element_offset(r, reduce_shape, reduce_strides);
+        T other = input[e];
+        uint other_index = 0;
+        {load_other_index}
+        combine(value, index, other, other_index);
+    }}
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_groups(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<T> input,
+    uniform RWStructuredBuffer<T> output,
+    {entry_index_params}
+    uniform int offset,
+    uniform uint kept_shape[D],
+    uniform int kept_strides[D],
+    uniform uint reduce_shape[D],
+    uniform int reduce_strides[D],
+    uniform uint output_count,
+    uniform uint reduce_count,
+    uniform uint group_count,
+    uniform uint groups_x,
+    uniform uint items_per_group,
+    uniform uint divisor)
+{{
+    // Whole groups exit together, so barriers below are still reached by every thread.
+    uint group = group_id.y * groups_x + group_id.x;
+    if (group >= output_count * group_count)
+        return;
+    uint out_index = group / group_count;
+    uint begin = (group % group_count) * items_per_group;
+    uint end = min(begin + items_per_group, reduce_count);
+    uint tid = group_thread_id.x;
+    int base = offset + element_offset(out_index, kept_shape, kept_strides);
+
+    T value;
+    uint index;
+    reduce_range(input, {index_args}base, reduce_shape, reduce_strides, begin + tid, end, GROUP_SIZE, value, index);
+    s_values[tid] = value;
+    s_indices[tid] = index;
+    GroupMemoryBarrierWithGroupSync();
+
+    // Tree reduction over the threads that loaded at least one element.
+    uint valid = min(end - begin, GROUP_SIZE);
+    for (uint s = GROUP_SIZE / 2; s > 0; s >>= 1) {{
+        if (tid < s && tid + s < valid) {{
+            value = s_values[tid];
+            index = s_indices[tid];
+            combine(value, index, s_values[tid + s], s_indices[tid + s]);
+            s_values[tid] = value;
+            s_indices[tid] = index;
+        }}
+        GroupMemoryBarrierWithGroupSync();
+        valid = min(valid, s);
+    }}
+
+    if (tid == 0) {{
+        uint dst = group;
+        index = s_indices[0];
+        output[dst] = finalize(s_values[0], divisor);
+        {store_index}
+    }}
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_serial(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<T> input,
+    uniform RWStructuredBuffer<T> output,
+    {entry_index_params}
+    uniform int offset,
+    uniform uint kept_shape[D],
+    uniform int kept_strides[D],
+    uniform uint reduce_shape[D],
+    uniform int reduce_strides[D],
+    uniform uint output_count,
+    uniform uint reduce_count,
+    uniform uint group_count,
+    uniform uint groups_x,
+    uniform uint items_per_group,
+    uniform uint divisor)
+{{
+    uint dst = (group_id.y * groups_x + group_id.x) * GROUP_SIZE + group_thread_id.x;
+    if (dst >= output_count)
+        return;
+    int base = offset + element_offset(dst, kept_shape, kept_strides);
+
+    T value;
+    uint index;
+    reduce_range(input, {index_args}base, reduce_shape, reduce_strides, 0, reduce_count, 1, value, index);
+    output[dst] = finalize(value, divisor);
+    {store_index}
+}}
+"""
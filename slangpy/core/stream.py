@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import TYPE_CHECKING, Any, Generator, Optional, Union
+
+import numpy as np
+
+from slangpy import BufferUsage, MemoryType
+from slangpy.core.native import (
+    CallContext,
+    CallMode,
+    NativeCallData,
+    NativeCallRuntimeOptions,
+    NativeNDBuffer,
+    Shape,
+    unpack_args,
+    unpack_kwargs,
+)
+from slangpy.reflection.reflectiontypes import NUMPY_TYPE_TO_SCALAR_TYPE
+from slangpy.types.buffer import NDBuffer
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+# Position of a streamed argument: index of a positional argument or name of a keyword one.
+TArgKey = Union[int, str]
+
+
+class _StreamSlot:
+    """
+    Device buffers for one chunk in flight: an input buffer per streamed argument, the
+    output buffer and a read back copy of it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.inputs: dict[TArgKey, NDBuffer] = {}
+        self.output: Optional[NativeNDBuffer] = None
+        self.read_back: Optional[NDBuffer] = None
+        self.start = 0
+        self.count = 0
+        self.submit_id = 0
+
+
+class StreamingCall:
+    """
+    Calls a function over numpy arrays too large to upload in one go, by splitting the
+    call along the outermost dimension into chunks. Each chunk's upload, dispatch and
+    read back are encoded into one command buffer, and up to ``depth`` chunks are in
+    flight at once, so reading the next chunk from host memory (e.g. a memmap) overlaps
+    with the GPU processing the previous one. All chunks share a single resolved CallData.
+
+    Numpy arrays that map their outermost dimension to the outermost dimension of the call
+    shape are split, and are treated as inputs. All other arguments, including arrays that
+    are broadcast along it, are passed unchanged to every chunk, so must broadcast against
+    the chunk's call shape. Results are written into
+    ``_result`` if given (e.g. an output memmap), otherwise a generator of result chunks
+    is returned.
+
+    for chunk in module.process.stream(chunk=1 << 20)(np.load("big.npy", mmap_mode="r")):
+        ...
+    """
+
+    def __init__(self, function: "FunctionNode", chunk: int, depth: int = 2):
+        super().__init__()
+        if chunk < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if depth < 1:
+            raise ValueError("Stream depth must be at least 1")
+        self.function = function
+        self.chunk = chunk
+        self.depth = depth
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        out = kwargs.pop("_result", None)
+        chunks = self._run(args, kwargs)
+        if out is None:
+            return (res for _, res in chunks)
+        if not isinstance(out, np.ndarray):
+            raise ValueError(f"Streamed results must be written to a numpy array, got {type(out)}")
+        for start, res in chunks:
+            if res is None:
+                raise ValueError("Cannot write results of a function with no return value")
+            out[start : start + len(res)] = res
+        return out
+
+    def _run(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Generator[tuple[int, Any], None, None]:
+        function = self.function
+        module = function.module
+        device = module.device
+
+        opts = NativeCallRuntimeOptions()
+        function.gather_runtime_options(opts)
+        this = opts._native_this
+
+        length, streamed = _find_streamed(function, this, args, kwargs)
+        if length == 0:
+            return
+        chunk = max(1, min(self.chunk, length))
+
+        call_data: Optional[NativeCallData] = None
+        slots = [_StreamSlot() for _ in range(self.depth)]
+        pending: list[_StreamSlot] = []
+
+        for index, start in enumerate(range(0, length, chunk)):
+            slot = slots[index % self.depth]
+            if slot in pending:
+                # Slots are used round robin, so the oldest chunk in flight is this slot's.
+                yield _read_result(device, pending.pop(0))
+
+            count = min(chunk, length - start)
+            slot.start = start
+            slot.count = count
+            command_encoder = device.create_command_encoder()
+
+            # Upload this chunk of each streamed argument.
+            chunk_args = list(args)
+            chunk_kwargs = dict(kwargs)
+            for key, value in streamed.items():
+                data = np.ascontiguousarray(value[start : start + count])
+                buffer = slot.inputs.get(key)
+                if buffer is None:
+                    dtype = module.layout.scalar_type(NUMPY_TYPE_TO_SCALAR_TYPE[value.dtype])
+                    buffer = NDBuffer(
+                        device,
+                        dtype,
+                        shape=(chunk,) + value.shape[1:],
+                        program_layout=module.layout,
+                    )
+                    slot.inputs[key] = buffer
+                command_encoder.upload_buffer_data(buffer.storage, 0, data)
+                view = _chunk_view(buffer, count)
+                if isinstance(key, int):
+                    chunk_args[key] = view
+                else:
+                    chunk_kwargs[key] = view
+
+            # Kernel generation happens once, for the first chunk.
+            if call_data is None:
+                call_data = function._native_build_call_data(
+                    module.call_data_cache, *chunk_args, **chunk_kwargs
+                )
+            if this is not None:
+                chunk_args.insert(0, this)
+
+            if slot.output is None:
+                slot.output = _create_output(call_data, chunk, chunk_args, chunk_kwargs)
+                if slot.output is not None:
+                    slot.read_back = NDBuffer(
+                        device,
+                        slot.output.dtype,
+                        shape=slot.output.shape.as_tuple(),
+                        usage=BufferUsage.copy_destination,
+                        memory_type=MemoryType.read_back,
+                        program_layout=module.layout,
+                    )
+            if slot.output is not None:
+                chunk_kwargs["_result"] = _chunk_view(slot.output, count)
+
+            call_data.append_to(opts, command_encoder, *chunk_args, **chunk_kwargs)
+            if slot.output is not None and slot.read_back is not None:
+                size = count * (slot.output.storage.size // slot.output.shape[0])
+                command_encoder.copy_buffer(slot.read_back.storage, 0, slot.output.storage, 0, size)
+            slot.submit_id = device.submit_command_buffer(command_encoder.finish())
+            pending.append(slot)
+
+        while pending:
+            yield _read_result(device, pending.pop(0))
+
+
+def _find_streamed(
+    function: "FunctionNode", this: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[int, dict[TArgKey, np.ndarray]]:
+    # Resolve the call over the whole arrays to find the call shape, and which arrays
+    # map their outermost dimension to the outermost call dimension rather than being
+    # broadcast along it.
+    arrays: dict[TArgKey, Any] = {
+        k: v for k, v in list(enumerate(args)) + list(kwargs.items()) if isinstance(v, np.ndarray)
+    }
+    if len(arrays) == 0:
+        raise ValueError("Streamed calls need at least one numpy array argument to split")
+
+    call_data = function._native_build_call_data(function.module.call_data_cache, *args, **kwargs)
+    if call_data.call_dimensionality == 0:
+        raise ValueError("Streamed calls need a call shape with at least one dimension to split")
+
+    call_args = list(args) if this is None else [this] + list(args)
+    call_shape = call_data.runtime.calculate_call_shape(
+        call_data.call_dimensionality,
+        unpack_args(*call_args),
+        unpack_kwargs(**kwargs),
+        call_data,
+    )
+    length = call_shape[0]
+
+    streamed: dict[TArgKey, np.ndarray] = {}
+    for key, value in arrays.items():
+        if isinstance(key, int):
+            binding = call_data.runtime.args[key if this is None else key + 1]
+        else:
+            binding = call_data.runtime.find_kwarg(key)
+        if binding is None or value.ndim == 0 or len(value) != length:
+            continue
+        transform = binding.transform.as_tuple()
+        if len(transform) > 0 and transform[0] == 0:
+            streamed[key] = value
+    if len(streamed) == 0 and length > 0:
+        raise ValueError(
+            "Streamed calls need a numpy array argument along the outermost call dimension"
+        )
+    return length, streamed
+
+
+def _chunk_view(buffer: Any, count: int) -> Any:
+    if buffer.shape[0] == count:
+        return buffer
+    return buffer.view(Shape((count,) + buffer.shape.as_tuple()[1:]))
+
+
+def _create_output(
+    call_data: NativeCallData, chunk: int, args: list[Any], kwargs: dict[str, Any]
+) -> Any:
+    # Allocate the return value once per slot, for a full chunk, in the same way a
+    # normal call would. The slot's first chunk may be the partial last one, so the
+    # outermost dimension is set to the chunk size. Calls without return values just
+    # dispatch.
+    if call_data.call_mode != CallMode.prim:
+        return None
+    rv_node = call_data.runtime.find_kwarg("_result")
+    if rv_node is None:
+        return None
+    call_shape = call_data.runtime.calculate_call_shape(
+        call_data.call_dimensionality,
+        unpack_args(*args),
+        unpack_kwargs(**kwargs),
+        call_data,
+    )
+    call_shape = Shape((chunk,) + call_shape.as_tuple()[1:])
+    context = CallContext(call_data.device, call_shape, call_data.call_mode)
+    output = rv_node.python_type.create_output(context, rv_node)
+    if not isinstance(output, NativeNDBuffer):
+        raise ValueError("Streamed calls must return one value per element of the call shape")
+    return output
+
+
+def _read_result(device: Any, slot: _StreamSlot) -> tuple[int, Any]:
+    device.wait_for_submit(slot.submit_id)
+    if slot.read_back is None:
+        return (slot.start, None)
+    return (slot.start, _chunk_view(slot.read_back, slot.count).to_numpy())
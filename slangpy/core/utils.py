@@ -29,11 +29,16 @@ def create_device(
     enable_compilation_reports: bool = False,
     existing_device_handles: Optional[Sequence[NativeHandle]] = None,
     bindless_options: Optional[BindlessDesc] = None,
+    shader_cache_path: Optional[Union[str, PathLike[str]]] = None,
 ):
     """
     Create a device with basic settings for SlangPy. For full control over device init,
     use sgl.create_device directly, being sure to add slangpy.SHADER_PATH
     to the list of include paths for the compiler.
+
+    If ``shader_cache_path`` is specified, compiled shaders and pipelines are cached
+    on disk. Combine with ``slangpy.set_kernel_cache_path`` to also skip kernel generation
+    in new processes.
     """
 
     shaderpath = str(pathlib.Path(__file__).parent.parent.absolute() / "slang")
@@ -63,6 +68,7 @@ def create_device(
         enable_compilation_reports=enable_compilation_reports,
         existing_device_handles=existing_device_handles,
         bindless_options=bindless_options,
+        shader_cache_path=shader_cache_path,
     )
 
     if is_running_in_jupyter():
@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from slangpy import ComputePipeline, RayTracingPipeline
+
+if TYPE_CHECKING:
+    from slangpy.core.calldata import CallData
+    from slangpy.core.function import FunctionNode
+    from slangpy.core.module import Module
+
+
+class ArgSpec:
+    """
+    Abstract description of a function argument, used to generate and compile kernels
+    ahead of time without real argument values.
+
+    Container types (NDBuffer, Tensor, numpy arrays) are described by their element
+    dtype and number of dimensions. Any other type is described by the type itself,
+    and must be default constructible (e.g. ``float``, ``int`` or ``spy.float3``).
+
+    ArgSpec(NDBuffer, dtype="float", ndim=2)
+    ArgSpec(Tensor, dtype=module.MyStruct, ndim=1, grads=True)
+    ArgSpec(np.ndarray, dtype=np.float32, ndim=1)
+    ArgSpec(spy.float3)
+    """
+
+    def __init__(
+        self,
+        type: Any,
+        dtype: Any = None,
+        ndim: int = 0,
+        grads: bool = False,
+    ):
+        super().__init__()
+        self.type = type
+        self.dtype = dtype
+        self.ndim = ndim
+        self.grads = grads
+
+    def create_placeholder(self, module: "Module") -> Any:
+        """
+        Create a minimal value that produces the same call signature as real values
+        matching this description.
+        """
+        from slangpy.types import NDBuffer, Tensor
+
+        shape = (1,) * self.ndim
+        if self.type is NDBuffer:
+            return NDBuffer.empty(module.device, shape, self.dtype, program_layout=module.layout)
+        elif self.type is Tensor:
+            tensor = Tensor.empty(module.device, shape, self.dtype, program_layout=module.layout)
+            return tensor.with_grads() if self.grads else tensor
+        elif self.type is np.ndarray:
+            return np.zeros(shape, dtype=self.dtype)
+        else:
+            return self.type()
+
+    @staticmethod
+    def describe(value: Any) -> Any:
+        """
+        Describe a value for a call spec without keeping it alive: containers and vectors by
+        an ArgSpec, and other immutable values by themselves.
+        Raises ValueError if the value can't be described.
+        """
+        from slangpy.core.callsignature import is_slangpy_vector
+        from slangpy.types import NDBuffer, Tensor
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, NDBuffer):
+            return ArgSpec(NDBuffer, dtype=value.dtype, ndim=len(value.shape))
+        if isinstance(value, Tensor):
+            grads = value.grad_in is not None or value.grad_out is not None
+            if grads and (value.grad_in is None or value.grad_out is None):
+                raise ValueError("Tensors with only one of grad_in and grad_out can't be described")
+            return ArgSpec(Tensor, dtype=value.dtype, ndim=len(value.shape), grads=grads)
+        if isinstance(value, np.ndarray):
+            return ArgSpec(np.ndarray, dtype=value.dtype, ndim=value.ndim)
+        if is_slangpy_vector(value):
+            return ArgSpec(type(value))
+        raise ValueError(f"Values of type {type(value)} can't be described")
+
+    def __repr__(self) -> str:
+        return (
+            f"ArgSpec(type={self.type}, dtype={self.dtype}, ndim={self.ndim}, grads={self.grads})"
+        )
+
+
+class CallSpec:
+    """
+    Abstract description of the arguments to a call, made up of ArgSpecs and/or
+    example values.
+
+    CallSpec(ArgSpec(NDBuffer, dtype="float", ndim=1), 2.0, _result=ArgSpec(...))
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self.args = args
+        self.kwargs = kwargs
+
+    @staticmethod
+    def from_value(value: Union["CallSpec", Mapping[str, Any], Sequence[Any]]) -> "CallSpec":
+        """
+        Convert a call description to a CallSpec. Dictionaries are treated as keyword
+        arguments, and other sequences as positional arguments.
+        """
+        if isinstance(value, CallSpec):
+            return value
+        if isinstance(value, Mapping):
+            return CallSpec(**value)
+        return CallSpec(*value)
+
+    @staticmethod
+    def describe(*args: Any, **kwargs: Any) -> Optional["CallSpec"]:
+        """
+        Describe a call's arguments (see ArgSpec.describe), or return None if any of them
+        can't be described.
+        """
+        try:
+            return CallSpec(
+                *(ArgSpec.describe(x) for x in args),
+                **{k: ArgSpec.describe(v) for k, v in kwargs.items()},
+            )
+        except ValueError:
+            return None
+
+    def create_placeholders(self, module: "Module") -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Create placeholder positional and keyword arguments for this call.
+        """
+        args = tuple(_create_placeholder(module, x) for x in self.args)
+        kwargs = {k: _create_placeholder(module, v) for k, v in self.kwargs.items()}
+        return args, kwargs
+
+
+TCallSpec = Union[CallSpec, Mapping[str, Any], Sequence[Any]]
+
+
+def _create_placeholder(module: "Module", value: Any) -> Any:
+    if isinstance(value, ArgSpec):
+        return value.create_placeholder(module)
+    return value
+
+
+def compile_pipeline(call_data: "CallData"):
+    """
+    Force target compilation of a call data's pipeline. Pipelines are created with deferred
+    target compilation, which would otherwise happen when the pipeline is first bound.
+    """
+    pipeline = call_data.pipeline
+    command_encoder = call_data.device.create_command_encoder()
+    if isinstance(pipeline, ComputePipeline):
+        pass_encoder = command_encoder.begin_compute_pass()
+        pass_encoder.bind_pipeline(pipeline)
+    elif isinstance(pipeline, RayTracingPipeline):
+        pass_encoder = command_encoder.begin_ray_tracing_pass()
+        pass_encoder.bind_pipeline(pipeline, call_data.shader_table)
+    else:
+        raise TypeError(f"Cannot compile pipeline of type {type(pipeline).__name__}")
+    pass_encoder.end()
+    command_encoder.finish()
+
+
+def precompile(
+    function: "FunctionNode",
+    signatures: Sequence[TCallSpec],
+    compile_targets: bool = True,
+) -> list["CallData"]:
+    """
+    Generate and compile kernels for a function for each of a list of call descriptions,
+    populating the module's call data and pipeline caches.
+    """
+    module = function.module
+    results: list["CallData"] = []
+    for signature in signatures:
+        args, kwargs = CallSpec.from_value(signature).create_placeholders(module)
+        call_data = function.debug_build_call_data(*args, **kwargs)
+        if compile_targets:
+            compile_pipeline(call_data)
+        results.append(call_data)
+    return results
+
+
+_COMPILE_WORKERS = int(os.environ.get("SLANGPY_COMPILE_WORKERS", "0")) or min(
+    4, os.cpu_count() or 1
+)
+_COMPILE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_COMPILE_EXECUTOR_LOCK = threading.Lock()
+
+
+def set_compile_workers(count: int):
+    """
+    Set the number of worker threads used for background kernel compilation. Can also be
+    controlled via the SLANGPY_COMPILE_WORKERS environment variable. Work already submitted
+    to the previous pool completes as normal. Only the parts of a build that use the Slang
+    session are serialized per device (see Module.build_lock), so binding, code generation
+    and target compilation run in parallel.
+    """
+    global _COMPILE_WORKERS, _COMPILE_EXECUTOR
+    if count < 1:
+        raise ValueError("Compile worker count must be at least 1")
+    with _COMPILE_EXECUTOR_LOCK:
+        _COMPILE_WORKERS = count
+        if _COMPILE_EXECUTOR is not None:
+            _COMPILE_EXECUTOR.shutdown(wait=False)
+            _COMPILE_EXECUTOR = None
+
+
+def _get_compile_executor() -> ThreadPoolExecutor:
+    global _COMPILE_EXECUTOR
+    with _COMPILE_EXECUTOR_LOCK:
+        if _COMPILE_EXECUTOR is None:
+            _COMPILE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_COMPILE_WORKERS, thread_name_prefix="slangpy-compile"
+            )
+        return _COMPILE_EXECUTOR
+
+
+def compile_async(function: "FunctionNode", *args: Any, **kwargs: Any) -> "Future[CallData]":
+    """
+    Build the call data for a function and a set of arguments, and compile its pipeline
+    for the device, on a background thread, returning a future. Arguments may be real
+    values or ArgSpecs.
+    """
+    # Placeholders are created on the calling thread, as they allocate device resources.
+    args, kwargs = CallSpec(*args, **kwargs).create_placeholders(function.module)
+    return _get_compile_executor().submit(_build_and_compile, function, *args, **kwargs)
+
+
+def _build_and_compile(function: "FunctionNode", *args: Any, **kwargs: Any) -> "CallData":
+    call_data = function.debug_build_call_data(*args, **kwargs)
+    compile_pipeline(call_data)
+    return call_data
+
+
+def precompile_async(
+    function: "FunctionNode", signatures: Sequence[TCallSpec]
+) -> list["Future[CallData]"]:
+    """
+    Background version of precompile, returning a future per call description.
+    """
+    results: list["Future[CallData]"] = []
+    for signature in signatures:
+        spec = CallSpec.from_value(signature)
+        results.append(compile_async(function, *spec.args, **spec.kwargs))
+    return results
+
+
+def _find_function(module: "Module", name: str) -> "FunctionNode":
+    function: Optional["FunctionNode"]
+    if "." in name:
+        struct_name, func_name = name.rsplit(".", 1)
+        function = module.find_function_in_struct(struct_name, func_name)
+    else:
+        function = module.find_function(name)
+    if function is None:
+        raise ValueError(f"Could not find function '{name}' in module '{module.name}'")
+    return function
+
+
+def warmup(
+    module: "Module",
+    manifest: Mapping[str, Sequence[TCallSpec]],
+    compile_targets: bool = True,
+) -> dict[str, list["CallData"]]:
+    """
+    Precompile kernels for a set of functions in a module. The manifest maps function names
+    (optionally qualified with a struct name, e.g. 'MyStruct.method') to lists of call descriptions.
+    """
+    results: dict[str, list["CallData"]] = {}
+    for name, signatures in manifest.items():
+        results[name] = precompile(_find_function(module, name), signatures, compile_targets)
+    return results
+
+
+def warmup_async(
+    module: "Module",
+    manifest: Mapping[str, Sequence[TCallSpec]],
+) -> dict[str, list["Future[CallData]"]]:
+    """
+    Background version of warmup, returning a future per call description.
+    """
+    results: dict[str, list["Future[CallData]"]] = {}
+    for name, signatures in manifest.items():
+        results[name] = precompile_async(_find_function(module, name), signatures)
+    return results
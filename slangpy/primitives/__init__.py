@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Device wide parallel primitives on NDBuffers and Tensors: radix sort, prefix scans,
+histograms, stream compaction and mask to index conversion. Each primitive dispatches generated kernels, and takes
+an optional command encoder (_append_to) so it can be recorded between other calls
+without a host round trip.
+
+sorted_keys, sorted_values = spy.primitives.radix_sort(keys, values)
+alive, alive_count = spy.primitives.compact(particles, is_alive)
+"""
+from .compact import compact, nonzero
+from .histogram import histogram
+from .scan import exclusive_scan, inclusive_scan
+from .sort import radix_sort
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import Any, Optional
+
+from slangpy import CommandEncoder
+from slangpy.primitives.kernels import (
+    GROUP_SIZE,
+    TPrimitiveValue,
+    begin,
+    check_contiguous,
+    check_scalar,
+    create_like,
+    create_scratch,
+    dispatch_groups,
+    div_up,
+    end,
+    find_type,
+    get_kernels,
+)
+from slangpy.primitives.scan import scan_buffer
+
+
+def compact(
+    value: TPrimitiveValue,
+    mask: TPrimitiveValue,
+    _append_to: Optional[CommandEncoder] = None,
+) -> tuple[Any, Any]:
+    """
+    Stream compaction: gather the elements of value whose mask element is non zero into
+    the front of a new flat buffer, preserving their order. Returns the compacted
+    NDBuffer or Tensor, which has the same length as value, and a 1 element uint buffer
+    holding the number of elements kept. The count stays on the device, so the compacted
+    elements can be processed without a read back. Elements past the count are undefined.
+
+    If _append_to is given, the compaction is appended to the command encoder rather
+    than dispatched immediately.
+    """
+    count = check_contiguous(value, "Compacted value")
+    mask_count = check_contiguous(mask, "Mask")
+    check_scalar(mask, "Mask")
+    if mask_count != count:
+        raise ValueError(f"Mask has {mask_count} elements, expected {count}")
+
+    device = value.device
+    dtype = value.dtype
+    uint_type = find_type(value, "uint")
+    result = create_like(value, (count,), dtype)
+    result_count = create_like(value, (1,), uint_type)
+    command_encoder = begin(device, _append_to)
+
+    # Destination of each kept element is the exclusive scan of the mask.
+    indices = create_scratch(device, 4, count)
+    scan_buffer(
+        device,
+        command_encoder,
+        mask.storage,
+        mask.offset,
+        count,
+        mask.dtype.full_name,
+        "uint",
+        4,
+        "x != TI(0) ? 1 : 0",
+        False,
+        indices,
+    )
+
+    kernels = get_kernels(
+        device,
+        _COMPACT_SOURCE.format(
+            group_size=GROUP_SIZE, value_type=dtype.full_name, mask_type=mask.dtype.full_name
+        ),
+        ("compact_scatter",),
+    )
+    dispatch_groups(
+        kernels["compact_scatter"],
+        command_encoder,
+        div_up(count, GROUP_SIZE),
+        input=value.storage,
+        mask=mask.storage,
+        indices=indices,
+        output=result.storage,
+        output_count=result_count.storage,
+        input_offset=value.offset,
+        mask_offset=mask.offset,
+        count=count,
+    )
+    end(device, command_encoder, _append_to)
+    return result, result_count
+
+
+def nonzero(
+    mask: TPrimitiveValue,
+    _append_to: Optional[CommandEncoder] = None,
+) -> tuple[Any, Any]:
+    """
+    Flat indices of the non zero elements of a contiguous mask, in order, like
+    numpy.flatnonzero. Returns a uint NDBuffer or Tensor of indices, which has the same
+    length as the mask, and a 1 element uint buffer holding the number of indices found.
+    Indices past the count are undefined.
+
+    If _append_to is given, the search is appended to the command encoder rather than
+    dispatched immediately.
+    """
+    count = check_contiguous(mask, "Mask")
+    check_scalar(mask, "Mask")
+
+    device = mask.device
+    uint_type = find_type(mask, "uint")
+    result = create_like(mask, (count,), uint_type)
+    result_count = create_like(mask, (1,), uint_type)
+    command_encoder = begin(device, _append_to)
+
+    indices = create_scratch(device, 4, count)
+    scan_buffer(
+        device,
+        command_encoder,
+        mask.storage,
+        mask.offset,
+        count,
+        mask.dtype.full_name,
+        "uint",
+        4,
+        "x != TI(0) ? 1 : 0",
+        False,
+        indices,
+    )
+
+    kernels = get_kernels(
+        device,
+        _NONZERO_SOURCE.format(group_size=GROUP_SIZE, mask_type=mask.dtype.full_name),
+        ("nonzero_scatter",),
+    )
+    dispatch_groups(
+        kernels["nonzero_scatter"],
+        command_encoder,
+        div_up(count, GROUP_SIZE),
+        mask=mask.storage,
+        indices=indices,
+        output=result.storage,
+        output_count=result_count.storage,
+        mask_offset=mask.offset,
+        count=count,
+    )
+    end(device, command_encoder, _append_to)
+    return result, result_count
+
+
+_COMPACT_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+typealias T = {value_type};
+typealias M = {mask_type};
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void compact_scatter(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<T> input,
+    uniform StructuredBuffer<M> mask,
+    uniform StructuredBuffer<uint> indices,
+    uniform RWStructuredBuffer<T> output,
+    uniform RWStructuredBuffer<uint> output_count,
+    uniform uint input_offset,
+    uniform uint mask_offset,
+    uniform uint count,
+    uniform uint groups_x)
+{{
+    uint index = (group_id.y * groups_x + group_id.x) * GROUP_SIZE + group_thread_id.x;
+    if (index >= count)
+        return;
+    bool keep = mask[mask_offset + index] != M(0);
+    if (keep)
+        output[indices[index]] = input[input_offset + index];
+    if (index == count - 1)
+        output_count[0] = indices[index] + (keep ? 1 : 0);
+}}
+"""
+
+_NONZERO_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+typealias M = {mask_type};
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void nonzero_scatter(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<M> mask,
+    uniform StructuredBuffer<uint> indices,
+    uniform RWStructuredBuffer<uint> output,
+    uniform RWStructuredBuffer<uint> output_count,
+    uniform uint mask_offset,
+    uniform uint count,
+    uniform uint groups_x)
+{{
+    uint index = (group_id.y * groups_x + group_id.x) * GROUP_SIZE + group_thread_id.x;
+    if (index >= count)
+        return;
+    bool keep = mask[mask_offset + index] != M(0);
+    if (keep)
+        output[indices[index]] = index;
+    if (index == count - 1)
+        output_count[0] = indices[index] + (keep ? 1 : 0);
+}}
+"""
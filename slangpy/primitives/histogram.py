@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import Any, Optional
+
+from slangpy import CommandEncoder
+from slangpy.reflection.reflectiontypes import FLOAT_TYPES
+from slangpy.primitives.kernels import (
+    GROUP_SIZE,
+    TPrimitiveValue,
+    begin,
+    check_contiguous,
+    check_scalar,
+    create_like,
+    dispatch_groups,
+    div_up,
+    end,
+    find_type,
+    get_kernels,
+)
+
+#: Elements each thread bins per group.
+_ITEMS_PER_THREAD = 16
+
+#: Histograms with at most this many bins are accumulated in group shared memory before
+#: being added to the result, which avoids most contention on global atomics.
+_MAX_SHARED_BINS = 4096
+
+
+def histogram(
+    value: TPrimitiveValue,
+    bins: int,
+    range: Optional[tuple[float, float]] = None,
+    _append_to: Optional[CommandEncoder] = None,
+) -> Any:
+    """
+    Count the elements of a contiguous NDBuffer or Tensor of scalars into bins, returning
+    a uint NDBuffer or Tensor of shape (bins,).
+
+    If range is given, it is split into bins equal width bins as with numpy.histogram,
+    and elements outside it are ignored. Otherwise the elements must be integers, and
+    each is counted in the bin of its value, ignoring values outside [0, bins).
+
+    If _append_to is given, the histogram is appended to the command encoder rather than
+    dispatched immediately.
+    """
+    count = check_contiguous(value, "Histogram value")
+    check_scalar(value, "Histogram value")
+    if bins < 1:
+        raise ValueError("Histograms need at least 1 bin")
+    dtype = value.dtype
+    if range is None:
+        if dtype.slang_scalar_type in FLOAT_TYPES:
+            raise ValueError("A range is required for histograms of floating point values")
+        lo, hi = 0.0, float(bins)
+    else:
+        lo, hi = float(range[0]), float(range[1])
+        if not hi > lo:
+            raise ValueError(f"Invalid histogram range {range}")
+
+    device = value.device
+    result = create_like(value, (bins,), find_type(value, "uint"))
+    command_encoder = begin(device, _append_to)
+    result.clear(command_encoder)
+
+    kernels = get_kernels(
+        device,
+        _HISTOGRAM_SOURCE.format(
+            group_size=GROUP_SIZE,
+            value_type=dtype.full_name,
+            bins=bins,
+            shared_bins=bins if bins <= _MAX_SHARED_BINS else 1,
+            bin_of="bin_of_range" if range is not None else "bin_of_value",
+        ),
+        ("histogram_main",),
+    )
+    items_per_group = GROUP_SIZE * _ITEMS_PER_THREAD
+    dispatch_groups(
+        kernels["histogram_main"],
+        command_encoder,
+        div_up(count, items_per_group),
+        input=value.storage,
+        output=result.storage,
+        offset=value.offset,
+        count=count,
+        items_per_group=items_per_group,
+        lo=lo,
+        hi=hi,
+        scale=bins / (hi - lo),
+    )
+    end(device, command_encoder, _append_to)
+    return result
+
+
+_HISTOGRAM_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+static const uint BINS = {bins};
+static const uint SHARED_BINS = {shared_bins};
+static const bool USE_SHARED = SHARED_BINS == BINS;
+typealias T = {value_type};
+
+groupshared uint s_bins[SHARED_BINS];
+
+int bin_of_range(T x, float lo, float hi, float scale)
+{{
+    float v = float(x);
+    if (v < lo || v > hi)
+        return -1;
+    // Like numpy, the last bin includes the top of the range.
+    return min(int(floor((v - lo) * scale)), int(BINS) - 1);
+}}
+
+int bin_of_value(T x, float lo, float hi, float scale)
+{{
+    return x < T(0) || x >= T(BINS) ? -1 : int(x);
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void histogram_main(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<T> input,
+    uniform RWStructuredBuffer<uint> output,
+    uniform uint offset,
+    uniform uint count,
+    uniform uint items_per_group,
+    uniform uint groups_x,
+    uniform float lo,
+    uniform float hi,
+    uniform float scale)
+{{
+    uint group = group_id.y * groups_x + group_id.x;
+    uint begin = group * items_per_group;
+    if (begin >= count)
+        return;
+    uint end = min(begin + items_per_group, count);
+    uint tid = group_thread_id.x;
+
+    if (USE_SHARED) {{
+        for (uint i = tid; i < BINS; i += GROUP_SIZE)
+            s_bins[i] = 0;
+        GroupMemoryBarrierWithGroupSync();
+    }}
+
+    for (uint i = begin + tid; i < end; i += GROUP_SIZE) {{
+        int bin = {bin_of}(input[offset + i], lo, hi, scale);
+        if (bin < 0)
+            continue;
+        if (USE_SHARED)
+            InterlockedAdd(s_bins[bin], 1);
+        else
+            InterlockedAdd(output[bin], 1);
+    }}
+
+    if (USE_SHARED) {{
+        GroupMemoryBarrierWithGroupSync();
+        for (uint i = tid; i < BINS; i += GROUP_SIZE) {{
+            if (s_bins[i] != 0)
+                InterlockedAdd(output[i], s_bins[i]);
+        }}
+    }}
+}}
+"""
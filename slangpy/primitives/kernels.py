@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Helpers shared by the primitives and reductions: generated kernel caching, dispatch over
+a 2D grid of groups, scratch buffers and argument validation.
+"""
+import hashlib
+import math
+from typing import Any, Optional, Sequence, Union
+
+from slangpy import Buffer, BufferUsage, CommandEncoder, ComputeKernel, Device, uint3
+from slangpy.core.native import NativeNDBuffer, NativeTensor
+from slangpy.reflection.reflectiontypes import ScalarType, SlangType
+from slangpy.types.buffer import NDBuffer
+from slangpy.types.tensor import Tensor
+
+TPrimitiveValue = Union[NDBuffer, Tensor]
+
+#: Threads per group in every primitive kernel.
+GROUP_SIZE = 256
+
+#: Maximum number of groups in one dispatch dimension.
+MAX_GROUPS = 65535
+
+# (device, generated source) -> compute kernel for each entry point.
+_kernels: dict[tuple[Device, str], dict[str, ComputeKernel]] = {}
+
+
+def get_kernels(
+    device: Device, source: str, entry_points: Sequence[str]
+) -> dict[str, ComputeKernel]:
+    """
+    Get compute kernels for entry points of generated source, compiling it on first use.
+    """
+    key = (device, source)
+    kernels = _kernels.get(key)
+    if kernels is None:
+        if not any(x[0] == device for x in _kernels):
+            device.register_device_close_callback(_on_device_close)
+        name = f"slangpy_primitives_{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+        module = device.load_module_from_source(name, source)
+        kernels = {}
+        for entry_point in entry_points:
+            program = device.link_program([module], [module.entry_point(entry_point)])
+            kernels[entry_point] = device.create_compute_kernel(program)
+        _kernels[key] = kernels
+    return kernels
+
+
+def _on_device_close(device: Device):
+    for key in [x for x in _kernels if x[0] == device]:
+        del _kernels[key]
+
+
+def dispatch_groups(
+    kernel: ComputeKernel, command_encoder: CommandEncoder, group_count: int, **params: Any
+):
+    """
+    Dispatch group_count groups, spread over a 2D grid as the number of groups in one
+    dimension is limited. Kernels find their linear group index from SV_GroupID and the
+    groups_x parameter, and must return if it is out of range.
+    """
+    group_count = max(group_count, 1)
+    groups_x = min(group_count, MAX_GROUPS)
+    groups_y = div_up(group_count, groups_x)
+    kernel.dispatch(
+        thread_count=uint3(groups_x * GROUP_SIZE, groups_y, 1),
+        command_encoder=command_encoder,
+        groups_x=groups_x,
+        **params,
+    )
+
+
+def div_up(x: int, y: int) -> int:
+    return (x + y - 1) // y
+
+
+def create_scratch(device: Device, struct_size: int, count: int) -> Buffer:
+    return device.create_buffer(
+        element_count=max(count, 1),
+        struct_size=struct_size,
+        usage=BufferUsage.shader_resource | BufferUsage.unordered_access,
+    )
+
+
+def create_like(value: TPrimitiveValue, shape: tuple[int, ...], dtype: SlangType) -> Any:
+    """
+    Create an uninitialized NDBuffer or Tensor, matching the kind of value.
+    """
+    if isinstance(value, NativeTensor):
+        return Tensor.empty(value.device, shape, dtype)
+    return NDBuffer.empty(value.device, shape, dtype)
+
+
+def find_type(value: TPrimitiveValue, name: str) -> SlangType:
+    dtype = value.dtype.program.find_type_by_name(name)
+    assert dtype is not None
+    return dtype
+
+
+def check_contiguous(value: Any, name: str) -> int:
+    """
+    Check value is a non empty, contiguous NDBuffer or Tensor, returning its element
+    count. Primitives treat their inputs as flat arrays.
+    """
+    if not isinstance(value, (NativeNDBuffer, NativeTensor)):
+        raise ValueError(f"{name} must be an NDBuffer or Tensor, got {type(value)}")
+    shape = value.shape.as_tuple()
+    expected = 1
+    for dim, stride in reversed(list(zip(shape, value.strides.as_tuple()))):
+        if dim > 1 and stride != expected:
+            raise ValueError(f"{name} must be contiguous")
+        expected *= dim
+    count = math.prod(shape)
+    if count == 0:
+        raise ValueError(f"{name} must not be empty")
+    return count
+
+
+def check_scalar(value: TPrimitiveValue, name: str, allowed: Optional[set[str]] = None):
+    dtype = value.dtype
+    if not isinstance(dtype, ScalarType) or (
+        allowed is not None and dtype.full_name not in allowed
+    ):
+        expected = ", ".join(sorted(allowed)) if allowed is not None else "scalar"
+        raise ValueError(f"{name} must have {expected} elements, got {dtype.full_name}")
+
+
+def begin(device: Device, _append_to: Optional[CommandEncoder]) -> CommandEncoder:
+    return _append_to if _append_to is not None else device.create_command_encoder()
+
+
+def end(device: Device, command_encoder: CommandEncoder, _append_to: Optional[CommandEncoder]):
+    if _append_to is None:
+        device.submit_command_buffer(command_encoder.finish())
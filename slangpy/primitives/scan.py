@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import Optional
+
+from slangpy import Buffer, CommandEncoder, Device
+from slangpy.primitives.kernels import (
+    GROUP_SIZE,
+    TPrimitiveValue,
+    begin,
+    check_contiguous,
+    check_scalar,
+    create_like,
+    create_scratch,
+    dispatch_groups,
+    div_up,
+    end,
+    get_kernels,
+)
+
+#: Elements each thread scans serially before the group wide pass.
+_ITEMS_PER_THREAD = 4
+
+_BLOCK_SIZE = GROUP_SIZE * _ITEMS_PER_THREAD
+
+
+def exclusive_scan(
+    value: TPrimitiveValue, _append_to: Optional[CommandEncoder] = None
+) -> TPrimitiveValue:
+    """
+    Exclusive prefix sum of a contiguous NDBuffer or Tensor of scalars, treated as a flat
+    array. Element i of the result is the sum of elements before i. If _append_to is
+    given, the scan is appended to the command encoder rather than dispatched immediately.
+    """
+    return _scan(value, False, _append_to)
+
+
+def inclusive_scan(
+    value: TPrimitiveValue, _append_to: Optional[CommandEncoder] = None
+) -> TPrimitiveValue:
+    """
+    Inclusive prefix sum of a contiguous NDBuffer or Tensor of scalars, treated as a flat
+    array. Element i of the result is the sum of elements up to and including i.
+    """
+    return _scan(value, True, _append_to)
+
+
+def _scan(
+    value: TPrimitiveValue, inclusive: bool, _append_to: Optional[CommandEncoder]
+) -> TPrimitiveValue:
+    count = check_contiguous(value, "Scanned value")
+    check_scalar(value, "Scanned value")
+    dtype = value.dtype
+    result = create_like(value, value.shape.as_tuple(), dtype)
+    device = value.device
+    command_encoder = begin(device, _append_to)
+    scan_buffer(
+        device,
+        command_encoder,
+        value.storage,
+        value.offset,
+        count,
+        dtype.full_name,
+        dtype.full_name,
+        dtype.buffer_layout.stride,
+        "TO(x)",
+        inclusive,
+        result.storage,
+    )
+    end(device, command_encoder, _append_to)
+    return result
+
+
+def scan_buffer(
+    device: Device,
+    command_encoder: CommandEncoder,
+    input: Buffer,
+    input_offset: int,
+    count: int,
+    input_type: str,
+    output_type: str,
+    output_stride: int,
+    load: str,
+    inclusive: bool,
+    output: Buffer,
+):
+    """
+    Append a scan of count elements of a structured buffer to a command encoder, writing
+    the results to the start of output. Elements are converted to the output type by the
+    Slang expression load, in terms of an input element x.
+
+    Each group scans a block of elements and writes its total. Block totals are scanned
+    recursively and added back to every element of the following blocks.
+    """
+    kernels = get_kernels(
+        device,
+        _SCAN_SOURCE.format(
+            group_size=GROUP_SIZE,
+            items=_ITEMS_PER_THREAD,
+            input_type=input_type,
+            output_type=output_type,
+            load=load,
+        ),
+        ("scan_blocks", "add_block_offsets"),
+    )
+    block_count = div_up(count, _BLOCK_SIZE)
+    block_sums = create_scratch(device, output_stride, block_count)
+    dispatch_groups(
+        kernels["scan_blocks"],
+        command_encoder,
+        block_count,
+        input=input,
+        output=output,
+        block_sums=block_sums,
+        offset=input_offset,
+        count=count,
+        block_count=block_count,
+        inclusive=1 if inclusive else 0,
+    )
+    if block_count > 1:
+        block_offsets = create_scratch(device, output_stride, block_count)
+        scan_buffer(
+            device,
+            command_encoder,
+            block_sums,
+            0,
+            block_count,
+            output_type,
+            output_type,
+            output_stride,
+            "x",
+            False,
+            block_offsets,
+        )
+        dispatch_groups(
+            kernels["add_block_offsets"],
+            command_encoder,
+            block_count,
+            output=output,
+            block_offsets=block_offsets,
+            count=count,
+            block_count=block_count,
+        )
+
+
+_SCAN_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+static const uint ITEMS = {items};
+typealias TI = {input_type};
+typealias TO = {output_type};
+
+groupshared TO s_totals[GROUP_SIZE];
+
+TO load(TI x)
+{{
+    return {load};
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void scan_blocks(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<TI> input,
+    uniform RWStructuredBuffer<TO> output,
+    uniform RWStructuredBuffer<TO> block_sums,
+    uniform uint offset,
+    uniform uint count,
+    uniform uint block_count,
+    uniform uint groups_x,
+    uniform uint inclusive)
+{{
+    uint block = group_id.y * groups_x + group_id.x;
+    if (block >= block_count)
+        return;
+    uint tid = group_thread_id.x;
+    uint base = block * GROUP_SIZE * ITEMS + tid * ITEMS;
+
+    // Serial scan of this thread's elements.
+    TO values[ITEMS];
+    TO total = TO(0);
+    [ForceUnroll]
+    for (uint i = 0; i < ITEMS; i++) {{
+        TO x = base + i < count ? load(input[offset + base + i]) : TO(0);
+        values[i] = inclusive != 0 ? total + x : total;
+        total = total + x;
+    }}
+
+    // Inclusive scan of the thread totals.
+    s_totals[tid] = total;
+    GroupMemoryBarrierWithGroupSync();
+    for (uint s = 1; s < GROUP_SIZE; s <<= 1) {{
+        TO other = tid >= s ? s_totals[tid - s] : TO(0);
+        GroupMemoryBarrierWithGroupSync();
+        s_totals[tid] = s_totals[tid] + other;
+        GroupMemoryBarrierWithGroupSync();
+    }}
+
+    TO prefix = tid > 0 ? s_totals[tid - 1] : TO(0);
+    [ForceUnroll]
+    for (uint i = 0; i < ITEMS; i++) {{
+        if (base + i < count)
+            output[base + i] = prefix + values[i];
+    }}
+    if (tid == GROUP_SIZE - 1)
+        block_sums[block] = s_totals[tid];
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void add_block_offsets(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform RWStructuredBuffer<TO> output,
+    uniform StructuredBuffer<TO> block_offsets,
+    uniform uint count,
+    uniform uint block_count,
+    uniform uint groups_x)
+{{
+    uint block = group_id.y * groups_x + group_id.x;
+    if (block >= block_count)
+        return;
+    TO add = block_offsets[block];
+    [ForceUnroll]
+    for (uint i = 0; i < ITEMS; i++) {{
+        uint index = (block * ITEMS + i) * GROUP_SIZE + group_thread_id.x;
+        if (index < count)
+            output[index] = output[index] + add;
+    }}
+}}
+"""
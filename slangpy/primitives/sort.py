@@ -0,0 +1,289 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import Any, Optional
+
+from slangpy import Buffer, CommandEncoder
+from slangpy.primitives.kernels import (
+    GROUP_SIZE,
+    TPrimitiveValue,
+    begin,
+    check_contiguous,
+    check_scalar,
+    create_like,
+    create_scratch,
+    dispatch_groups,
+    div_up,
+    end,
+    get_kernels,
+)
+from slangpy.primitives.scan import scan_buffer
+
+#: Bits of the key sorted per pass.
+_RADIX_BITS = 4
+
+_RADIX = 1 << _RADIX_BITS
+
+#: Keys each thread ranks per group, one per round.
+_ITEMS_PER_THREAD = 4
+
+_BLOCK_SIZE = GROUP_SIZE * _ITEMS_PER_THREAD
+
+# Maps keys to uints whose unsigned order matches the order of the keys.
+_KEY_TO_BITS = {
+    "uint": "return key;",
+    "int": "return asuint(key) ^ 0x80000000;",
+    "float": "uint bits = asuint(key); return bits ^ ((bits & 0x80000000) != 0 ? 0xffffffff : 0x80000000);",
+}
+
+
+def radix_sort(
+    keys: TPrimitiveValue,
+    values: Optional[TPrimitiveValue] = None,
+    bits: int = 32,
+    _append_to: Optional[CommandEncoder] = None,
+) -> Any:
+    """
+    Stable device wide radix sort of a contiguous NDBuffer or Tensor of uint, int or float
+    keys, treated as a flat array. Returns a new buffer of sorted keys or, if values is
+    given, a tuple of the sorted keys and the values (of any element type) reordered with
+    them. The inputs are not modified.
+
+    Keys are sorted 4 bits per pass. If uint keys are known to fit in fewer than 32 bits,
+    passing bits skips the passes for the upper bits.
+
+    If _append_to is given, the sort is appended to the command encoder rather than
+    dispatched immediately.
+    """
+    count = check_contiguous(keys, "Keys")
+    check_scalar(keys, "Keys", set(_KEY_TO_BITS))
+    if values is not None and check_contiguous(values, "Values") != count:
+        raise ValueError("Keys and values must have the same number of elements")
+    if bits < 1 or bits > 32 or bits % _RADIX_BITS != 0:
+        raise ValueError(f"Sorted bits must be a multiple of {_RADIX_BITS} up to 32")
+    if bits != 32 and keys.dtype.full_name != "uint":
+        raise ValueError("Only uint keys can be sorted on fewer than 32 bits")
+
+    device = keys.device
+    key_type = keys.dtype
+    value_type = values.dtype if values is not None else None
+    kernels = get_kernels(
+        device,
+        _SORT_SOURCE.format(
+            group_size=GROUP_SIZE,
+            items=_ITEMS_PER_THREAD,
+            radix_bits=_RADIX_BITS,
+            key_type=key_type.full_name,
+            key_to_bits=_KEY_TO_BITS[key_type.full_name],
+            value_type=value_type.full_name if value_type is not None else "uint",
+            has_values="true" if value_type is not None else "false",
+        ),
+        ("radix_count", "radix_scatter"),
+    )
+
+    # Passes ping pong between the results and scratch buffers, ending in the results.
+    sorted_keys = create_like(keys, (count,), key_type)
+    key_buffers = [
+        sorted_keys.storage,
+        create_scratch(device, key_type.buffer_layout.stride, count),
+    ]
+    sorted_values = None
+    value_buffers: list[Optional[Buffer]] = [None, None]
+    if values is not None and value_type is not None:
+        sorted_values = create_like(values, (count,), value_type)
+        value_buffers = [
+            sorted_values.storage,
+            create_scratch(device, value_type.buffer_layout.stride, count),
+        ]
+
+    block_count = div_up(count, _BLOCK_SIZE)
+    digit_counts = create_scratch(device, 4, _RADIX * block_count)
+    digit_offsets = create_scratch(device, 4, _RADIX * block_count)
+    command_encoder = begin(device, _append_to)
+
+    passes = bits // _RADIX_BITS
+    key_input, key_offset = keys.storage, keys.offset
+    value_input = values.storage if values is not None else value_buffers[0]
+    value_offset = values.offset if values is not None else 0
+    for index in range(passes):
+        shift = index * _RADIX_BITS
+        target = (passes - 1 - index) % 2
+
+        # Count digits per block, laid out digit major so that an exclusive scan gives
+        # each block's first destination for each digit.
+        dispatch_groups(
+            kernels["radix_count"],
+            command_encoder,
+            block_count,
+            keys=key_input,
+            counts=digit_counts,
+            key_offset=key_offset,
+            count=count,
+            block_count=block_count,
+            shift=shift,
+        )
+        scan_buffer(
+            device,
+            command_encoder,
+            digit_counts,
+            0,
+            _RADIX * block_count,
+            "uint",
+            "uint",
+            4,
+            "x",
+            False,
+            digit_offsets,
+        )
+        params: dict[str, Any] = {
+            "keys_in": key_input,
+            "keys_out": key_buffers[target],
+            "offsets": digit_offsets,
+            "key_offset": key_offset,
+            "count": count,
+            "block_count": block_count,
+            "shift": shift,
+        }
+        if values is not None:
+            params.update(
+                values_in=value_input,
+                values_out=value_buffers[target],
+                value_offset=value_offset,
+            )
+        dispatch_groups(kernels["radix_scatter"], command_encoder, block_count, **params)
+
+        key_input, key_offset = key_buffers[target], 0
+        value_input, value_offset = value_buffers[target], 0
+
+    end(device, command_encoder, _append_to)
+    if sorted_values is not None:
+        return sorted_keys, sorted_values
+    return sorted_keys
+
+
+_SORT_SOURCE = """
+static const uint GROUP_SIZE = {group_size};
+static const uint ITEMS = {items};
+static const uint RADIX_BITS = {radix_bits};
+static const uint RADIX = 1 << RADIX_BITS;
+static const bool HAS_VALUES = {has_values};
+typealias K = {key_type};
+typealias V = {value_type};
+
+// Per thread digit flags for the group wide rank, 16 bits per digit so 2 digits per word.
+static const uint RANK_WORDS = RADIX / 2;
+groupshared uint s_ranks[RANK_WORDS][GROUP_SIZE];
+groupshared uint s_counts[RADIX];
+
+uint key_to_bits(K key)
+{{
+    {key_to_bits}
+}}
+
+uint digit_of(K key, uint shift)
+{{
+    return (key_to_bits(key) >> shift) & (RADIX - 1);
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void radix_count(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<K> keys,
+    uniform RWStructuredBuffer<uint> counts,
+    uniform uint key_offset,
+    uniform uint count,
+    uniform uint block_count,
+    uniform uint groups_x,
+    uniform uint shift)
+{{
+    uint block = group_id.y * groups_x + group_id.x;
+    if (block >= block_count)
+        return;
+    uint tid = group_thread_id.x;
+    if (tid < RADIX)
+        s_counts[tid] = 0;
+    GroupMemoryBarrierWithGroupSync();
+
+    [ForceUnroll]
+    for (uint i = 0; i < ITEMS; i++) {{
+        uint index = (block * ITEMS + i) * GROUP_SIZE + tid;
+        if (index < count)
+            InterlockedAdd(s_counts[digit_of(keys[key_offset + index], shift)], 1);
+    }}
+    GroupMemoryBarrierWithGroupSync();
+
+    if (tid < RADIX)
+        counts[tid * block_count + block] = s_counts[tid];
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void radix_scatter(
+    uint3 group_thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform StructuredBuffer<K> keys_in,
+    uniform RWStructuredBuffer<K> keys_out,
+    uniform StructuredBuffer<V> values_in,
+    uniform RWStructuredBuffer<V> values_out,
+    uniform StructuredBuffer<uint> offsets,
+    uniform uint key_offset,
+    uniform uint value_offset,
+    uniform uint count,
+    uniform uint block_count,
+    uniform uint groups_x,
+    uniform uint shift)
+{{
+    uint block = group_id.y * groups_x + group_id.x;
+    if (block >= block_count)
+        return;
+    uint tid = group_thread_id.x;
+    if (tid < RADIX)
+        s_counts[tid] = offsets[tid * block_count + block];
+    GroupMemoryBarrierWithGroupSync();
+
+    // Keys are ranked a round of GROUP_SIZE at a time, in order, which keeps the sort
+    // stable. s_counts holds the next destination for each digit.
+    for (uint round = 0; round < ITEMS; round++) {{
+        uint index = (block * ITEMS + round) * GROUP_SIZE + tid;
+        bool valid = index < count;
+        K key = K(0);
+        uint digit = 0;
+        if (valid) {{
+            key = keys_in[key_offset + index];
+            digit = digit_of(key, shift);
+        }}
+        uint word = digit / 2;
+        uint bit_shift = (digit % 2) * 16;
+        [ForceUnroll]
+        for (uint w = 0; w < RANK_WORDS; w++)
+            s_ranks[w][tid] = valid && w == word ? (1u << bit_shift) : 0;
+        GroupMemoryBarrierWithGroupSync();
+
+        // Inclusive scan of the packed flags gives each key's rank among equal digits.
+        for (uint s = 1; s < GROUP_SIZE; s <<= 1) {{
+            uint other[RANK_WORDS];
+            [ForceUnroll]
+            for (uint w = 0; w < RANK_WORDS; w++)
+                other[w] = tid >= s ? s_ranks[w][tid - s] : 0;
+            GroupMemoryBarrierWithGroupSync();
+            [ForceUnroll]
+            for (uint w = 0; w < RANK_WORDS; w++)
+                s_ranks[w][tid] += other[w];
+            GroupMemoryBarrierWithGroupSync();
+        }}
+
+        if (valid) {{
+            uint rank = (s_ranks[word][tid] >> bit_shift) & 0xffff;
+            uint dst = s_counts[digit] + rank - 1;
+            keys_out[dst] = key;
+            if (HAS_VALUES)
+                values_out[dst] = values_in[value_offset + index];
+        }}
+        GroupMemoryBarrierWithGroupSync();
+
+        if (tid < RADIX)
+            s_counts[tid] += (s_ranks[tid / 2][GROUP_SIZE - 1] >> ((tid % 2) * 16)) & 0xffff;
+        GroupMemoryBarrierWithGroupSync();
+    }}
+}}
+"""
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.types.buffer import NDBuffer
+from slangpy.testing import helpers
+
+MODULE = r"""
+float scale(float a, float b) {
+    return a * b;
+}
+
+float3 offset(float3 a, float3 b, int count) {
+    return a + b * count;
+}
+
+struct Accumulator {
+    float value;
+    float scaled(float a, float b) {
+        return value + a * b;
+    }
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_specialize_args(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    a = np.random.rand(100).astype(np.float32)
+    res = module.scale.specialize_args({1: 2.0})(a, 2.0, _result="numpy")
+    assert np.allclose(res, a * 2)
+
+    res = module.offset.specialize_args({"b": spy.float3(1, 2, 3), "count": 2})(
+        spy.float3(1, 1, 1), b=spy.float3(1, 2, 3), count=2
+    )
+    assert np.allclose([res.x, res.y, res.z], [3, 5, 7])
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_specialize_args_method(device_type: DeviceType):
+    # Positional indices of method calls don't count the instance they're called on.
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    buffer = NDBuffer(device, module.Accumulator, 4)
+    buffer.copy_from_numpy(np.array([1, 2, 3, 4], dtype=np.float32))
+    instance = spy.InstanceList(module.Accumulator, buffer)
+
+    res = instance.scaled.specialize_args({1: 3.0})(2.0, 3.0)
+    assert np.allclose(res.to_numpy(), [7, 8, 9, 10])
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_adaptive_constants(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+    func = module.scale.adaptive_constants(threshold=3, max_variants=2)
+    variants = func.adaptive.variants
+
+    a = np.random.rand(100).astype(np.float32)
+    buffer = NDBuffer.from_numpy(device, a)
+    for i in range(5):
+        res = func(buffer, 2.0)
+        assert np.allclose(res.to_numpy(), a * 2)
+    # Specialized once the value was stable for 3 calls.
+    assert func.adaptive.variant_count == 1
+    assert list(variants[()].keys()) == [((1, ("float", 2.0)),)]
+
+    # A new value falls back to the generic kernel until it is stable too.
+    res = func(buffer, 3.0)
+    assert np.allclose(res.to_numpy(), a * 3)
+    assert func.adaptive.variant_count == 1
+    for i in range(3):
+        func(buffer, 3.0)
+    assert func.adaptive.variant_count == 2
+
+    # Existing variants are reused immediately, and the limit stops new ones.
+    res = func(buffer, 2.0)
+    assert np.allclose(res.to_numpy(), a * 2)
+    for i in range(5):
+        res = func(buffer, 4.0)
+    assert np.allclose(res.to_numpy(), a * 4)
+    assert func.adaptive.variant_count == 2
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_adaptive_constants_return_type(device_type: DeviceType):
+    # Calls through return type nodes get their own variants.
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+    func = module.scale.adaptive_constants(threshold=1)
+
+    a = np.random.rand(100).astype(np.float32)
+    res = func(a, 5.0, _result="numpy")
+    assert np.allclose(res, a * 5)
+    res = func(NDBuffer.from_numpy(device, a), 5.0)
+    assert np.allclose(res.to_numpy(), a * 5)
+    assert func.adaptive.variant_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
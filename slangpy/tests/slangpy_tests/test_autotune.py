@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType, uint3
+from slangpy.core.autotune import AutotuneTable, call_signature, get_autotune_table
+from slangpy.types.buffer import NDBuffer
+from slangpy.testing import helpers
+
+MODULE = r"""
+float add(float a, float b) {
+    return a + b;
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_thread_group_size_vectorized(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add", MODULE)
+
+    a = np.random.rand(1000).astype(np.float32)
+    b = np.random.rand(1000).astype(np.float32)
+    res = func.thread_group_size(uint3(128, 1, 1))(a, b, _result="numpy")
+    assert np.allclose(res, a + b)
+
+    # Sizes other than uint3(x, 1, 1) only apply to raw dispatches, so are ignored.
+    res = func.thread_group_size(uint3(8, 8, 1))(a, b, _result="numpy")
+    assert np.allclose(res, a + b)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_autotune(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add", MODULE)
+    spy.set_autotune_path(tmp_path / "autotune.json")
+    try:
+        a = NDBuffer.from_numpy(device, np.random.rand(64, 64).astype(np.float32))
+        b = NDBuffer.from_numpy(device, np.random.rand(64, 64).astype(np.float32))
+        res = NDBuffer.zeros(device, shape=(64, 64), dtype=float)
+
+        best = func.autotune(a, b, _result=res, iterations=2)
+        signature = call_signature(func, a, b, _result=res)
+        assert get_autotune_table().find(device, signature) == best
+
+        # The result is saved, and later calls with the same signature use it.
+        assert AutotuneTable(tmp_path / "autotune.json").find(device, signature) == best
+        func(a, b, _result=res)
+        assert np.allclose(res.to_numpy(), a.to_numpy() + b.to_numpy())
+
+        # Tuning only evicts the call data of the tuned signature.
+        other = NDBuffer.zeros(device, shape=(64,), dtype=float)
+        func(other, other, _result=other)
+        cache = func.module.call_data_cache
+        other_call_data = cache.find_call_data(call_signature(func, other, other, _result=other))
+        assert other_call_data is not None
+        func.autotune(a, b, _result=res, candidates=[spy.AutotuneConfig(thread_group_size=64)])
+        assert cache.find_call_data(signature) is None
+        assert cache.find_call_data(call_signature(func, other, other, _result=other)) is (
+            other_call_data
+        )
+
+        # Explicit candidates restrict the search.
+        config = spy.AutotuneConfig(call_group_shape=(8, 8))
+        assert func.autotune(a, b, _result=res, candidates=[config], iterations=1) == config
+    finally:
+        spy.set_autotune_path(None)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_autotune_shared_table(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    path = tmp_path / "autotune.json"
+
+    # Tables sharing a file, as separate processes would, keep each other's results.
+    first = AutotuneTable(path)
+    second = AutotuneTable(path)
+    first.store(device, "a", spy.AutotuneConfig(thread_group_size=32))
+    second.store(device, "b", spy.AutotuneConfig(thread_group_size=64))
+    first.store(device, "c", spy.AutotuneConfig(thread_group_size=128))
+
+    table = AutotuneTable(path)
+    assert len(table) == 3
+    assert table.find(device, "a") == spy.AutotuneConfig(thread_group_size=32)
+    assert table.find(device, "b") == spy.AutotuneConfig(thread_group_size=64)
+    assert table.find(device, "c") == spy.AutotuneConfig(thread_group_size=128)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
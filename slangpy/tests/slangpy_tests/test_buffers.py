@@ -13,6 +13,9 @@ float read_only(StructuredBuffer<float> buffer) {
 void write_only(RWStructuredBuffer<float> buffer) {
     buffer[0] = 0.0f;
 }
+float add(float a, float b) {
+    return a + b;
+}
 """
 
 
@@ -44,5 +47,95 @@ def test_buffer_usage_error(device_type: DeviceType):
         module.write_only(ro_buffer)
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_buffer_pool(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    pool = spy.get_buffer_pool(device)
+    pool.clear()
+    pool.reset_stats()
+
+    a = spy.NDBuffer(device, dtype=float, shape=(64,))
+    a_data = np.random.rand(64).astype(np.float32)
+    a.copy_from_numpy(a_data)
+
+    spy.set_buffer_pool(True)
+    try:
+        # Outputs that are still referenced are never handed out again.
+        res0 = module.add(a, 1.0)
+        res1 = module.add(a, 2.0)
+        assert res0.storage != res1.storage
+        assert np.allclose(res0.to_numpy(), a_data + 1.0)
+        assert np.allclose(res1.to_numpy(), a_data + 2.0)
+        assert pool.misses == 2
+        assert pool.bytes == 2 * 64 * 4
+
+        # Released outputs are reused once a later submit has finished, so a
+        # synchronous loop settles on a fixed set of buffers.
+        del res0, res1
+        device.wait()
+        for i in range(8):
+            res = module.add(a, float(i))
+            assert np.allclose(res.to_numpy(), a_data + float(i))
+            del res
+            device.wait()
+        assert pool.hits >= 6
+        assert pool.peak_bytes <= 3 * 64 * 4
+
+        pool.trim()
+        assert pool.buffer_count == 0
+        assert pool.bytes == 0
+    finally:
+        spy.set_buffer_pool(False)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_buffer_pool_limits(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    pool = spy.get_buffer_pool(device)
+    pool.clear()
+    pool.reset_stats()
+
+    spy.set_buffer_pool(True)
+    try:
+        # With no free bytes allowed, buffers of shapes that are not used again are
+        # released as soon as the GPU has finished with them, rather than kept forever.
+        pool.max_free_bytes = 0
+        for n in range(1, 17):
+            a = spy.NDBuffer(device, dtype=float, shape=(n,))
+            a.copy_from_numpy(np.arange(n, dtype=np.float32))
+            res = module.add(a, 1.0)
+            assert np.allclose(res.to_numpy(), np.arange(n) + 1.0)
+            del res
+            device.wait()
+        assert pool.evictions > 0
+        assert pool.free_bytes == 0
+        assert pool.bytes <= 3 * 16 * 4
+
+        # Free buffers that are not reused are released after max_idle_submits submits.
+        pool.clear()
+        pool.max_free_bytes = 1 << 30
+        pool.max_idle_submits = 2
+        res = module.add(a, 1.0)
+        del res
+        desc = spy.BufferDesc()
+        desc.size = 4
+        desc.usage = spy.BufferUsage.shader_resource
+        for _ in range(6):
+            encoder = device.create_command_encoder()
+            device.wait_for_submit(device.submit_command_buffer(encoder.finish()))
+            pool.acquire(desc)
+        assert pool.bytes < 16 * 4
+    finally:
+        pool.max_free_bytes = 256 * 1024 * 1024
+        pool.max_idle_submits = 64
+        spy.set_buffer_pool(False)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+from pathlib import Path
+
 import pytest
+import slangpy as spy
 from slangpy import DeviceType
+from slangpy.core.kernelcache import KernelCache, get_kernel_cache
 from slangpy.types.buffer import NDBuffer
 from slangpy.testing import helpers
 
@@ -58,5 +62,180 @@ def test_share_compute_pipeline_with_same_mapping(device_type: DeviceType):
     assert float_float_cd.pipeline == mapped_float_float_cd.pipeline
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_data_cache_lru_eviction(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    func = m.foo.as_func()
+    cache = m.call_data_cache
+    cache.capacity = 2
+    cache.reset_stats()
+
+    float_cd = func.debug_build_call_data(1.0, 2.0)
+    int_cd = func.debug_build_call_data(1, 2)
+    assert cache.size == 2
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+    # Touch float entry so int entry becomes least recently used
+    assert func.debug_build_call_data(1.0, 2.0) == float_cd
+    assert cache.hits == 1
+
+    # Adding a third signature evicts the int entry
+    func.debug_build_call_data(1, 2.0)
+    assert cache.size == 2
+    assert cache.evictions == 1
+    assert func.debug_build_call_data(1.0, 2.0) == float_cd
+    assert func.debug_build_call_data(1, 2) != int_cd
+
+    # Shrinking capacity evicts immediately
+    cache.capacity = 1
+    assert cache.size == 1
+
+    cache.clear()
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_guards(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    func = m.foo.as_func()
+    cache = m.call_data_cache
+    cache.reset_stats()
+
+    b0 = NDBuffer(m.device, program_layout=m.layout, dtype=float, shape=(100,))
+    b1 = NDBuffer(m.device, program_layout=m.layout, dtype=float, shape=(100,))
+
+    # Repeat calls pass the guard, but still count as cache hits
+    buffer_cd = func.debug_build_call_data(b0, 2.0)
+    assert func.debug_build_call_data(b1, 3.0) == buffer_cd
+    assert func.debug_build_call_data(b0, b=4.0) != buffer_cd
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+    # Changing an argument's type or dimensionality fails the guard
+    int_cd = func.debug_build_call_data(b0, 2)
+    assert int_cd != buffer_cd
+    b2 = NDBuffer(m.device, program_layout=m.layout, dtype=float, shape=(10, 10))
+    assert func.debug_build_call_data(b2, 2) != int_cd
+    assert func.debug_build_call_data(b0, 2.0) == buffer_cd
+
+    # Clearing the cache invalidates the guard
+    cache.clear()
+    assert func.debug_build_call_data(b0, 2.0) != buffer_cd
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_persistent_kernel_cache(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    spy.set_kernel_cache_path(tmp_path)
+    try:
+        cache = get_kernel_cache()
+        assert cache is not None
+
+        # First module generates the kernel and writes it to disk
+        m0 = helpers.create_module(device, BASE_MODULE)
+        m0.foo(1.0, 2.0)
+        assert cache.misses == 1
+        assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+        # A second module with the same source loads the generated code from disk
+        m1 = helpers.create_module(device, BASE_MODULE)
+        assert m1.foo(1.0, 2.0) == 3.0
+        assert cache.hits == 1
+    finally:
+        spy.set_kernel_cache_path(None)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_kernel_cache_fingerprint(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    cache = KernelCache(tmp_path / "cache")
+
+    common = tmp_path / "kernel_cache_common.slang"
+    common.write_text("float scale() { return 2.0; }\n")
+    path = tmp_path / "kernel_cache_main.slang"
+    path.write_text(
+        'import "kernel_cache_common.slang";\nfloat mul(float x) { return x * scale(); }\n'
+    )
+    module = spy.Module.load_from_file(device, str(path))
+    entry = cache._entry_path(module, "mul")
+
+    # Files imported by the module are part of the fingerprint, which is recalculated
+    # after a hot reload.
+    common.write_text("float scale() { return 3.0; }\n")
+    fingerprint = cache.module_fingerprint(module)
+    assert cache._entry_path(module, "mul") == entry
+    module.on_hot_reload()
+    assert cache._entry_path(module, "mul") != entry
+    assert cache.module_fingerprint(module) == fingerprint
+
+    # Modules loaded from source are identified by their source, not just their name.
+    a = spy.Module.load_from_source(device, "kernel_cache_source", "float f() { return 1.0; }")
+    b = spy.Module.load_from_source(device, "kernel_cache_source", "float f() { return 2.0; }")
+    assert cache.module_fingerprint(a) != cache.module_fingerprint(b)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_precompile_from_arg_specs(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    m = load_test_module(device_type)
+    assert m is not None
+
+    func = m.foo.as_func()
+    cache = m.call_data_cache
+    cache.reset_stats()
+
+    # Precompile for a 1D float buffer + scalar, without any real argument values
+    (cd,) = func.precompile([[spy.ArgSpec(NDBuffer, dtype="float", ndim=1), 1.0]])
+    assert cache.size == 1
+
+    # A real call with matching types hits the precompiled call data
+    b0 = NDBuffer(device, program_layout=m.layout, dtype=float, shape=(100,))
+    assert func.debug_build_call_data(b0, 2.0) == cd
+    assert cache.hits == 1
+
+    # Module level warmup via manifest
+    res = m.warmup({"foo": [spy.CallSpec(a=1, b=2)]})
+    assert len(res["foo"]) == 1
+    assert func.debug_build_call_data(a=5, b=6) == res["foo"][0]
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compile_async(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    func = m.foo.as_func()
+
+    # Concurrent requests for different and identical kernels
+    futures = [
+        func.compile_async(spy.ArgSpec(NDBuffer, dtype="float", ndim=1), 1.0),
+        func.compile_async(spy.ArgSpec(NDBuffer, dtype="float", ndim=2), 1.0),
+        func.compile_async(spy.ArgSpec(NDBuffer, dtype="float", ndim=2), 1.0),
+    ]
+
+    # Loading another module while they build waits for the session rather than racing.
+    m2 = load_test_module(device_type)
+    assert m2.build_lock is m.build_lock
+    assert m2.foo is not None
+
+    results = [f.result() for f in futures]
+
+    # Identical kernels share a pipeline, and completed builds land in the call data cache
+    assert results[0].pipeline != results[1].pipeline
+    assert results[1].pipeline == results[2].pipeline
+    assert len(m.pipeline_cache) == 2
+    b0 = NDBuffer(m.device, program_layout=m.layout, dtype=float, shape=(100,))
+    assert func.debug_build_call_data(b0, 2.0) == results[0]
+
+    # Module level manifest
+    res = m.compile_async({"foo": [spy.CallSpec(a=1, b=2)]})
+    assert func.debug_build_call_data(a=5, b=6) == res["foo"][0].result()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.slangpy import Shape
+from slangpy.testing import helpers
+
+MODULE = r"""
+uint visit_2d(int2 cell, uint3 thread) {
+    return thread.x;
+}
+
+uint visit_3d(int3 cell, uint3 thread) {
+    return thread.x;
+}
+
+int2 cell_2d(int2 cell) {
+    return cell;
+}
+"""
+
+
+def check_visit_order(order: np.ndarray):
+    # Every element is visited by exactly one thread.
+    assert np.array_equal(np.sort(order.reshape(-1)), np.arange(order.size))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("order", ["tiled", "morton", "hilbert"])
+def test_call_order_2d(device_type: DeviceType, order: str):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    # Not a multiple of the tile size, so partial tiles are covered too.
+    shape = (37, 50)
+    res = module.visit_2d.call_order(order, tile_size=8)(
+        spy.grid(shape), spy.thread_id(), _result="numpy"
+    )
+    check_visit_order(res)
+
+    tile = res[:8, :8]
+    assert tile.min() == 0 and tile.max() == 63
+    if order == "tiled":
+        assert res[1, 0] == 8
+    elif order == "morton":
+        assert res[0, 1] == 1 and res[1, 0] == 2 and res[1, 1] == 3
+    else:
+        # Consecutive threads in a Hilbert curve visit neighbouring elements.
+        coords = np.argwhere(tile >= 0)[np.argsort(tile.reshape(-1))]
+        assert np.all(np.abs(np.diff(coords, axis=0)).sum(axis=1) == 1)
+
+    # Arguments still read and write the element of their call id.
+    cells = module.cell_2d.call_order(order)(spy.grid(shape), _result="numpy")
+    assert np.array_equal(cells, np.indices(shape).transpose(1, 2, 0))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_order_3d(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    shape = (9, 12, 10)
+    res = module.visit_3d.call_order("morton", dims=3, tile_size=4)(
+        spy.grid(shape), spy.thread_id(), _result="numpy"
+    )
+    check_visit_order(res)
+    assert res[:4, :4, :4].max() == 63
+    assert res[1, 0, 0] == 4
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_order_call_groups(device_type: DeviceType):
+    # With a call group shape, the order applies to the grid of groups.
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    shape = (64, 64)
+    cells = module.cell_2d.call_group_shape(Shape((4, 4))).call_order("morton", tile_size=4)(
+        spy.grid(shape), _result="numpy"
+    )
+    assert np.array_equal(cells, np.indices(shape).transpose(1, 2, 0))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_order_invalid(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+
+    with pytest.raises(ValueError):
+        module.visit_2d.call_order("zigzag")
+    with pytest.raises(ValueError):
+        module.visit_3d.call_order("hilbert", dims=3)
+    with pytest.raises(ValueError):
+        module.visit_2d.call_order("morton", tile_size=6)
+    with pytest.raises(Exception, match="call_order"):
+        module.visit_2d.call_order("morton", dims=3)(
+            spy.grid((4, 4)), spy.thread_id(), _result="numpy"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+import threading
+from typing import Any
+
 import pytest
 import numpy as np
 from slangpy import Module
 from slangpy import DeviceType, float3
+from slangpy.types.buffer import NDBuffer
 from slangpy.experimental.diffbuffer import NDDifferentiableBuffer
 from slangpy.testing import helpers
 
@@ -66,5 +70,146 @@ def test_command_buffer(device_type: DeviceType, use_arg: bool):
     polynomial(a, b, _result=res, _append_to=None)
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_graph(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    polynomial = m.polynomial.as_func()
+
+    a = NDBuffer(m.device, float3, 10)
+    b = NDBuffer(m.device, float3, 10)
+    res = NDBuffer(m.device, float3, 10)
+    res2 = NDBuffer(m.device, float3, 10)
+
+    a_data = np.random.rand(10, 3).astype(np.float32)
+    b_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(a, a_data.flatten(), 3)
+    helpers.write_ndbuffer_from_numpy(b, b_data.flatten(), 3)
+
+    with m.capture() as graph:
+        x = graph.input("x", a)
+        polynomial(x, b, _result=res)
+        polynomial(res, b, _result=res2)
+    assert len(graph) == 2
+
+    # Nothing should have happened during capture
+    res_data = helpers.read_ndbuffer_from_numpy(res).reshape(-1, 3)
+    assert not np.allclose(res_data, a_data * a_data + b_data + 1)
+
+    def check(x_data: np.ndarray):
+        expected = x_data * x_data + b_data + 1
+        res_data = helpers.read_ndbuffer_from_numpy(res).reshape(-1, 3)
+        assert np.allclose(res_data, expected)
+        res2_data = helpers.read_ndbuffer_from_numpy(res2).reshape(-1, 3)
+        assert np.allclose(res2_data, expected * expected + b_data + 1)
+
+    graph.replay()
+    check(a_data)
+
+    # Replay with a replaced input
+    c = NDBuffer(m.device, float3, 10)
+    c_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(c, c_data.flatten(), 3)
+    graph.replay(x=c)
+    check(c_data)
+
+    with pytest.raises(ValueError):
+        graph.replay(y=c)
+
+    # Replaced inputs must keep the signature they were captured with
+    with pytest.raises(ValueError):
+        graph.replay(x=NDBuffer(m.device, float, 10))
+    with pytest.raises(ValueError):
+        graph.replay(x=NDBuffer(m.device, float3, (2, 5)))
+
+    # Only calls made by the capturing thread are recorded
+    out = NDBuffer(m.device, float3, 10)
+    with m.capture() as other_graph:
+        thread = threading.Thread(target=lambda: polynomial(a, b, _result=out))
+        thread.start()
+        thread.join()
+    assert len(other_graph) == 0
+    res_data = helpers.read_ndbuffer_from_numpy(out).reshape(-1, 3)
+    assert np.allclose(res_data, a_data * a_data + b_data + 1)
+
+    # Captured calls must pass an explicit result
+    with pytest.raises(ValueError):
+        with m.capture():
+            polynomial(a, b)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_many(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    polynomial = m.polynomial.as_func()
+
+    # Scalar calls return values
+    results = polynomial.call_many(
+        [
+            [float3(1, 2, 3), float3(1, 1, 1)],
+            {"a": float3(2, 2, 2), "b": float3(0, 0, 0)},
+        ]
+    )
+    assert results[0] == float3(3, 6, 11)
+    assert results[1] == float3(5, 5, 5)
+
+    # Buffer calls, mixing implicit and explicit results
+    a_data = [np.random.rand(10, 3).astype(np.float32) for _ in range(3)]
+    buffers = []
+    for data in a_data:
+        buffer = NDBuffer(m.device, float3, 10)
+        helpers.write_ndbuffer_from_numpy(buffer, data.flatten(), 3)
+        buffers.append(buffer)
+    res = NDBuffer(m.device, float3, 10)
+
+    calls: list[dict[str, Any]] = [{"a": x, "b": x} for x in buffers]
+    calls[1]["_result"] = res
+    results = polynomial.call_many(calls)
+    assert results[1] is res
+    for data, result in zip(a_data, results):
+        res_data = helpers.read_ndbuffer_from_numpy(result).reshape(-1, 3)
+        assert np.allclose(res_data, data * data + data + 1)
+
+    # Positional arguments zipped from lists
+    results = polynomial.map_calls(buffers, buffers)
+    for data, result in zip(a_data, results):
+        res_data = helpers.read_ndbuffer_from_numpy(result).reshape(-1, 3)
+        assert np.allclose(res_data, data * data + data + 1)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_many_dependent(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    polynomial = m.polynomial.as_func()
+
+    # Each call reads the result of the one before, so needs a barrier between them.
+    data = np.random.rand(10, 3).astype(np.float32)
+    a = NDBuffer(m.device, float3, 10)
+    helpers.write_ndbuffer_from_numpy(a, data.flatten(), 3)
+    b = NDBuffer(m.device, float3, 10)
+    c = NDBuffer(m.device, float3, 10)
+    zero = float3(0, 0, 0)
+    results = polynomial.call_many(
+        [
+            {"a": a, "b": zero, "_result": b},
+            {"a": b, "b": zero, "_result": c},
+            {"a": c, "b": zero, "_result": a},
+        ]
+    )
+    assert results[0] is b and results[1] is c and results[2] is a
+
+    # With b zero, each call squares its input (plus 1 for the constant term).
+    expected = data
+    for _ in range(3):
+        expected = expected * expected + 1
+    res_data = helpers.read_ndbuffer_from_numpy(a).reshape(-1, 3)
+    assert np.allclose(res_data, expected)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.core.module import _normalize_path
+from slangpy.core import warmup
+from slangpy.testing import helpers
+
+
+def load_file_module(device: spy.Device, path: Path, source: str) -> spy.Module:
+    path.write_text(source)
+    return spy.Module.load_from_file(device, str(path))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_hot_reload_invalidates_dependents(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    common = tmp_path / "hot_reload_common.slang"
+    common.write_text("float scale() { return 2.0; }\n")
+    path_a = tmp_path / "hot_reload_a.slang"
+    path_b = tmp_path / "hot_reload_b.slang"
+    module_a = load_file_module(
+        device,
+        path_a,
+        'import "hot_reload_common.slang";\nfloat mul(float x) { return x * scale(); }\n',
+    )
+    module_b = load_file_module(device, path_b, "float add(float x) { return x + 1.0; }\n")
+
+    assert _normalize_path(common) in module_a.dependencies
+    assert _normalize_path(common) not in module_b.dependencies
+
+    x = np.arange(4, dtype=np.float32)
+    assert np.allclose(module_a.mul(x, _result="numpy"), x * 2)
+    assert np.allclose(module_b.add(x, _result="numpy"), x + 1)
+    assert len(module_a.call_data_cache) > 0
+    assert len(module_b.call_data_cache) > 0
+
+    # Only modules importing the changed file discard their kernels and call data.
+    pipelines_b = dict(module_b.pipeline_cache)
+    call_data_b = len(module_b.call_data_cache)
+    assert len(pipelines_b) > 0
+    changed = {_normalize_path(common)}
+    module_a.on_hot_reload(changed)
+    module_b.on_hot_reload(changed)
+    assert len(module_a.call_data_cache) == 0
+    assert len(module_a.pipeline_cache) == 0
+    assert len(module_b.call_data_cache) == call_data_b
+    assert module_b.pipeline_cache == pipelines_b
+    assert np.allclose(module_a.mul(x, _result="numpy"), x * 2)
+    assert np.allclose(module_b.add(x, _result="numpy"), x + 1)
+    assert len(module_b.call_data_cache) == call_data_b
+    assert module_b.pipeline_cache == pipelines_b
+
+    # Without changed files, everything is invalidated.
+    module_b.on_hot_reload()
+    assert len(module_b.call_data_cache) == 0
+    assert len(module_b.pipeline_cache) == 0
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_hot_reload_device(device_type: DeviceType, tmp_path: Path):
+    # Reload through the device, which recreates sessions and invalidates all reflection,
+    # including that used by the cached call data of modules not affected by the change.
+    device = helpers.get_device(device_type, use_cache=False)
+    try:
+        common = tmp_path / "hot_reload_device_common.slang"
+        common.write_text("float scale() { return 2.0; }\n")
+        module_a = load_file_module(
+            device,
+            tmp_path / "hot_reload_device_a.slang",
+            'import "hot_reload_device_common.slang";\n'
+            "float mul(float x) { return x * scale(); }\n",
+        )
+        module_b = load_file_module(
+            device,
+            tmp_path / "hot_reload_device_b.slang",
+            "float add(float x) { return x + 1.0; }\n",
+        )
+
+        x = spy.NDBuffer.from_numpy(device, np.arange(4, dtype=np.float32))
+        assert np.allclose(module_a.mul(x).to_numpy(), np.arange(4) * 2)
+        assert np.allclose(module_b.add(x).to_numpy(), np.arange(4) + 1)
+
+        common.write_text("float scale() { return 3.0; }\n")
+        device.reload_all_programs([common])
+
+        # Both allocate NDBuffer results, which reads the element layout from reflection.
+        assert np.allclose(module_a.mul(x).to_numpy(), np.arange(4) * 3)
+        assert np.allclose(module_b.add(x).to_numpy(), np.arange(4) + 1)
+    finally:
+        device.close()
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_hot_reload_recompile(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    path = tmp_path / "hot_reload_recompile.slang"
+    module = load_file_module(device, path, "float add(float x) { return x + 1.0; }\n")
+
+    compile_workers = warmup._COMPILE_WORKERS
+    spy.set_compile_workers(1)
+    spy.set_hot_reload_recompile(4)
+    try:
+        x = np.arange(4, dtype=np.float32)
+        module.add(x, _result="numpy")
+        module.on_hot_reload({_normalize_path(path)})
+
+        # Work is run in order with a single worker, so once this finishes the kernel has
+        # been rebuilt in the background.
+        warmup._get_compile_executor().submit(lambda: None).result()
+        assert len(module.call_data_cache) > 0
+        assert np.allclose(module.add(x, _result="numpy"), x + 1)
+    finally:
+        spy.set_hot_reload_recompile(0)
+        spy.set_compile_workers(compile_workers)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_hot_reload_shared_modules(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    path = tmp_path / "hot_reload_shared.slang"
+    module = load_file_module(device, path, "float add(float x) { return x + 1.0; }\n")
+
+    # A second module wrapping the same device module shares its caches, but has its own
+    # functions, which must be reset by a reload of either.
+    shared = spy.Module(module.device_module)
+    assert shared.call_data_cache is module.call_data_cache
+    x = np.arange(4, dtype=np.float32)
+    assert np.allclose(shared.add(x, _result="numpy"), x + 1)
+    assert "add" in shared._attr_cache
+
+    module.on_hot_reload({_normalize_path(path)})
+    assert len(shared.call_data_cache) == 0
+    assert "add" not in shared._attr_cache
+    assert np.allclose(shared.add(x, _result="numpy"), x + 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.types.buffer import NDBuffer
+from slangpy.testing import helpers
+
+MODULE = r"""
+float add_one(float a) {
+    return a + 1;
+}
+
+float sum_row(float a, float b) {
+    return a + b;
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_indirect_after_compact(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_one", MODULE)
+
+    data = np.random.rand(1000).astype(np.float32)
+    mask = (data > 0.5).astype(np.uint32)
+    alive, count = spy.primitives.compact(
+        NDBuffer.from_numpy(device, data), NDBuffer.from_numpy(device, mask)
+    )
+
+    # Results start zeroed so elements beyond the count can be checked.
+    res = NDBuffer.zeros(device, shape=(1000,), dtype=float)
+    func.indirect(count)(alive, _result=res)
+
+    kept = data[mask != 0]
+    res_data = res.to_numpy()
+    assert np.allclose(res_data[: len(kept)], kept + 1)
+    assert np.all(res_data[len(kept) :] == 0)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_indirect_inner_dims(device_type: DeviceType):
+    # Only the outermost dimension is sized from the count.
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "sum_row", MODULE)
+
+    a = np.random.rand(64, 8).astype(np.float32)
+    b = np.random.rand(64, 8).astype(np.float32)
+    count = device.create_buffer(
+        data=np.array([7, 20], dtype=np.uint32), usage=spy.BufferUsage.shader_resource
+    )
+
+    res = NDBuffer.zeros(device, shape=(64, 8), dtype=float)
+    command_encoder = device.create_command_encoder()
+    func.indirect(count, offset=1).append_to(
+        command_encoder, NDBuffer.from_numpy(device, a), NDBuffer.from_numpy(device, b), _result=res
+    )
+    device.submit_command_buffer(command_encoder.finish())
+
+    res_data = res.to_numpy()
+    assert np.allclose(res_data[:20], (a + b)[:20])
+    assert np.all(res_data[20:] == 0)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_indirect_clamped(device_type: DeviceType):
+    # Counts beyond the call shape are clamped to it.
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_one", MODULE)
+
+    data = np.random.rand(100).astype(np.float32)
+    count = device.create_buffer(
+        data=np.array([1000], dtype=np.uint32), usage=spy.BufferUsage.shader_resource
+    )
+    res = func.indirect(count)(NDBuffer.from_numpy(device, data), _result="numpy")
+    assert np.allclose(res, data + 1)
+
+    with pytest.raises(ValueError):
+        func.indirect(count, offset=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import threading
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.testing import helpers
+from slangpy.types import NDBuffer
+
+MODULE = r"""
+import "slangpy";
+float square(float x) {
+    return x * x;
+}
+float add(float a, float b) {
+    return a + b;
+}
+float negate(float x) {
+    return -x;
+}
+void write_value(float x, out float y) {
+    y = x;
+}
+"""
+
+
+def load_test_module(device_type: DeviceType, name: str):
+    # Fused kernels import the module by name, so it needs a valid identifier.
+    device = helpers.get_device(device_type)
+    return spy.Module.load_from_source(device, name, MODULE)
+
+
+def create_buffer(module: spy.Module, data: np.ndarray) -> NDBuffer:
+    buffer = NDBuffer(module.device, dtype=float, shape=data.shape)
+    buffer.copy_from_numpy(data)
+    return buffer
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_lazy_fusion(device_type: DeviceType):
+    module = load_test_module(device_type, "lazy_fusion_module")
+
+    x = np.random.rand(64).astype(np.float32)
+    y = np.random.rand(64).astype(np.float32)
+    xb = create_buffer(module, x)
+    yb = create_buffer(module, y)
+
+    with spy.lazy():
+        a = module.square(xb)
+        b = module.add(a, b=yb)
+        c = module.negate(b)
+    assert isinstance(c, spy.LazyValue)
+    assert not c.is_evaluated
+
+    # The whole chain runs as one fused kernel, so the module's own functions
+    # are never built.
+    res = c.eval()
+    assert c.is_evaluated
+    assert c.eval() is res
+    assert np.allclose(res.to_numpy(), -(x * x + y))
+    assert module.call_data_cache.size == 0
+
+    # Intermediates are not materialized, but can still be evaluated.
+    assert not a.is_evaluated
+    assert np.allclose(a.eval().to_numpy(), x * x)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_lazy_values_in_normal_calls(device_type: DeviceType):
+    module = load_test_module(device_type, "lazy_values_module")
+
+    x = np.random.rand(16).astype(np.float32)
+    xb = create_buffer(module, x)
+
+    with spy.lazy():
+        a = module.square(xb)
+
+        # Calls that can't be deferred run immediately.
+        out = NDBuffer(module.device, dtype=float, shape=(16,))
+        assert module.write_value(xb, out) is None
+        assert np.allclose(out.to_numpy(), x)
+
+    # Deferred values passed to normal calls are evaluated first.
+    res = module.add(a, 1.0)
+    assert a.is_evaluated
+    assert np.allclose(res.to_numpy(), x * x + 1.0)
+
+    # Including calls appended to a command encoder.
+    with spy.lazy():
+        b = module.negate(xb)
+    out = NDBuffer(module.device, dtype=float, shape=(16,))
+    command_encoder = module.device.create_command_encoder()
+    module.add.append_to(command_encoder, b, 2.0, _result=out)
+    module.device.submit_command_buffer(command_encoder.finish())
+    assert b.is_evaluated
+    assert np.allclose(out.to_numpy(), 2.0 - x)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_lazy_other_threads(device_type: DeviceType):
+    module = load_test_module(device_type, "lazy_threads_module")
+
+    x = np.random.rand(16).astype(np.float32)
+    xb = create_buffer(module, x)
+
+    # Calls made by other threads while one is in lazy mode run immediately.
+    results = []
+    with spy.lazy():
+        a = module.square(xb)
+        thread = threading.Thread(target=lambda: results.append(module.negate(xb)))
+        thread.start()
+        thread.join()
+    assert isinstance(a, spy.LazyValue)
+    assert not isinstance(results[0], spy.LazyValue)
+    assert np.allclose(results[0].to_numpy(), -x)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_lazy_unimportable_module(device_type: DeviceType):
+    # Modules whose names aren't identifiers can't be imported by the fused module,
+    # so their chains are evaluated call by call.
+    module = load_test_module(device_type, "lazy-unimportable-module")
+
+    x = np.random.rand(16).astype(np.float32)
+    xb = create_buffer(module, x)
+
+    with spy.lazy():
+        c = module.negate(module.square(xb))
+    assert np.allclose(c.eval().to_numpy(), -(x * x))
+    assert module.call_data_cache.size == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
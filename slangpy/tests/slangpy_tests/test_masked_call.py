@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.types.buffer import NDBuffer
+from slangpy.testing import helpers
+
+MODULE = r"""
+float add_one(float a) {
+    return a + 1;
+}
+
+void scale(inout float a, float b) {
+    a *= b;
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_gather(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "add_one", MODULE)
+
+    data = np.random.rand(32, 16).astype(np.float32)
+    indices = np.array([0, 5, 17, 100, 511], dtype=np.uint32)
+
+    res = NDBuffer.zeros(device, shape=(32, 16), dtype=float)
+    func.gather(NDBuffer.from_numpy(device, indices))(
+        NDBuffer.from_numpy(device, data), _result=res
+    )
+
+    expected = np.zeros(32 * 16, dtype=np.float32)
+    expected[indices] = data.reshape(-1)[indices] + 1
+    assert np.allclose(res.to_numpy().reshape(-1), expected)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_where(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "scale", MODULE)
+
+    data = np.random.rand(64, 64).astype(np.float32)
+    mask = (np.random.rand(64, 64) < 0.05).astype(np.uint32)
+
+    buffer = NDBuffer.from_numpy(device, data)
+    func.where(NDBuffer.from_numpy(device, mask))(buffer, 2.0)
+
+    expected = np.where(mask != 0, data * 2, data)
+    assert np.allclose(buffer.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_where_empty_mask(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    func = helpers.create_function_from_module(device, "scale", MODULE)
+
+    data = np.random.rand(100).astype(np.float32)
+    buffer = NDBuffer.from_numpy(device, data)
+    func.where(NDBuffer.zeros(device, shape=(100,), dtype="uint"))(buffer, 2.0)
+    assert np.all(buffer.to_numpy() == data)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_nonzero(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    mask = (np.random.rand(100000) < 0.3).astype(np.int32)
+
+    indices, count = spy.primitives.nonzero(NDBuffer.from_numpy(device, mask))
+    expected = np.flatnonzero(mask)
+    assert count.to_numpy()[0] == len(expected)
+    assert np.all(indices.to_numpy()[: len(expected)] == expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -159,5 +159,34 @@ def test_soa_particles(device_type: DeviceType):
     assert np.allclose(data, [0.5, 0])
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_shared_module_state(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    device_module = device.load_module("test_modules.slang")
+
+    # Modules with the same device module, links and options share reflection and caches.
+    a = Module(device_module)
+    b = Module(device_module)
+    assert b.layout is a.layout
+    assert b.call_data_cache is a.call_data_cache
+    assert b.pipeline_cache is a.pipeline_cache
+
+    # Different options get their own.
+    c = Module(device_module, options={"strict_broadcasting": False})
+    assert c.layout is not a.layout
+    assert c.call_data_cache is not a.call_data_cache
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_load_from_source_reuses_module(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    source = "float add(float a, float b) { return a + b; }\n"
+    a = Module.load_from_source(device, "test_load_from_source_reuses_module", source)
+    b = Module.load_from_source(device, "test_load_from_source_reuses_module", source)
+    assert b.device_module is a.device_module
+    assert b.layout is a.layout
+    assert b.add(1.0, 2.0) == 3.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
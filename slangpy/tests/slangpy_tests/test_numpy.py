@@ -1,4 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from pathlib import Path
+
 import numpy as np
 import pytest
 
@@ -213,5 +215,104 @@ def test_numpy_matrix_as_result(device_type: DeviceType):
             assert np.allclose(res, (np.arange(1, N + 1) + 2.0).reshape(R, C))
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_numpy_buffer_pool(device_type: DeviceType):
+
+    module = load_test_module(device_type)
+
+    pool = spy.get_buffer_pool(module.device)
+    pool.clear()
+    pool.reset_stats()
+
+    spy.set_buffer_pool(True)
+    try:
+        # Repeated calls with the same shapes reuse pooled device and read back
+        # buffers, which must not leak data between calls.
+        for _ in range(3):
+            a = np.random.rand(16, 4).astype(np.float32)
+            b = np.random.rand(16, 4).astype(np.float32)
+            res = np.zeros_like(a)
+            module.add_floats(a, b, _result=res)
+            assert np.allclose(res, a + b)
+
+            res = module.add_floats(a, b, _result="numpy")
+            assert np.allclose(res, a + b)
+
+        # Different shape
+        a = np.random.rand(8).astype(np.float32)
+        res = module.add_floats(a, a, _result="numpy")
+        assert np.allclose(res, a + a)
+        assert pool.hits > 0
+    finally:
+        spy.set_buffer_pool(False)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_numpy_staging_pool(device_type: DeviceType):
+
+    module = load_test_module(device_type)
+
+    pool = spy.get_buffer_pool(module.device)
+    pool.clear()
+    pool.reset_stats()
+
+    # Numpy staging buffers are pooled without enabling pooling of other buffers.
+    spy.set_numpy_staging_pool(True)
+    try:
+        for _ in range(3):
+            a = np.random.rand(16, 4).astype(np.float32)
+            b = np.random.rand(16, 4).astype(np.float32)
+            res = np.zeros_like(a)
+            module.add_floats(a, b, _result=res)
+            assert np.allclose(res, a + b)
+        assert pool.hits > 0
+    finally:
+        spy.set_numpy_staging_pool(False)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_numpy_stream(device_type: DeviceType, tmp_path: Path):
+
+    module = load_test_module(device_type)
+
+    # 1000 isn't a multiple of the chunk size, so the last chunk is partial.
+    a = np.random.rand(1000).astype(np.float32)
+    b = np.random.rand(1000).astype(np.float32)
+
+    # Results as a generator of chunks
+    chunks = list(module.add_floats.stream(chunk=256)(a, b))
+    assert [len(x) for x in chunks] == [256, 256, 256, 232]
+    assert np.allclose(np.concatenate(chunks), a + b)
+
+    # Inputs and results as memmaps, with a broadcast scalar argument
+    src = np.lib.format.open_memmap(
+        tmp_path / "src.npy", mode="w+", dtype=np.float32, shape=(1000, 3)
+    )
+    src[:] = np.random.rand(1000, 3)
+    dst = np.lib.format.open_memmap(
+        tmp_path / "dst.npy", mode="w+", dtype=np.float32, shape=(1000, 3)
+    )
+    res = module.add_floats.stream(chunk=100, depth=3)(src, 2.0, _result=dst)
+    assert res is dst
+    assert np.allclose(dst, src + 2.0)
+
+    # A broadcast array before the streamed one is passed whole to every chunk
+    row = np.random.rand(1, 3).astype(np.float32)
+    chunks = list(module.add_floats.stream(chunk=300)(row, src))
+    assert [len(x) for x in chunks] == [300, 300, 300, 100]
+    assert np.allclose(np.concatenate(chunks), row + src)
+
+    # The partial last chunk is the first placed in its slot, so the slot's buffers
+    # must still hold a full chunk
+    a = np.random.rand(300).astype(np.float32)
+    chunks = list(module.add_floats.stream(chunk=256, depth=2)(a, a))
+    assert [len(x) for x in chunks] == [256, 44]
+    assert np.allclose(np.concatenate(chunks), a + a)
+
+    # Empty inputs produce no chunks
+    empty = np.zeros((0,), dtype=np.float32)
+    assert list(module.add_floats.stream(chunk=256)(empty, empty)) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 
-from slangpy import DeviceType, pack, Tensor
+from slangpy import DeviceType, float3, pack, Tensor
 from slangpy.testing import helpers
 
 
@@ -123,5 +123,93 @@ float inc(Val val) {
     assert np.array_equal(results, np.array([2, 3, 4, 5], dtype=np.float32))
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_update_struct(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    function = helpers.create_function_from_module(
+        device,
+        "sum",
+        r"""
+struct Light {
+    float intensity;
+    float3 color;
+}
+struct Scene {
+    int count;
+    Light lights[2];
+}
+float sum(Scene scene) {
+    float res = scene.count;
+    for (int i = 0; i < 2; i++)
+        res += scene.lights[i].intensity * scene.lights[i].color.x;
+    return res;
+}
+""",
+    )
+
+    scene = {
+        "_type": "Scene",
+        "count": 1,
+        "lights": [
+            {"_type": "Light", "intensity": 1.0, "color": float3(1, 0, 0)},
+            {"_type": "Light", "intensity": 2.0, "color": float3(1, 0, 0)},
+        ],
+    }
+    fv = pack(function.module, scene)
+    signature = fv.slangpy_signature
+    shader_object = fv.shader_object
+    assert function(fv) == 4.0
+
+    # Updates with unchanged types patch the existing shader object.
+    fv.update("lights.1.intensity", 5.0)
+    assert function(fv) == 7.0
+    fv.update({"count": 3, ("lights", 0, "color"): float3(2, 0, 0)})
+    assert function(fv) == 10.0
+    assert fv.slangpy_signature == signature
+    assert fv.shader_object is shader_object
+    assert scene["count"] == 3
+
+    # A value of a different type packs the argument again.
+    fv.update("lights.0.intensity", 1)
+    assert fv.slangpy_signature != signature
+    assert function(fv) == 10.0
+
+    with pytest.raises(KeyError):
+        fv.update("lights.2.intensity", 1.0)
+
+    # A bad path in a batch of updates leaves every field unchanged.
+    with pytest.raises(KeyError):
+        fv.update({"count": 4, "lights.2.intensity": 1.0})
+    assert scene["count"] == 3
+    assert function(fv) == 10.0
+
+    with pytest.raises(ValueError):
+        fv.update({"lights.0": scene["lights"][1], "lights.0.intensity": 1.0})
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_update_tensor(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    function = helpers.create_function_from_module(
+        device,
+        "first",
+        r"""
+float first(Tensor<float,1> val) {
+    return val[0];
+}
+""",
+    )
+
+    a = Tensor.from_numpy(device, np.array([1, 2], dtype=np.float32))
+    b = Tensor.from_numpy(device, np.array([3, 4], dtype=np.float32))
+    fv = pack(function.module, a)
+    assert function(fv) == 1.0
+    fv.update("", b)
+    assert fv.python_object is b
+    assert function(fv) == 3.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.types.buffer import NDBuffer
+from slangpy.types.tensor import Tensor
+from slangpy.testing import helpers
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("count", [1, 1000, 300000])
+def test_scan(device_type: DeviceType, count: int):
+    device = helpers.get_device(device_type)
+    data = np.random.randint(0, 100, size=(count,)).astype(np.uint32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    inclusive = np.cumsum(data, dtype=np.uint32)
+    res = spy.primitives.inclusive_scan(buffer)
+    assert np.all(res.to_numpy() == inclusive)
+
+    res = spy.primitives.exclusive_scan(buffer)
+    assert np.all(res.to_numpy() == inclusive - data)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_scan_float_tensor(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(64, 100).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    res = spy.primitives.inclusive_scan(tensor)
+    assert isinstance(res, Tensor)
+    assert res.shape.as_tuple() == (64, 100)
+    assert np.allclose(res.to_numpy().reshape(-1), np.cumsum(data), rtol=1e-3)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("dtype", [np.uint32, np.int32, np.float32])
+def test_radix_sort(device_type: DeviceType, dtype: type):
+    device = helpers.get_device(device_type)
+    count = 100000
+    if dtype == np.float32:
+        keys = (np.random.rand(count) * 2000 - 1000).astype(dtype)
+    else:
+        keys = np.random.randint(-(1 << 20) if dtype == np.int32 else 0, 1 << 20, size=(count,))
+        keys = keys.astype(dtype)
+    values = np.arange(count, dtype=np.uint32)
+
+    sorted_keys, sorted_values = spy.primitives.radix_sort(
+        NDBuffer.from_numpy(device, keys), NDBuffer.from_numpy(device, values)
+    )
+    order = np.argsort(keys, kind="stable")
+    assert np.all(sorted_keys.to_numpy() == keys[order])
+    assert np.all(sorted_values.to_numpy() == order)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_radix_sort_bits(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    keys = np.random.randint(0, 256, size=(5000,)).astype(np.uint32)
+
+    res = spy.primitives.radix_sort(NDBuffer.from_numpy(device, keys), bits=8)
+    assert np.all(res.to_numpy() == np.sort(keys))
+
+    with pytest.raises(ValueError):
+        spy.primitives.radix_sort(NDBuffer.from_numpy(device, keys), bits=6)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_histogram(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.randint(-5, 70, size=(100000,)).astype(np.int32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    res = spy.primitives.histogram(buffer, 64)
+    expected = np.bincount(data[(data >= 0) & (data < 64)], minlength=64)
+    assert np.all(res.to_numpy() == expected)
+
+    floats = np.random.rand(100000).astype(np.float32)
+    res = spy.primitives.histogram(NDBuffer.from_numpy(device, floats), 10000, range=(0.0, 1.0))
+    expected, _ = np.histogram(floats, 10000, range=(0.0, 1.0))
+    # Values on bin edges may round differently to numpy's double precision.
+    assert res.to_numpy().sum() == len(floats)
+    assert np.abs(res.to_numpy().astype(np.int64) - expected).sum() <= 20
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compact(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(200000).astype(np.float32)
+    mask = (data > 0.7).astype(np.uint32)
+
+    res, count = spy.primitives.compact(
+        NDBuffer.from_numpy(device, data), NDBuffer.from_numpy(device, mask)
+    )
+    kept = data[mask != 0]
+    assert count.to_numpy()[0] == len(kept)
+    assert np.all(res.to_numpy()[: len(kept)] == kept)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_primitives_append_to(device_type: DeviceType):
+    # Primitives recorded into one command encoder run in order.
+    device = helpers.get_device(device_type)
+    data = np.random.randint(0, 1000, size=(10000,)).astype(np.uint32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    command_encoder = device.create_command_encoder()
+    sorted_keys = spy.primitives.radix_sort(buffer, _append_to=command_encoder)
+    scanned = spy.primitives.inclusive_scan(sorted_keys, _append_to=command_encoder)
+    device.submit_command_buffer(command_encoder.finish())
+    assert np.all(scanned.to_numpy() == np.cumsum(np.sort(data), dtype=np.uint32))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
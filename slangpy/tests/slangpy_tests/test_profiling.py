@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import json
+from pathlib import Path
+
+import pytest
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.testing import helpers
+
+MODULE = r"""
+import "slangpy";
+float add(float a, float b) {
+    return a+b;
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_profiling(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    m = helpers.create_module(device, MODULE)
+
+    spy.profiling.reset()
+    m.call_data_cache.reset_stats()
+    spy.profiling.enable(gpu_timestamps=True)
+    try:
+        assert m.add(1.0, 2.0) == 3.0
+        assert m.add(3.0, 4.0) == 7.0
+    finally:
+        spy.profiling.disable()
+
+    # Each profiled call looks its call data up once
+    assert m.call_data_cache.misses == 1
+    assert m.call_data_cache.hits == 1
+
+    stats = spy.profiling.stats()
+    phases = {phase: s for (module, function, phase), s in stats.items() if function == "add"}
+
+    # Every call records signature, lookup and dispatch phases
+    for phase in ["signature", "lookup", "prepare", "encode", "submit", "read_back", "gpu"]:
+        assert phases[phase].count == 2
+        assert phases[phase].total >= 0.0
+
+    # Only the first call builds the kernel
+    for phase in ["bind", "codegen"]:
+        assert phases[phase].count == 1
+
+    assert "add" in spy.profiling.report()
+
+    trace_path = tmp_path / "trace.json"
+    spy.profiling.export_chrome_trace(trace_path)
+    with open(trace_path) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == sum(s.count for s in stats.values())
+
+    # Nothing recorded once disabled
+    counts = {k: s.count for k, s in stats.items()}
+    m.add(1.0, 2.0)
+    assert {k: s.count for k, s in spy.profiling.stats().items()} == counts
+    spy.profiling.reset()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
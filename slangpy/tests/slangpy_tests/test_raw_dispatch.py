@@ -126,6 +126,30 @@ def test_multiply_scalar(device_type: DeviceType):
     assert np.all(data == expected)
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_repeat_dispatch(device_type: DeviceType):
+    mod = load_test_module(device_type)
+    func = mod.ndbuffer_multiply.as_func()
+    buffer = NDBuffer(mod.device, mod.uint3, 32)
+
+    func.dispatch(uint3(32, 1, 1), buffer=buffer, amount=10)
+    assert len(mod.dispatch_data_cache) == 1
+
+    # Repeat dispatches with matching argument types skip the signature lookup
+    mod.dispatch_data_cache.clear()
+    for amount in range(3):
+        func.dispatch(uint3(32, 1, 1), buffer=buffer, amount=amount)
+        data = helpers.read_ndbuffer_from_numpy(buffer).reshape(-1, 3)
+        expected = np.array([[i * amount, 0, 0] for i in range(32)])
+        assert np.all(data == expected)
+    assert len(mod.dispatch_data_cache) == 0
+
+    # Clearing the call data cache (e.g. on hot reload) invalidates the fast path
+    mod.call_data_cache.clear()
+    func.dispatch(uint3(32, 1, 1), buffer=buffer, amount=10)
+    assert len(mod.dispatch_data_cache) == 1
+
+
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
 def test_multiply_const(device_type: DeviceType):
     mod = load_test_module(device_type)
@@ -126,12 +126,18 @@ def test_raytracing(device_type: DeviceType):
     tensor = Tensor.zeros(device, (64, 64, 3), dtype=float)
     module = Module(device.load_module("test_raytracing.slang"))
 
-    module.trace.ray_tracing(
+    trace = module.trace.ray_tracing(
         hit_groups=[{"hit_group_name": "hit_group", "closest_hit_entry_point": "closest_hit"}],
         miss_entry_points=["miss"],
         max_recursion=1,
         max_ray_payload_size=12,
-    )(tid=spy.call_id(), tlas=tlas, _result=tensor)
+    )
+
+    # Ray tracing pipelines can be compiled ahead of the first call.
+    (call_data,) = trace.precompile([{"tid": spy.call_id(), "tlas": tlas, "_result": tensor}])
+    assert isinstance(call_data.pipeline, spy.RayTracingPipeline)
+
+    trace(tid=spy.call_id(), tlas=tlas, _result=tensor)
 
     data = tensor.to_numpy()
 
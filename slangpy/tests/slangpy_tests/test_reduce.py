@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+import numpy as np
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from slangpy.types.buffer import NDBuffer
+from slangpy.types.tensor import Tensor
+from slangpy.testing import helpers
+
+NUMPY_OPS = {
+    "sum": np.sum,
+    "min": np.min,
+    "max": np.max,
+    "mean": np.mean,
+}
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("op", ["sum", "min", "max", "mean"])
+@pytest.mark.parametrize("dim", [None, 0, 1, 2, (0, 2)])
+def test_reduce_axes(device_type: DeviceType, op: str, dim):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(4, 70, 5).astype(np.float32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    res = spy.reduce(buffer, op, dim=dim)
+    expected = NUMPY_OPS[op](data, axis=dim)
+    assert res.shape.as_tuple() == (np.shape(expected) or (1,))
+    assert np.allclose(res.to_numpy().reshape(np.shape(expected)), expected, rtol=1e-4)
+
+    res = spy.reduce(buffer, op, dim=dim, keepdim=True)
+    assert res.shape.as_tuple() == NUMPY_OPS[op](data, axis=dim, keepdims=True).shape
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("op", ["argmax", "argmin"])
+def test_reduce_arg(device_type: DeviceType, op: str):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(3, 10000).astype(np.float32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    res = getattr(buffer, op)(dim=1)
+    assert np.all(res.to_numpy() == getattr(np, op)(data, axis=1))
+
+    res = getattr(buffer, op)()
+    assert res.to_numpy()[0] == getattr(np, op)(data)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_multi_pass(device_type: DeviceType):
+    # Long enough to need a second pass over the partial results.
+    device = helpers.get_device(device_type)
+    data = np.random.randint(0, 10, size=(1 << 22,)).astype(np.int32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    assert buffer.sum().to_numpy()[0] == np.sum(data)
+    assert buffer.max().to_numpy()[0] == np.max(data)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_vector(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(5000, 3).astype(np.float32)
+    buffer = NDBuffer.empty(device, (5000,), "float3")
+    buffer.storage.copy_from_numpy(data)
+
+    res = buffer.sum()
+    assert np.allclose(res.to_numpy().reshape(3), np.sum(data, axis=0), rtol=1e-4)
+
+    with pytest.raises(ValueError):
+        buffer.argmax()
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_tensor(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(16, 300).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    res = tensor.mean(dim=1)
+    assert isinstance(res, Tensor)
+    assert np.allclose(res.to_numpy(), np.mean(data, axis=1), rtol=1e-4)
+
+    # Reductions follow the tensor's strides, so transposed views work without copies.
+    transposed = tensor.view((300, 16), strides=(1, 300))
+    res = transposed.max(dim=0)
+    assert np.allclose(res.to_numpy(), np.max(data, axis=1))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_append_to(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    data = np.random.rand(100000).astype(np.float32)
+    buffer = NDBuffer.from_numpy(device, data)
+
+    command_encoder = device.create_command_encoder()
+    res = spy.reduce(buffer, "sum", _append_to=command_encoder)
+    device.submit_command_buffer(command_encoder.finish())
+    assert np.allclose(res.to_numpy()[0], np.sum(data), rtol=1e-3)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_invalid(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    buffer = NDBuffer.from_numpy(device, np.zeros((4, 4), dtype=np.int32))
+
+    with pytest.raises(ValueError):
+        spy.reduce(buffer, "median")
+    with pytest.raises(ValueError):
+        spy.reduce(buffer, "sum", dim=2)
+    with pytest.raises(ValueError):
+        buffer.mean()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -534,5 +534,39 @@ void copy_first(StructuredBuffer<int> a, RWStructuredBuffer<int> b) {
     assert a_data[0] == b_data[0]
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compiled_call(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    function = helpers.create_function_from_module(
+        device,
+        "add_numbers",
+        r"""
+int add_numbers(int a, int b) {
+    return a+b;
+}
+""",
+    )
+
+    a = NDBuffer(element_count=50, device=device, dtype=int)
+    a.storage.copy_from_numpy(rand_array_of_ints(a.element_count))
+    res = NDBuffer(element_count=50, device=device, dtype=int)
+
+    handle = function.compile(a, 1, _result=res)
+    assert handle.call_data == function.debug_build_call_data(a, 1, _result=res)
+
+    a_data = a.storage.to_numpy().view(np.int32)
+    for i in range(3):
+        handle(a, i, _result=res)
+        res_data = res.storage.to_numpy().view(np.int32)
+        assert np.all(res_data == a_data + i)
+
+    # Changing argument types fails rather than generating a new kernel
+    with pytest.raises(TypeError):
+        handle(a, 1.0, _result=res)
+    with pytest.raises(TypeError):
+        handle(a, 1)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
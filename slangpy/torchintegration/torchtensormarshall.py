@@ -3,10 +3,17 @@
 
 from typing import Any, Optional, cast
 from numpy import ScalarType
-from slangpy import DataType, Device, BufferUsage, TypeReflection, DeviceType
+from slangpy import DataType, Device, BufferDesc, BufferUsage, TypeReflection, DeviceType
 import torch
 
-from slangpy.core.native import AccessType, CallContext, CallMode, Shape, TensorRef
+from slangpy.core.native import (
+    AccessType,
+    BufferPool,
+    CallContext,
+    CallMode,
+    Shape,
+    TensorRef,
+)
 from slangpy.bindings.boundvariableruntime import BoundVariableRuntime
 from slangpy.bindings.marshall import ReturnContext
 from slangpy.bindings.typeregistry import PYTHON_SIGNATURES, PYTHON_TYPES
@@ -61,11 +68,11 @@ def _torch_dtype_to_slang(
 
 
 def get_storage(context: CallContext, element_count: int, struct_size: int) -> Buffer:
-    return context.device.create_buffer(
-        size=element_count * struct_size,
-        struct_size=struct_size,
-        usage=BufferUsage.shared | BufferUsage.unordered_access | BufferUsage.shader_resource,
-    )
+    desc = BufferDesc()
+    desc.size = element_count * struct_size
+    desc.struct_size = struct_size
+    desc.usage = BufferUsage.shared | BufferUsage.unordered_access | BufferUsage.shader_resource
+    return BufferPool.create_buffer(context.device, desc)
 
 
 class TensorRefMarshall(TensorMarshall):
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 import math
 from os import PathLike
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union, cast
 
 from slangpy.core.native import Shape, NativeNDBuffer, NativeNDBufferDesc
 from slangpy.core.shapes import TShapeOrTuple
@@ -333,6 +333,84 @@ class NDBuffer(NativeNDBuffer):
         """
         super().clear(command_encoder)
 
+    def sum(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Sum the ndbuffer along dim (all dims if None) on the GPU. See slangpy.reduce.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "sum", dim, keepdim, command_encoder))
+
+    def min(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Minimum of the ndbuffer along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "min", dim, keepdim, command_encoder))
+
+    def max(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Maximum of the ndbuffer along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "max", dim, keepdim, command_encoder))
+
+    def mean(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Mean of the ndbuffer along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "mean", dim, keepdim, command_encoder))
+
+    def argmax(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Index of the maximum of the ndbuffer along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "argmax", dim, keepdim, command_encoder))
+
+    def argmin(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> "NDBuffer":
+        """
+        Index of the minimum of the ndbuffer along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "argmin", dim, keepdim, command_encoder))
+
     @staticmethod
     def from_numpy(
         device: Device,
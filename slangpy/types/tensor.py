@@ -23,7 +23,7 @@ from slangpy.core.native import Shape, NativeTensor, NativeTensorDesc
 
 from warnings import warn
 
-from typing import Optional, Any, Union, cast, TYPE_CHECKING
+from typing import Optional, Any, Sequence, Union, cast, TYPE_CHECKING
 import numpy as np
 import math
 
@@ -164,6 +164,84 @@ class Tensor(NativeTensor):
         """
         super().clear(command_encoder)
 
+    def sum(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Sum the tensor along dim (all dims if None) on the GPU. See slangpy.reduce.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "sum", dim, keepdim, command_encoder))
+
+    def min(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Minimum of the tensor along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "min", dim, keepdim, command_encoder))
+
+    def max(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Maximum of the tensor along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "max", dim, keepdim, command_encoder))
+
+    def mean(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Mean of the tensor along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "mean", dim, keepdim, command_encoder))
+
+    def argmax(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Index of the maximum of the tensor along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "argmax", dim, keepdim, command_encoder))
+
+    def argmin(
+        self,
+        dim: Optional[Union[int, Sequence[int]]] = None,
+        keepdim: bool = False,
+        command_encoder: Optional[CommandEncoder] = None,
+    ) -> Tensor:
+        """
+        Index of the minimum of the tensor along dim (all dims if None) on the GPU.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "argmin", dim, keepdim, command_encoder))
+
     @staticmethod
     def numpy(device: Device, ndarray: np.ndarray[Any, Any]) -> Tensor:
         warn(
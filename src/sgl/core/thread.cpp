@@ -12,6 +12,28 @@ void static_init() { }
 
 void static_shutdown() { }
 
+static void* (*s_release_gil_py)() noexcept = nullptr;
+static void (*s_restore_gil_py)(void*) noexcept = nullptr;
+
+void thread_init_py(void* (*release_gil_py)() noexcept, void (*restore_gil_py)(void*) noexcept)
+{
+    s_release_gil_py = release_gil_py;
+    s_restore_gil_py = restore_gil_py;
+}
+
+namespace detail {
+    void* release_gil()
+    {
+        return s_release_gil_py ? s_release_gil_py() : nullptr;
+    }
+
+    void restore_gil(void* state)
+    {
+        if (state && s_restore_gil_py)
+            s_restore_gil_py(state);
+    }
+} // namespace detail
+
 TaskGroup& global_task_group()
 {
     static TaskGroup s_global_task_group;
@@ -306,6 +306,32 @@ private:
     std::vector<TaskHandle> m_tasks;
 };
 
+/**
+ * When used from Python, a thread blocking on a lock while holding the GIL deadlocks if the
+ * thread holding the lock needs the GIL (e.g. to release a reference to a Python object).
+ * Python binding code must invoke `thread_init_py` and provide functions that release the GIL
+ * if held, returning the thread state to restore, and restore it.
+ */
+SGL_API void thread_init_py(void* (*release_gil_py)() noexcept, void (*restore_gil_py)(void*) noexcept);
+
+namespace detail {
+    SGL_API void* release_gil();
+    SGL_API void restore_gil(void* state);
+} // namespace detail
+
+/// Lock a mutex, releasing the GIL (if held) while waiting for it.
+template<typename Mutex>
+std::unique_lock<Mutex> lock_releasing_gil(Mutex& mutex)
+{
+    std::unique_lock<Mutex> lock(mutex, std::try_to_lock);
+    if (!lock.owns_lock()) {
+        void* state = detail::release_gil();
+        lock.lock();
+        detail::restore_gil(state);
+    }
+    return lock;
+}
+
 /// Get the global task group.
 /// This task group should mostly be used for fire-and-forget tasks without dependencies.
 /// All tasks submitted to this group will be waited for on program shutdown.
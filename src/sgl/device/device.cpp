@@ -657,10 +657,10 @@ ref<SlangSession> Device::create_slang_session(SlangSessionDesc desc)
     return make_ref<SlangSession>(ref<Device>(this), std::move(desc));
 }
 
-void Device::reload_all_programs()
+void Device::reload_all_programs(std::vector<std::filesystem::path> changed_files)
 {
     if (m_hot_reload)
-        m_hot_reload->recreate_all_sessions();
+        m_hot_reload->recreate_all_sessions(std::move(changed_files));
 }
 
 ref<SlangModule> Device::load_module(std::string_view module_name)
@@ -907,6 +907,11 @@ void Device::wait_for_submit(uint64_t id)
     m_global_fence->wait(id);
 }
 
+uint64_t Device::last_submit_id() const
+{
+    return m_global_fence->signaled_value();
+}
+
 void Device::wait_for_idle(CommandQueueType queue)
 {
     if (m_rhi_graphics_queue) {
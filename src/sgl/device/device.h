@@ -216,7 +216,11 @@ struct ShaderCacheStats {
 };
 
 /// Event data for hot reload hook.
-struct ShaderHotReloadEvent { };
+struct ShaderHotReloadEvent {
+    /// Absolute paths of the changed shader files that triggered the reload. Empty if the
+    /// reload was requested explicitly, in which case any file may have changed.
+    std::vector<std::filesystem::path> changed_files;
+};
 using ShaderHotReloadCallback = std::function<void(const ShaderHotReloadEvent&)>;
 
 
@@ -485,7 +489,9 @@ public:
         std::optional<SlangLinkOptions> link_options = {}
     );
 
-    void reload_all_programs();
+    /// Recreate all sessions and programs, as when shader files are changed on disk.
+    /// \param changed_files Files that changed, if known, so users can only invalidate what depends on them.
+    void reload_all_programs(std::vector<std::filesystem::path> changed_files = {});
 
     ref<ShaderObject> create_root_shader_object(const ShaderProgram* shader_program);
 
@@ -568,6 +574,13 @@ public:
      */
     void wait_for_submit(uint64_t id);
 
+    /**
+     * \brief ID of the most recent submission.
+     *
+     * \return Submission ID, as returned by the last call to \c submit_command_buffers.
+     */
+    uint64_t last_submit_id() const;
+
     /**
      * \brief Wait for the command queue to be idle.
      *
@@ -723,10 +736,10 @@ public:
     HotReload* _hot_reload() { return m_hot_reload; }
 
     /// Called by hot reload system after reload occurs, to trigger the hooks.
-    void _on_hot_reload()
+    void _on_hot_reload(const ShaderHotReloadEvent& event = {})
     {
         for (auto& hook : m_shader_hot_reload_callbacks)
-            hook({});
+            hook(event);
     }
 
     void _register_device_child(DeviceChild* device_child);
@@ -31,17 +31,17 @@ void HotReload::update()
 void HotReload::on_file_system_event(std::span<FileSystemWatchEvent> events)
 {
     // Simple check to see if any events involved .slang files.
-    auto fn_check = [](const FileSystemWatchEvent& e)
-    {
-        return platform::has_extension(e.path, "slang");
-    };
-    bool has_slang_files = std::find_if(events.begin(), events.end(), fn_check) != events.end();
-    if (!has_slang_files)
+    std::vector<std::filesystem::path> changed_files;
+    for (const FileSystemWatchEvent& e : events) {
+        if (platform::has_extension(e.path, "slang"))
+            changed_files.push_back(e.absolute_path.lexically_normal().make_preferred());
+    }
+    if (changed_files.empty())
         return;
 
     // If slang files detected, recreate all existing sessions
     if (m_auto_detect_changes)
-        recreate_all_sessions();
+        recreate_all_sessions(std::move(changed_files));
 }
 
 
@@ -69,7 +69,7 @@ void HotReload::set_auto_detect_delay(uint32_t delay_ms)
     m_file_system_watcher->set_delay(delay_ms);
 }
 
-void HotReload::recreate_all_sessions()
+void HotReload::recreate_all_sessions(std::vector<std::filesystem::path> changed_files)
 {
     // Notify reflection system to clear all reflection data
     detail::invalidate_all_reflection_data();
@@ -96,7 +96,7 @@ void HotReload::recreate_all_sessions()
     m_has_reloaded = true;
 
     // Notify device so it can notify hooks.
-    m_device->_on_hot_reload();
+    m_device->_on_hot_reload({.changed_files = std::move(changed_files)});
 }
 
 void HotReload::update_watched_paths_for_session(SlangSession* session)
@@ -14,6 +14,7 @@
 #include <slang.h>
 
 #include <exception>
+#include <filesystem>
 #include <map>
 #include <set>
 #include <span>
@@ -30,8 +31,9 @@ public:
     HotReload(ref<Device> device);
 
     /// Force immediate recreation of all registered sessions and
-    /// any modules/programs they've loaded/linked.
-    void recreate_all_sessions();
+    /// any modules/programs they've loaded/linked. The changed files, if
+    /// known, are passed on to the device's hot reload hooks.
+    void recreate_all_sessions(std::vector<std::filesystem::path> changed_files = {});
 
     /// Updates internal file system monitor for change detection.
     void update();
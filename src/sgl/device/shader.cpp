@@ -18,6 +18,7 @@
 #include "sgl/core/crypto.h"
 #include "sgl/core/timer.h"
 #include "sgl/core/file_stream.h"
+#include "sgl/core/thread.h"
 
 #include <slang.h>
 
@@ -232,6 +233,9 @@ void SlangSession::recreate_session()
 {
     SGL_CHECK_NOT_NULL(m_device);
 
+    auto lock = _lock();
+    auto registry_lock = thread::lock_releasing_gil(m_registry_mutex);
+
     SlangSessionBuild build;
 
     // Build everything first.
@@ -494,8 +498,17 @@ void SlangSession::create_session(SlangSessionBuild& build)
     build.session = std::move(data);
 }
 
+std::unique_lock<std::recursive_mutex> SlangSession::_lock()
+{
+    // Threads holding the lock may need the GIL (e.g. to release Python objects), so it
+    // is released while waiting for the lock.
+    return thread::lock_releasing_gil(m_mutex);
+}
+
 ref<SlangModule> SlangSession::load_module(std::string_view module_name)
 {
+    auto lock = _lock();
+
     SlangModuleDesc desc;
     desc.module_name = module_name;
 
@@ -519,6 +532,8 @@ ref<SlangModule> SlangSession::load_module_from_source(
     std::optional<std::filesystem::path> path
 )
 {
+    auto lock = _lock();
+
     SlangModuleDesc desc;
     desc.module_name = module_name;
     desc.source = source;
@@ -544,6 +559,8 @@ ref<ShaderProgram> SlangSession::link_program(
     std::optional<SlangLinkOptions> link_options
 )
 {
+    auto lock = _lock();
+
     for (const auto& module : modules)
         SGL_CHECK(module->session() == this, "All modules must belong to this session.");
     for (const auto& entry_point : entry_points)
@@ -623,18 +640,21 @@ std::string SlangSession::load_source(std::string_view module_name)
 
 void SlangSession::_register_program(ShaderProgram* program)
 {
+    auto lock = thread::lock_releasing_gil(m_registry_mutex);
     SGL_ASSERT(m_registered_programs.count(program) == 0);
     m_registered_programs.insert(program);
 }
 
 void SlangSession::_unregister_program(ShaderProgram* program)
 {
+    auto lock = thread::lock_releasing_gil(m_registry_mutex);
     SGL_ASSERT(m_registered_programs.count(program) == 1);
     m_registered_programs.erase(program);
 }
 
 void SlangSession::_register_module(SlangModule* module)
 {
+    auto lock = thread::lock_releasing_gil(m_registry_mutex);
     SGL_ASSERT(
         std::find(m_registered_modules.begin(), m_registered_modules.end(), module) == m_registered_modules.end()
     );
@@ -643,6 +663,7 @@ void SlangSession::_register_module(SlangModule* module)
 
 void SlangSession::_unregister_module(SlangModule* module)
 {
+    auto lock = thread::lock_releasing_gil(m_registry_mutex);
     auto existing = std::find(m_registered_modules.begin(), m_registered_modules.end(), module);
     SGL_ASSERT(existing != m_registered_modules.end());
     m_registered_modules.erase(existing);
@@ -846,6 +867,7 @@ void SlangModule::load(SlangSessionBuild& build_data) const
     build_data.modules[this] = std::move(data);
 
     // Build all registered entry points.
+    std::lock_guard<std::mutex> entry_points_lock(m_entry_points_mutex);
     for (auto entry_point : m_registered_entry_points) {
         entry_point->init(build_data);
     }
@@ -854,6 +876,7 @@ void SlangModule::load(SlangSessionBuild& build_data) const
 void SlangModule::store_built_data(SlangSessionBuild& build_data)
 {
     m_data = build_data.modules[this];
+    std::lock_guard<std::mutex> entry_points_lock(m_entry_points_mutex);
     for (auto ep : m_registered_entry_points)
         ep->store_built_data(build_data);
 }
@@ -861,12 +884,14 @@ void SlangModule::store_built_data(SlangSessionBuild& build_data)
 void SlangModule::populate_build_data(SlangSessionBuild& build_data)
 {
     build_data.modules[this] = m_data;
+    std::lock_guard<std::mutex> entry_points_lock(m_entry_points_mutex);
     for (auto ep : m_registered_entry_points)
         ep->populate_build_data(build_data);
 }
 
 std::vector<ref<SlangEntryPoint>> SlangModule::entry_points() const
 {
+    auto lock = m_session->_lock();
     std::vector<ref<SlangEntryPoint>> entry_points;
     for (SlangInt32 i = 0; i < m_data->slang_module->getDefinedEntryPointCount(); ++i) {
         Slang::ComPtr<slang::IEntryPoint> slang_entry_point;
@@ -880,12 +905,34 @@ std::vector<ref<SlangEntryPoint>> SlangModule::entry_points() const
     return entry_points;
 }
 
+std::vector<std::filesystem::path> SlangModule::dependency_file_paths() const
+{
+    auto lock = m_session->_lock();
+    std::vector<std::filesystem::path> paths;
+    for (SlangInt32 i = 0; i < m_data->slang_module->getDependencyFileCount(); ++i) {
+        const char* path = m_data->slang_module->getDependencyFilePath(i);
+        if (!path)
+            continue;
+        // As in hot reload, relative paths are relative to the working directory, and
+        // sources that aren't files (eg string modules) don't exist.
+        std::filesystem::path abs_path = path;
+        if (!abs_path.is_absolute()) {
+            if (!std::filesystem::exists(abs_path))
+                continue;
+            abs_path = std::filesystem::absolute(abs_path);
+        }
+        paths.push_back(abs_path.lexically_normal().make_preferred());
+    }
+    return paths;
+}
+
 ref<SlangEntryPoint> SlangModule::entry_point(std::string_view name, std::span<TypeConformance> type_conformances) const
 {
     SlangEntryPointDesc desc;
     desc.name = name;
     desc.type_conformances.assign(type_conformances.begin(), type_conformances.end());
 
+    auto lock = m_session->_lock();
     auto entry_point = make_ref<SlangEntryPoint>(ref(const_cast<SlangModule*>(this)), desc);
 
     // Setup build containing just the session and this module, then build and store the entry point.
@@ -900,6 +947,7 @@ ref<SlangEntryPoint> SlangModule::entry_point(std::string_view name, std::span<T
 
 bool SlangModule::has_entry_point(std::string_view name) const
 {
+    auto lock = m_session->_lock();
     Slang::ComPtr<slang::IEntryPoint> slang_entry_point;
     m_data->slang_module->findEntryPointByName(std::string{name}.c_str(), slang_entry_point.writeRef());
     return slang_entry_point != nullptr;
@@ -907,16 +955,19 @@ bool SlangModule::has_entry_point(std::string_view name) const
 
 ref<const DeclReflection> SlangModule::module_decl() const
 {
+    auto lock = m_session->_lock();
     return detail::from_slang(ref(this), m_data->slang_module->getModuleReflection());
 }
 
 void SlangModule::_register_entry_point(SlangEntryPoint* entry_point) const
 {
+    auto lock = thread::lock_releasing_gil(m_entry_points_mutex);
     m_registered_entry_points.insert(entry_point);
 }
 
 void SlangModule::_unregister_entry_point(SlangEntryPoint* entry_point) const
 {
+    auto lock = thread::lock_releasing_gil(m_entry_points_mutex);
     m_registered_entry_points.erase(entry_point);
 }
 
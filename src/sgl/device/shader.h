@@ -12,6 +12,7 @@
 
 #include <exception>
 #include <map>
+#include <mutex>
 #include <set>
 #include <span>
 #include <string>
@@ -319,6 +320,9 @@ public:
     // Internal access to the built session data.
     ref<SlangSessionData> _data() { return m_data; }
 
+    /// Lock the session for access to the slang session, releasing the GIL while waiting.
+    std::unique_lock<std::recursive_mutex> _lock();
+
 private:
     ref<Device> m_device;
 
@@ -338,6 +342,15 @@ private:
     /// All created sgl programs (via link_program)
     std::set<ShaderProgram*> m_registered_programs;
 
+    /// Serializes all access to the slang session (module loading, program linking,
+    /// entry points and reflection), so they can be used from multiple threads
+    /// (slang sessions are not thread safe).
+    std::recursive_mutex m_mutex;
+
+    /// Protects the registered module/program lists, which are also modified when
+    /// modules/programs are destroyed.
+    std::mutex m_registry_mutex;
+
     void update_module_cache_and_dependencies();
     bool write_module_to_cache(slang::IModule* module);
     void create_session(SlangSessionBuild& build);
@@ -391,6 +404,13 @@ public:
 
     /// Module source path. This can be empty if the module was generated from a string.
     const std::filesystem::path& path() const { return m_data->path; }
+
+    /// Module source, if the module was generated from a string.
+    const std::optional<std::string>& source() const { return m_desc.source; }
+
+    /// Absolute paths of the source files this module was built from, including the
+    /// files of modules it imports. Sources that aren't files are skipped.
+    std::vector<std::filesystem::path> dependency_file_paths() const;
     ref<const ProgramLayout> layout() const
     {
         return ProgramLayout::from_slang(ref(this), m_data->slang_module->getLayout());
@@ -429,6 +449,9 @@ private:
     ref<SlangModuleData> m_data;
 
     mutable std::set<SlangEntryPoint*> m_registered_entry_points;
+
+    /// Protects the registered entry points, which are also modified when entry points are destroyed.
+    mutable std::mutex m_entry_points_mutex;
 };
 
 /// Kind of specialization argument (mirrors slang::SpecializationArg::Kind).
@@ -8,6 +8,17 @@ SGL_PY_EXPORT(core_thread)
 {
     using namespace sgl::thread;
 
+    thread_init_py(
+        []() noexcept -> void*
+        {
+            return PyGILState_Check() ? PyEval_SaveThread() : nullptr;
+        },
+        [](void* state) noexcept
+        {
+            PyEval_RestoreThread(static_cast<PyThreadState*>(state));
+        }
+    );
+
     nb::module_ thread = nb::module_::import_("slangpy.thread");
 
     thread.def(
@@ -291,7 +291,8 @@ SGL_PY_EXPORT(device_device)
         .def_ro("hit_count", &ShaderCacheStats::hit_count, D(ShaderCacheStats, hit_count))
         .def_ro("miss_count", &ShaderCacheStats::miss_count, D(ShaderCacheStats, miss_count));
 
-    nb::class_<ShaderHotReloadEvent>(m, "ShaderHotReloadEvent", D(ShaderHotReloadEvent));
+    nb::class_<ShaderHotReloadEvent>(m, "ShaderHotReloadEvent", D(ShaderHotReloadEvent))
+        .def_ro("changed_files", &ShaderHotReloadEvent::changed_files, D(ShaderHotReloadEvent, changed_files));
 
     nb::class_<HeapReport>(m, "HeapReport", D(HeapReport))
         .def_rw("label", &HeapReport::label, D(HeapReport, label))
@@ -826,7 +827,12 @@ SGL_PY_EXPORT(device_device)
         "cache_path"_a.none() = nb::none(),
         D(Device, create_slang_session)
     );
-    device.def("reload_all_programs", &Device::reload_all_programs, D(Device, reload_all_programs));
+    device.def(
+        "reload_all_programs",
+        &Device::reload_all_programs,
+        "changed_files"_a = std::vector<std::filesystem::path>{},
+        D(Device, reload_all_programs)
+    );
     device.def("load_module", &Device::load_module, "module_name"_a, D(Device, load_module));
     device.def(
         "load_module_from_source",
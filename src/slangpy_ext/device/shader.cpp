@@ -204,13 +204,21 @@ SGL_PY_EXPORT(device_shader)
     nb::class_<SlangSession, Object>(m, "SlangSession", D(SlangSession))
         .def_prop_ro("device", &SlangSession::device, D(SlangSession, device))
         .def_prop_ro("desc", &SlangSession::desc, D(SlangSession, desc))
-        .def("load_module", &SlangSession::load_module, "module_name"_a, D(SlangSession, load_module))
+        // Compilation releases the GIL so modules can be compiled on background threads.
+        .def(
+            "load_module",
+            &SlangSession::load_module,
+            "module_name"_a,
+            nb::call_guard<nb::gil_scoped_release>(),
+            D(SlangSession, load_module)
+        )
         .def(
             "load_module_from_source",
             &SlangSession::load_module_from_source,
             "module_name"_a,
             "source"_a,
             "path"_a.none() = nb::none(),
+            nb::call_guard<nb::gil_scoped_release>(),
             D(SlangSession, load_module_from_source)
         )
         .def(
@@ -219,6 +227,7 @@ SGL_PY_EXPORT(device_shader)
             "modules"_a,
             "entry_points"_a,
             "link_options"_a.none() = nb::none(),
+            nb::call_guard<nb::gil_scoped_release>(),
             D(SlangSession, link_program)
         )
         .def(
@@ -236,6 +245,12 @@ SGL_PY_EXPORT(device_shader)
         .def_prop_ro("session", &SlangModule::session, D(SlangModule, session))
         .def_prop_ro("name", &SlangModule::name, D(SlangModule, name))
         .def_prop_ro("path", &SlangModule::path, D(SlangModule, path))
+        .def_prop_ro("source", &SlangModule::source, D(SlangModule, source))
+        .def_prop_ro(
+            "dependency_file_paths",
+            &SlangModule::dependency_file_paths,
+            D(SlangModule, dependency_file_paths)
+        )
         .def_prop_ro("layout", &SlangModule::layout, D(SlangModule, layout))
         .def_prop_ro("entry_points", &SlangModule::entry_points, D(SlangModule, entry_points))
         .def_prop_ro("module_decl", &SlangModule::module_decl, D(SlangModule, module_decl))
@@ -3039,7 +3039,13 @@ workaround during shutdown, to ensure all resources are released when
 slangpy fails to clean up properly due to reference cycles introduced
 in Python.)doc";
 
-static const char *__doc_sgl_Device_reload_all_programs = R"doc()doc";
+static const char *__doc_sgl_Device_reload_all_programs =
+R"doc(Recreate all sessions and programs, as when shader files are changed on
+disk.
+
+Parameter ``changed_files``:
+    Files that changed, if known, so users can only invalidate what
+    depends on them.)doc";
 
 static const char *__doc_sgl_Device_report_heaps =
 R"doc(Report status of internal heaps used by the device.
@@ -6569,6 +6575,11 @@ static const char *__doc_sgl_ShaderCursor_to_string = R"doc()doc";
 
 static const char *__doc_sgl_ShaderHotReloadEvent = R"doc(Event data for hot reload hook.)doc";
 
+static const char *__doc_sgl_ShaderHotReloadEvent_changed_files =
+R"doc(Absolute paths of the changed shader files that triggered the reload.
+Empty if the reload was requested explicitly, in which case any file
+may have changed.)doc";
+
 static const char *__doc_sgl_ShaderModel = R"doc()doc";
 
 static const char *__doc_sgl_ShaderModel_info = R"doc()doc";
@@ -7032,6 +7043,11 @@ static const char *__doc_sgl_SlangModule_class_name = R"doc()doc";
 
 static const char *__doc_sgl_SlangModule_data = R"doc()doc";
 
+static const char *__doc_sgl_SlangModule_dependency_file_paths =
+R"doc(Absolute paths of the source files this module was built from,
+including the files of modules it imports. Sources that aren't files
+are skipped.)doc";
+
 static const char *__doc_sgl_SlangModule_desc = R"doc(Descriptor that holds all data required to create this module.)doc";
 
 static const char *__doc_sgl_SlangModule_entry_point = R"doc(Get an entry point, optionally applying type conformances to it.)doc";
@@ -7074,6 +7090,8 @@ static const char *__doc_sgl_SlangModule_session = R"doc(The session from which
 
 static const char *__doc_sgl_SlangModule_slang_module = R"doc(Internal slang module.)doc";
 
+static const char *__doc_sgl_SlangModule_source = R"doc(Module source, if the module was generated from a string.)doc";
+
 static const char *__doc_sgl_SlangModule_store_built_data =
 R"doc(Finds this module in current build and updates internal m_data to
 point at it.)doc";
@@ -58,6 +58,7 @@ SGL_PY_DECLARE(utils_renderdoc);
 SGL_PY_DECLARE(utils_slangpy);
 SGL_PY_DECLARE(utils_slangpy_strided_buffer_view);
 SGL_PY_DECLARE(utils_slangpy_buffer);
+SGL_PY_DECLARE(utils_slangpy_bufferpool);
 SGL_PY_DECLARE(utils_slangpy_function);
 SGL_PY_DECLARE(utils_slangpy_packedarg);
 SGL_PY_DECLARE(utils_slangpy_resources);
@@ -144,6 +145,7 @@ NB_MODULE(slangpy_ext, m_)
     SGL_PY_IMPORT(utils_slangpy);
     SGL_PY_IMPORT(utils_slangpy_strided_buffer_view);
     SGL_PY_IMPORT(utils_slangpy_buffer);
+    SGL_PY_IMPORT(utils_slangpy_bufferpool);
     SGL_PY_IMPORT(utils_slangpy_function);
     SGL_PY_IMPORT(utils_slangpy_packedarg);
     SGL_PY_IMPORT(utils_slangpy_resources);
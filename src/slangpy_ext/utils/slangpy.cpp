@@ -1,7 +1,10 @@
 // SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
 #include <sstream>
+#include <cstring>
+#include <functional>
 #include <cmath>
+#include <unordered_map>
 
 #include "nanobind.h"
 
@@ -11,6 +14,7 @@
 #include "sgl/device/device.h"
 #include "sgl/device/pipeline.h"
 #include "sgl/device/command.h"
+#include "sgl/device/cuda_interop.h"
 #include "sgl/stl/bit.h" // Replace with <bit> when available on all platforms.
 
 #include "utils/slangpy.h"
@@ -132,6 +136,141 @@ void NativeMarshall::store_readback(
     read_back.append(nb::make_tuple(binding, value, data));
 }
 
+CallDataImage::CallDataImage(ref<Device> device)
+    : ShaderObject(std::move(device), nullptr, false)
+{
+}
+
+void CallDataImage::begin(ref<ShaderObject> block, size_t size)
+{
+    SGL_ASSERT(!m_block);
+    m_block = std::move(block);
+    if (m_data.size() != size)
+        m_data.assign(size, 0);
+}
+
+void CallDataImage::end()
+{
+    SGL_ASSERT(m_block);
+    if (!m_data.empty())
+        m_block->set_data(ShaderOffset::zero(), m_data.data(), m_data.size());
+    // Bindings are written after the image, as on some devices they're stored in the
+    // block's uniform data (eg device addresses and descriptor handles).
+    for (const auto& write : m_deferred)
+        write(m_block.get());
+    abort();
+}
+
+void CallDataImage::abort()
+{
+    m_deferred.clear();
+    m_block = nullptr;
+}
+
+void CallDataImage::defer(std::function<void(ShaderObject*)> write)
+{
+    m_binding_count++;
+    m_deferred.push_back(std::move(write));
+}
+
+ref<const TypeLayoutReflection> CallDataImage::element_type_layout() const
+{
+    return m_block->element_type_layout();
+}
+
+slang::TypeLayoutReflection* CallDataImage::slang_element_type_layout() const
+{
+    return m_block->slang_element_type_layout();
+}
+
+uint32_t CallDataImage::get_entry_point_count() const
+{
+    return m_block->get_entry_point_count();
+}
+
+ref<ShaderObject> CallDataImage::get_entry_point(uint32_t index)
+{
+    m_binding_count++;
+    return m_block->get_entry_point(index);
+}
+
+ref<ShaderObject> CallDataImage::get_object(const ShaderOffset& offset)
+{
+    m_binding_count++;
+    return m_block->get_object(offset);
+}
+
+void CallDataImage::set_object(const ShaderOffset& offset, const ref<ShaderObject>& object)
+{
+    defer([=](ShaderObject* block) { block->set_object(offset, object); });
+}
+
+void CallDataImage::set_buffer(const ShaderOffset& offset, const ref<Buffer>& buffer)
+{
+    defer([=](ShaderObject* block) { block->set_buffer(offset, buffer); });
+}
+
+void CallDataImage::set_buffer_view(const ShaderOffset& offset, const ref<BufferView>& buffer_view)
+{
+    defer([=](ShaderObject* block) { block->set_buffer_view(offset, buffer_view); });
+}
+
+void CallDataImage::set_texture(const ShaderOffset& offset, const ref<Texture>& texture)
+{
+    defer([=](ShaderObject* block) { block->set_texture(offset, texture); });
+}
+
+void CallDataImage::set_texture_view(const ShaderOffset& offset, const ref<TextureView>& texture_view)
+{
+    defer([=](ShaderObject* block) { block->set_texture_view(offset, texture_view); });
+}
+
+void CallDataImage::set_sampler(const ShaderOffset& offset, const ref<Sampler>& sampler)
+{
+    defer([=](ShaderObject* block) { block->set_sampler(offset, sampler); });
+}
+
+void CallDataImage::set_acceleration_structure(
+    const ShaderOffset& offset,
+    const ref<AccelerationStructure>& acceleration_structure
+)
+{
+    defer([=](ShaderObject* block) { block->set_acceleration_structure(offset, acceleration_structure); });
+}
+
+void CallDataImage::set_descriptor_handle(const ShaderOffset& offset, const DescriptorHandle& handle)
+{
+    defer([=](ShaderObject* block) { block->set_descriptor_handle(offset, handle); });
+}
+
+void CallDataImage::set_data(const ShaderOffset& offset, const void* data, size_t size)
+{
+    size_t end = size_t(offset.uniform_offset) + size;
+    if (end > m_data.size())
+        m_data.resize(end, 0);
+    std::memcpy(m_data.data() + offset.uniform_offset, data, size);
+}
+
+void CallDataImage::set_cuda_tensor_view_buffer(
+    const ShaderOffset& offset,
+    const cuda::TensorView& tensor_view,
+    bool is_uav
+)
+{
+    defer([=](ShaderObject* block) { block->set_cuda_tensor_view_buffer(offset, tensor_view, is_uav); });
+}
+
+void CallDataImage::set_cuda_tensor_view_pointer(const ShaderOffset& offset, const cuda::TensorView& tensor_view)
+{
+    defer([=](ShaderObject* block) { block->set_cuda_tensor_view_pointer(offset, tensor_view); });
+}
+
+void CallDataImage::get_cuda_interop_buffers(std::vector<ref<cuda::InteropBuffer>>& cuda_interop_buffers) const
+{
+    if (m_block)
+        m_block->get_cuda_interop_buffers(cuda_interop_buffers);
+}
+
 void NativeBoundVariableRuntime::populate_call_shape(
     std::vector<int>& call_shape,
     nb::object value,
@@ -217,11 +356,73 @@ void NativeBoundVariableRuntime::populate_call_shape(
     }
 }
 
+/// How a value written to a call data image is compared with the next dispatch's value to
+/// skip rewriting it.
+enum class ImageValueKind {
+    /// Not comparable, always rewritten.
+    none,
+    /// Immutable scalar (bool, int or float), compared by value.
+    immutable,
+    /// Math type (vector, matrix or quaternion), which is trivially copyable but mutable, so
+    /// compared by its bytes.
+    bytes,
+};
+
+static ImageValueKind image_value_kind(nb::handle value)
+{
+    PyObject* obj = value.ptr();
+    if (PyBool_Check(obj) || PyLong_CheckExact(obj) || PyFloat_CheckExact(obj))
+        return ImageValueKind::immutable;
+
+    // Math types are all bound in slangpy.math. Types are looked up once, as this is
+    // checked for every leaf of every dispatch.
+    static std::unordered_map<PyTypeObject*, bool> s_math_types;
+    PyTypeObject* type = Py_TYPE(obj);
+    auto it = s_math_types.find(type);
+    if (it == s_math_types.end()) {
+        nb::handle type_handle((PyObject*)type);
+        bool is_math = nb::type_check(type_handle)
+            && nb::cast<std::string>(nb::getattr(type_handle, "__module__", nb::str(""))) == "slangpy.math";
+        it = s_math_types.emplace(type, is_math).first;
+    }
+    return it->second ? ImageValueKind::bytes : ImageValueKind::none;
+}
+
+bool NativeBoundVariableRuntime::image_value_matches(nb::handle value) const
+{
+    if (!m_image_uniform_only || Py_TYPE(value.ptr()) != m_image_type)
+        return false;
+    if (m_image_value.is_valid())
+        return value.equal(m_image_value);
+    return std::memcmp(nb::inst_ptr<uint8_t>(value), m_image_bytes.data(), m_image_bytes.size()) == 0;
+}
+
+void NativeBoundVariableRuntime::store_image_value(nb::handle value)
+{
+    m_image_type = nullptr;
+    m_image_value = nb::object();
+    switch (image_value_kind(value)) {
+    case ImageValueKind::immutable:
+        m_image_type = Py_TYPE(value.ptr());
+        m_image_value = nb::borrow(value);
+        break;
+    case ImageValueKind::bytes: {
+        m_image_type = Py_TYPE(value.ptr());
+        const uint8_t* data = nb::inst_ptr<uint8_t>(value);
+        m_image_bytes.assign(data, data + nb::type_size(value.type()));
+        break;
+    }
+    case ImageValueKind::none:
+        break;
+    }
+}
+
 void NativeBoundVariableRuntime::write_shader_cursor_pre_dispatch(
     CallContext* context,
     ShaderCursor cursor,
     nb::object value,
-    nb::list read_back
+    nb::list read_back,
+    CallDataImage* image
 )
 {
     if (is_param_block()) {
@@ -236,12 +437,26 @@ void NativeBoundVariableRuntime::write_shader_cursor_pre_dispatch(
         for (const auto& [name, child_ref] : *m_children) {
             if (child_ref) {
                 nb::object child_value = value[name.c_str()];
-                child_ref->write_shader_cursor_pre_dispatch(context, child_field, child_value, read_back);
+                child_ref->write_shader_cursor_pre_dispatch(context, child_field, child_value, read_back, image);
             }
         }
-    } else {
+    } else if (!image) {
         // We are a leaf node, so generate and store call data for this node.
+        m_image_type = nullptr;
+        m_image_value = nb::object();
+        m_python_type->write_shader_cursor_pre_dispatch(context, this, cursor, value, read_back);
+    } else {
+        // As above, but the image still holds the data written for the last dispatch, so
+        // if that only wrote uniforms and the value is unchanged there's nothing to do.
+        if (image_value_matches(value))
+            return;
+        uint64_t binding_count = image->binding_count();
+        size_t read_back_count = read_back.size();
+        m_image_type = nullptr;
+        m_image_value = nb::object();
         m_python_type->write_shader_cursor_pre_dispatch(context, this, cursor, value, read_back);
+        m_image_uniform_only = image->binding_count() == binding_count && read_back.size() == read_back_count;
+        store_image_value(value);
     }
 }
 
@@ -354,14 +569,14 @@ void NativeBoundCallRuntime::write_shader_cursor_pre_dispatch(
     ShaderCursor call_data_cursor,
     nb::list args,
     nb::dict kwargs,
-    nb::list read_back
-
+    nb::list read_back,
+    CallDataImage* image
 )
 {
     // Write call data for each positional argument.
     for (size_t idx = 0; idx < args.size(); ++idx) {
         auto cursor = m_args[idx]->is_param_block() ? root_cursor : call_data_cursor;
-        m_args[idx]->write_shader_cursor_pre_dispatch(context, cursor, args[idx], read_back);
+        m_args[idx]->write_shader_cursor_pre_dispatch(context, cursor, args[idx], read_back, image);
     }
 
     // Write call data for each keyword argument.
@@ -369,7 +584,8 @@ void NativeBoundCallRuntime::write_shader_cursor_pre_dispatch(
         auto it = m_kwargs.find(nb::str(key).c_str());
         if (it != m_kwargs.end()) {
             auto cursor = it->second->is_param_block() ? root_cursor : call_data_cursor;
-            it->second->write_shader_cursor_pre_dispatch(context, cursor, nb::cast<nb::object>(value), read_back);
+            it->second
+                ->write_shader_cursor_pre_dispatch(context, cursor, nb::cast<nb::object>(value), read_back, image);
         }
     }
 }
@@ -422,13 +638,58 @@ nb::object NativeCallData::append_to(
     return exec(opts, command_encoder, args, kwargs);
 }
 
-nb::object NativeCallData::exec(
+ref<NativePendingCall> NativeCallData::append_pending(
     ref<NativeCallRuntimeOptions> opts,
     CommandEncoder* command_encoder,
     nb::args args,
     nb::kwargs kwargs
 )
 {
+    SGL_CHECK(command_encoder != nullptr, "A command encoder is required.");
+    auto pending = make_ref<NativePendingCall>();
+    exec(opts, command_encoder, args, kwargs, pending.get());
+    return pending;
+}
+
+nb::object NativeCallData::read_pending(NativePendingCall* pending)
+{
+    SGL_CHECK(pending != nullptr && pending->context, "Call has not been appended.");
+    nb::object result = read_results(
+        pending->context.get(),
+        pending->read_back,
+        pending->args,
+        pending->kwargs,
+        pending->unpacked_args,
+        pending->unpacked_kwargs
+    );
+    // Results can only be read once, as read back data is consumed.
+    pending->context = nullptr;
+    return result;
+}
+
+nb::object NativeCallData::exec(
+    ref<NativeCallRuntimeOptions> opts,
+    CommandEncoder* command_encoder,
+    nb::args args,
+    nb::kwargs kwargs,
+    NativePendingCall* pending
+)
+{
+    // Optionally record the time spent in each phase of the call.
+    Timer::TimePoint phase_start = 0;
+    if (s_profiling_enabled) {
+        m_last_call_timings = NativeCallTimings{};
+        phase_start = Timer::now();
+    }
+    auto end_phase = [&](double& duration)
+    {
+        if (s_profiling_enabled) {
+            Timer::TimePoint now = Timer::now();
+            duration = Timer::delta_s(phase_start, now);
+            phase_start = now;
+        }
+    };
+
     // Unpack args and kwargs.
     nb::list unpacked_args = unpack_args(args);
     nb::dict unpacked_kwargs = unpack_kwargs(kwargs);
@@ -440,8 +701,8 @@ nb::object NativeCallData::exec(
     // Setup context.
     auto context = make_ref<CallContext>(m_device, call_shape, m_call_mode);
 
-    // Allocate return value if needed.
-    if (!command_encoder && m_call_mode == CallMode::prim) {
+    // Allocate return value if needed. Appended calls only do so if their results will be read.
+    if ((!command_encoder || pending) && m_call_mode == CallMode::prim) {
         ref<NativeBoundVariableRuntime> rv_node = m_runtime->find_kwarg("_result");
         if (rv_node && (!kwargs.contains("_result") || kwargs["_result"].is_none())) {
             nb::object output = rv_node->python_type()->create_output(context, rv_node.get());
@@ -572,6 +833,27 @@ nb::object NativeCallData::exec(
     }
     std::reverse(call_grid_strides.begin(), call_grid_strides.end());
 
+    // Indirect calls take the outermost dimension from a count on the device. The call
+    // shape acts as the capacity, so the count is clamped to it.
+    //
+    // Gather calls only run for the elements of the call shape at a list of flat indices,
+    // so dispatch a thread per index, which the kernel maps to its element. An indirect
+    // count then limits the number of indices used rather than the outermost dimension.
+    ref<Buffer> indirect_count = opts->indirect_count();
+    ref<Buffer> gather_indices = opts->gather_indices();
+    if (indirect_count || gather_indices) {
+        SGL_CHECK(
+            !opts->is_ray_tracing(),
+            "Indirect and gather calls are not supported by ray tracing pipelines."
+        );
+        SGL_CHECK(!cs.empty(), "Indirect and gather calls require a vectorized call shape.");
+        SGL_CHECK(
+            std::all_of(call_group_shape.begin(), call_group_shape.end(), [](int x) { return x == 1; }),
+            "Indirect and gather calls cannot be combined with a call group shape."
+        );
+    }
+    uint32_t dispatch_threads = gather_indices ? opts->gather_count() : uint32_t(total_threads);
+
     nb::list read_back;
 
     if (is_log_enabled(LogLevel::debug)) {
@@ -603,8 +885,10 @@ nb::object NativeCallData::exec(
         );
     }
 
-    auto bind_call_data = [&](ShaderCursor cursor)
+    auto bind_call_data = [&](ShaderObject* root)
     {
+        ShaderCursor cursor(root);
+
         // Get the call data cursor, either as an entry point parameter or global depending on call data mode
         ShaderCursor call_data_cursor;
         if (m_call_data_mode == CallDataMode::entry_point) {
@@ -617,8 +901,26 @@ nb::object NativeCallData::exec(
         // We do this here to avoid doing it automatically for every
         // child. Shouldn't need to do recursively as its only
         // relevant for parameter blocks and constant buffers.
-        if (call_data_cursor.is_reference())
-            call_data_cursor = call_data_cursor.dereference();
+        //
+        // A global call data parameter block is written through the call data image, which
+        // keeps its uniforms between dispatches, so only arguments that changed need writing.
+        // The image is skipped if already in use, eg if writing an argument calls back into
+        // this call data.
+        CallDataImage* image = nullptr;
+        if (call_data_cursor.is_reference()) {
+            if (m_call_data_mode == CallDataMode::global_data
+                && (!m_call_data_image || !m_call_data_image->is_active())) {
+                if (!m_call_data_image)
+                    m_call_data_image = make_ref<CallDataImage>(m_device);
+                image = m_call_data_image.get();
+                ref<ShaderObject> block = root->get_object(call_data_cursor.offset());
+                slang::TypeLayoutReflection* block_type_layout = call_data_cursor.slang_type_layout();
+                image->begin(block, block->slang_element_type_layout()->getSize());
+                call_data_cursor = ShaderCursor(image, true, block_type_layout);
+            } else {
+                call_data_cursor = call_data_cursor.dereference();
+            }
+        }
 
         if (!cs.empty()) {
             call_data_cursor["_call_dim"]
@@ -639,14 +941,33 @@ nb::object NativeCallData::exec(
 
         call_data_cursor["_thread_count"] = uint3(total_threads, 1, 1);
 
-        m_runtime->write_shader_cursor_pre_dispatch(
-            context,
-            cursor,
-            call_data_cursor,
-            unpacked_args,
-            unpacked_kwargs,
-            read_back
-        );
+        if (indirect_count) {
+            call_data_cursor["_indirect_count"].set_buffer(indirect_count);
+            call_data_cursor["_indirect_offset"] = opts->indirect_offset();
+        }
+        if (gather_indices) {
+            call_data_cursor["_gather_indices"].set_buffer(gather_indices);
+            call_data_cursor["_gather_offset"] = opts->gather_offset();
+            call_data_cursor["_gather_count"] = opts->gather_count();
+        }
+
+        try {
+            m_runtime->write_shader_cursor_pre_dispatch(
+                context,
+                cursor,
+                call_data_cursor,
+                unpacked_args,
+                unpacked_kwargs,
+                read_back,
+                image
+            );
+        } catch (...) {
+            if (image)
+                image->abort();
+            throw;
+        }
+        if (image)
+            image->end();
 
         nb::list uniforms = opts->uniforms();
         if (uniforms) {
@@ -660,6 +981,8 @@ nb::object NativeCallData::exec(
         }
     };
 
+    end_phase(m_last_call_timings.prepare);
+
     // Create temporary command encoder if none is provided.
     ref<CommandEncoder> temp_command_encoder;
     if (command_encoder == nullptr) {
@@ -669,37 +992,91 @@ nb::object NativeCallData::exec(
 
     bool is_ray_tracing = opts->is_ray_tracing();
 
+    // Convert the indirect count to thread groups on the device. CUDA doesn't support
+    // indirect dispatch, so launches the full call shape and relies on the kernel's bounds
+    // check against the count instead.
+    bool dispatch_indirect = indirect_count && m_device->type() != DeviceType::cuda;
+    if (dispatch_indirect) {
+        uint32_t capacity = gather_indices ? opts->gather_count() : uint32_t(cs[0]);
+        uint32_t inner_threads = gather_indices ? 1 : (cs[0] > 0 ? uint32_t(total_threads / cs[0]) : 0);
+        uint32_t group_size = static_cast<ComputePipeline*>(m_pipeline.get())->thread_group_size().x;
+        opts->indirect_args_kernel()->dispatch(
+            uint3(1, 1, 1),
+            [&](ShaderCursor cursor)
+            {
+                ShaderCursor entry_point = cursor.find_entry_point(0);
+                entry_point["count"].set_buffer(indirect_count);
+                entry_point["count_index"] = opts->indirect_offset();
+                entry_point["capacity"] = capacity;
+                entry_point["inner_threads"] = inner_threads;
+                entry_point["group_size"] = group_size;
+                entry_point["args"].set_buffer(opts->indirect_args());
+            },
+            command_encoder
+        );
+    }
+
     if (!is_ray_tracing) {
         ref<ComputePassEncoder> pass_encoder = command_encoder->begin_compute_pass();
         ComputePipeline* pipeline = dynamic_cast<ComputePipeline*>(m_pipeline.get());
         SGL_ASSERT(pipeline != nullptr);
-        ShaderCursor cursor(pass_encoder->bind_pipeline(pipeline));
-        bind_call_data(cursor);
-        pass_encoder->dispatch(uint3(total_threads, 1, 1));
+        ShaderObject* root = pass_encoder->bind_pipeline(pipeline);
+        bind_call_data(root);
+        if (dispatch_indirect)
+            pass_encoder->dispatch_compute_indirect(BufferOffsetPair(opts->indirect_args()));
+        else
+            pass_encoder->dispatch(uint3(dispatch_threads, 1, 1));
         pass_encoder->end();
     } else {
         ref<RayTracingPassEncoder> pass_encoder = command_encoder->begin_ray_tracing_pass();
         RayTracingPipeline* pipeline = dynamic_cast<RayTracingPipeline*>(m_pipeline.get());
         SGL_ASSERT(pipeline != nullptr);
-        ShaderCursor cursor(pass_encoder->bind_pipeline(pipeline, m_shader_table));
-        bind_call_data(cursor);
+        ShaderObject* root = pass_encoder->bind_pipeline(pipeline, m_shader_table);
+        bind_call_data(root);
         pass_encoder->dispatch_rays(0, uint3(total_threads, 1, 1));
         pass_encoder->end();
     }
 
+    end_phase(m_last_call_timings.encode);
+
     // If we created a temporary command encoder, we need to submit it.
     if (temp_command_encoder) {
         m_device->submit_command_buffer(temp_command_encoder->finish(), CommandQueueType::graphics, cuda_stream);
         command_encoder = nullptr;
+        end_phase(m_last_call_timings.submit);
     }
 
-    // If command_encoder is not null, return early.
+    // If command_encoder is not null, return early, keeping the state needed to read the
+    // results later if requested.
     if (command_encoder != nullptr) {
+        if (pending) {
+            pending->context = context;
+            pending->read_back = read_back;
+            pending->args = args;
+            pending->kwargs = kwargs;
+            pending->unpacked_args = unpacked_args;
+            pending->unpacked_kwargs = unpacked_kwargs;
+        }
         return nanobind::none();
     }
 
+    nb::object result = read_results(context.get(), read_back, args, kwargs, unpacked_args, unpacked_kwargs);
+
+    end_phase(m_last_call_timings.read_back);
+
+    return result;
+}
+
+nb::object NativeCallData::read_results(
+    CallContext* context,
+    nb::list read_back,
+    nb::args args,
+    nb::kwargs kwargs,
+    nb::list unpacked_args,
+    nb::dict unpacked_kwargs
+)
+{
     // Read call data post dispatch.
-    // m_runtime->read_call_data_post_dispatch(context, call_data, unpacked_args, unpacked_kwargs);
     for (auto val : read_back) {
         auto t = nb::cast<nb::tuple>(val);
         auto bvr = nb::cast<ref<NativeBoundVariableRuntime>>(t[0]);
@@ -717,13 +1094,15 @@ nb::object NativeCallData::exec(
     }
 
     // Handle return value based on call mode.
+    nb::object result = nb::none();
     if (m_call_mode == CallMode::prim) {
         auto rv_node_it = m_runtime->find_kwarg("_result");
         if (rv_node_it && !unpacked_kwargs["_result"].is_none()) {
-            return rv_node_it->read_output(context, unpacked_kwargs["_result"]);
+            result = rv_node_it->read_output(context, unpacked_kwargs["_result"]);
         }
     }
-    return nb::none();
+
+    return result;
 }
 
 nb::object PyNativeCallData::_py_torch_call(
@@ -736,9 +1115,10 @@ nb::object PyNativeCallData::_py_torch_call(
     NB_OVERRIDE(_py_torch_call, func, opts, args, kwargs);
 }
 
-NativeCallDataCache::NativeCallDataCache()
+NativeCallDataCache::NativeCallDataCache(size_t capacity)
+    : m_capacity(capacity)
 {
-    m_cache.reserve(1024);
+    m_cache.reserve(capacity > 0 ? capacity : 1024);
 
     m_type_signature_table[typeid(Texture)] = [](const ref<SignatureBuilder>& builder, nb::handle o)
     {
@@ -1354,12 +1734,51 @@ SGL_PY_EXPORT(utils_slangpy)
             &NativeCallRuntimeOptions::cuda_stream,
             &NativeCallRuntimeOptions::set_cuda_stream,
             D_NA(NativeCallRuntimeOptions, cuda_stream)
+        )
+        .def_prop_ro(
+            "indirect_count",
+            &NativeCallRuntimeOptions::indirect_count,
+            D_NA(NativeCallRuntimeOptions, indirect_count)
+        )
+        .def_prop_ro(
+            "indirect_offset",
+            &NativeCallRuntimeOptions::indirect_offset,
+            D_NA(NativeCallRuntimeOptions, indirect_offset)
+        )
+        .def_prop_ro(
+            "gather_indices",
+            &NativeCallRuntimeOptions::gather_indices,
+            D_NA(NativeCallRuntimeOptions, gather_indices)
+        )
+        .def_prop_ro(
+            "gather_count",
+            &NativeCallRuntimeOptions::gather_count,
+            D_NA(NativeCallRuntimeOptions, gather_count)
+        )
+        .def(
+            "set_gather",
+            &NativeCallRuntimeOptions::set_gather,
+            "indices"_a,
+            "offset"_a,
+            "count"_a,
+            D_NA(NativeCallRuntimeOptions, set_gather)
+        )
+        .def(
+            "set_indirect",
+            &NativeCallRuntimeOptions::set_indirect,
+            "count"_a,
+            "offset"_a,
+            "args_kernel"_a,
+            "args"_a,
+            D_NA(NativeCallRuntimeOptions, set_indirect)
         );
 
     // clang-format off
 #define DEF_LOG_METHOD(name) def(#name, [](NativeCallData& self, const std::string_view msg) { self.name(msg); }, "msg"_a)
     // clang-format on
 
+    nb::class_<NativePendingCall, Object>(slangpy, "NativePendingCall");
+
     nb::class_<NativeCallData, PyNativeCallData, Object>(slangpy, "NativeCallData") //
         .def(
             "__init__",
@@ -1415,6 +1834,31 @@ SGL_PY_EXPORT(utils_slangpy)
             nb::arg().none(),
             D_NA(NativeCallData, logger)
         )
+        .def_static(
+            "set_profiling_enabled",
+            &NativeCallData::set_profiling_enabled,
+            "enabled"_a,
+            D_NA(NativeCallData, set_profiling_enabled)
+        )
+        .def_static(
+            "is_profiling_enabled",
+            &NativeCallData::is_profiling_enabled,
+            D_NA(NativeCallData, is_profiling_enabled)
+        )
+        .def_prop_ro(
+            "last_call_timings",
+            [](const NativeCallData& self)
+            {
+                const NativeCallTimings& timings = self.last_call_timings();
+                nb::dict res;
+                res["prepare"] = timings.prepare;
+                res["encode"] = timings.encode;
+                res["submit"] = timings.submit;
+                res["read_back"] = timings.read_back;
+                return res;
+            },
+            D_NA(NativeCallData, last_call_timings)
+        )
         .def(
             "call",
             &NativeCallData::call,
@@ -1432,6 +1876,16 @@ SGL_PY_EXPORT(utils_slangpy)
             nb::arg("kwargs"),
             D_NA(NativeCallData, append_to)
         )
+        .def(
+            "append_pending",
+            &NativeCallData::append_pending,
+            nb::arg("opts"),
+            nb::arg("command_buffer"),
+            nb::arg("args"),
+            nb::arg("kwargs"),
+            D_NA(NativeCallData, append_pending)
+        )
+        .def("read_pending", &NativeCallData::read_pending, "pending"_a, D_NA(NativeCallData, read_pending))
         .def(
             "_py_torch_call",
             &NativeCallData::_py_torch_call,
@@ -1475,10 +1929,11 @@ SGL_PY_EXPORT(utils_slangpy)
     nb::class_<NativeCallDataCache, PyNativeCallDataCache, Object>(slangpy, "NativeCallDataCache")
         .def(
             "__init__",
-            [](NativeCallDataCache& self)
+            [](NativeCallDataCache& self, size_t capacity)
             {
-                new (&self) PyNativeCallDataCache();
+                new (&self) PyNativeCallDataCache(capacity);
             },
+            "capacity"_a = 0,
             D_NA(NativeCallDataCache, NativeCallDataCache)
         )
         .def(
@@ -1509,12 +1964,31 @@ SGL_PY_EXPORT(utils_slangpy)
             "call_data"_a,
             D_NA(NativeCallDataCache, add_call_data)
         )
+        .def(
+            "remove_call_data",
+            &NativeCallDataCache::remove_call_data,
+            "signature"_a,
+            D_NA(NativeCallDataCache, remove_call_data)
+        )
         .def(
             "lookup_value_signature",
             &NativeCallDataCache::lookup_value_signature,
             "o"_a,
             D_NA(NativeCallDataCache, lookup_value_signature)
-        );
+        )
+        .def_prop_rw(
+            "capacity",
+            &NativeCallDataCache::capacity,
+            &NativeCallDataCache::set_capacity,
+            D_NA(NativeCallDataCache, capacity)
+        )
+        .def_prop_ro("size", &NativeCallDataCache::size, D_NA(NativeCallDataCache, size))
+        .def_prop_ro("hits", &NativeCallDataCache::hits, D_NA(NativeCallDataCache, hits))
+        .def_prop_ro("misses", &NativeCallDataCache::misses, D_NA(NativeCallDataCache, misses))
+        .def_prop_ro("evictions", &NativeCallDataCache::evictions, D_NA(NativeCallDataCache, evictions))
+        .def("reset_stats", &NativeCallDataCache::reset_stats, D_NA(NativeCallDataCache, reset_stats))
+        .def("clear", &NativeCallDataCache::clear, D_NA(NativeCallDataCache, clear))
+        .def("__len__", &NativeCallDataCache::size, D_NA(NativeCallDataCache, size));
 
 
     nb::class_<Shape>(slangpy, "Shape") //
@@ -4,6 +4,8 @@
 
 #include <vector>
 #include <map>
+#include <list>
+#include <functional>
 #include <typeindex>
 #include <unordered_map>
 
@@ -12,9 +14,11 @@
 #include "sgl/core/macros.h"
 #include "sgl/core/fwd.h"
 #include "sgl/core/object.h"
+#include "sgl/core/timer.h"
 #include "sgl/device/fwd.h"
 #include "sgl/device/shader_cursor.h"
 #include "sgl/device/shader_object.h"
+#include "sgl/device/kernel.h"
 #include "sgl/utils/slangpy.h"
 
 namespace sgl::slangpy {
@@ -457,6 +461,70 @@ struct PyNativeMarshall : public NativeMarshall {
     }
 };
 
+/// Host side image of the uniform data of a call data parameter block, which persists
+/// between dispatches of a NativeCallData. While a dispatch is being bound, uniform
+/// writes go to the image and everything else (resources, sub-objects) is forwarded to
+/// the block of the dispatch. Once all arguments are written the image is copied to the
+/// block in a single write followed by the forwarded bindings, so arguments whose values
+/// haven't changed since the last dispatch don't need converting or writing at all.
+///
+/// Each dispatch binds a fresh block, so the whole image is always copied to it. The saving
+/// is in skipping the per argument marshalling, not in the size of the copy.
+class CallDataImage : public ShaderObject {
+public:
+    CallDataImage(ref<Device> device);
+
+    /// Start binding a dispatch's call data block, whose uniform data is size bytes.
+    void begin(ref<ShaderObject> block, size_t size);
+
+    /// Copy the image to the block and finish binding it.
+    void end();
+
+    /// Stop binding the block without writing to it (eg if writing an argument failed).
+    void abort();
+
+    /// Whether a block is being bound.
+    bool is_active() const { return m_block != nullptr; }
+
+    /// Number of non-uniform writes (resources, sub-objects) forwarded to blocks. A write
+    /// that doesn't change it only wrote uniform data.
+    uint64_t binding_count() const { return m_binding_count; }
+
+    ref<const TypeLayoutReflection> element_type_layout() const override;
+    slang::TypeLayoutReflection* slang_element_type_layout() const override;
+
+    uint32_t get_entry_point_count() const override;
+    ref<ShaderObject> get_entry_point(uint32_t index) override;
+
+    ref<ShaderObject> get_object(const ShaderOffset& offset) override;
+    void set_object(const ShaderOffset& offset, const ref<ShaderObject>& object) override;
+
+    void set_buffer(const ShaderOffset& offset, const ref<Buffer>& buffer) override;
+    void set_buffer_view(const ShaderOffset& offset, const ref<BufferView>& buffer_view) override;
+    void set_texture(const ShaderOffset& offset, const ref<Texture>& texture) override;
+    void set_texture_view(const ShaderOffset& offset, const ref<TextureView>& texture_view) override;
+    void set_sampler(const ShaderOffset& offset, const ref<Sampler>& sampler) override;
+    void set_acceleration_structure(
+        const ShaderOffset& offset,
+        const ref<AccelerationStructure>& acceleration_structure
+    ) override;
+    void set_descriptor_handle(const ShaderOffset& offset, const DescriptorHandle& handle) override;
+    void set_data(const ShaderOffset& offset, const void* data, size_t size) override;
+
+    void
+    set_cuda_tensor_view_buffer(const ShaderOffset& offset, const cuda::TensorView& tensor_view, bool is_uav) override;
+    void set_cuda_tensor_view_pointer(const ShaderOffset& offset, const cuda::TensorView& tensor_view) override;
+    void get_cuda_interop_buffers(std::vector<ref<cuda::InteropBuffer>>& cuda_interop_buffers) const override;
+
+private:
+    ref<ShaderObject> m_block;
+    std::vector<uint8_t> m_data;
+    std::vector<std::function<void(ShaderObject*)>> m_deferred;
+    uint64_t m_binding_count{0};
+
+    void defer(std::function<void(ShaderObject*)> write);
+};
+
 /// Binding information that links a python argument to a slang parameter. In
 /// the case of structs, this can be nested, mapping python dictionary fields to
 /// slang struct fields.
@@ -526,9 +594,15 @@ public:
     void populate_call_shape(std::vector<int>& call_shape, nb::object value, NativeCallData* error_context);
 
     /// Write call data to shader cursor before dispatch, optionally writing data for read back after the kernel has
-    /// run.
-    void
-    write_shader_cursor_pre_dispatch(CallContext* context, ShaderCursor cursor, nb::object value, nb::list read_back);
+    /// run. If the cursor writes to a call data image, leaves whose value is unchanged since the last dispatch are
+    /// skipped.
+    void write_shader_cursor_pre_dispatch(
+        CallContext* context,
+        ShaderCursor cursor,
+        nb::object value,
+        nb::list read_back,
+        CallDataImage* image = nullptr
+    );
 
     /// Read back changes from call data after a kernel has been executed by calling read_calldata on the marshal.
     void read_call_data_post_dispatch(CallContext* context, nb::dict call_data, nb::object value);
@@ -549,6 +623,21 @@ private:
     int m_call_dimensionality{0};
     ref<NativeSlangType> m_vector_type;
     bool m_is_param_block{false};
+
+    // Value last written to the call data image by this leaf, if it can be compared, and
+    // whether writing it only wrote uniform data. Immutable scalars are kept as is, whereas
+    // math types (vectors, matrices, quaternions) are mutable, so a copy of their bytes is
+    // kept instead.
+    PyTypeObject* m_image_type{nullptr};
+    nb::object m_image_value;
+    std::vector<uint8_t> m_image_bytes;
+    bool m_image_uniform_only{false};
+
+    /// Whether a value matches the one last written to the call data image.
+    bool image_value_matches(nb::handle value) const;
+
+    /// Record the value written to the call data image, if it can be compared.
+    void store_image_value(nb::handle value);
 };
 
 /// Binding information for a call to a compute kernel. Includes a set of positional
@@ -589,7 +678,8 @@ public:
         ShaderCursor call_data_cursor,
         nb::list args,
         nb::dict kwargs,
-        nb::list read_back
+        nb::list read_back,
+        CallDataImage* image = nullptr
     );
 
     /// Read back changes from call data after a kernel has been executed by calling read_calldata on the argument
@@ -631,6 +721,49 @@ public:
     /// Set ray tracing pipeline flag.
     void set_is_ray_tracing(bool is_ray_tracing) { m_is_ray_tracing = is_ray_tracing; }
 
+    /// Get the buffer holding the outermost call dimension of an indirect call, if any.
+    ref<Buffer> indirect_count() const { return m_indirect_count; }
+
+    /// Get the index of the uint element holding the count in the indirect count buffer.
+    uint32_t indirect_offset() const { return m_indirect_offset; }
+
+    /// Get the kernel that converts the indirect count to dispatch arguments.
+    ref<ComputeKernel> indirect_args_kernel() const { return m_indirect_args_kernel; }
+
+    /// Get the buffer the dispatch arguments of an indirect call are written to.
+    ref<Buffer> indirect_args() const { return m_indirect_args; }
+
+    /// Make the call indirect, taking its outermost dimension from a uint on the device.
+    void set_indirect(
+        const ref<Buffer>& count,
+        uint32_t offset,
+        const ref<ComputeKernel>& args_kernel,
+        const ref<Buffer>& args
+    )
+    {
+        m_indirect_count = count;
+        m_indirect_offset = offset;
+        m_indirect_args_kernel = args_kernel;
+        m_indirect_args = args;
+    }
+
+    /// Get the buffer of flat call shape indices a gather call runs for, if any.
+    ref<Buffer> gather_indices() const { return m_gather_indices; }
+
+    /// Get the index of the first element of the gather indices in their buffer.
+    uint32_t gather_offset() const { return m_gather_offset; }
+
+    /// Get the number of gather indices.
+    uint32_t gather_count() const { return m_gather_count; }
+
+    /// Make the call run only for the elements of the call shape at a list of flat indices.
+    void set_gather(const ref<Buffer>& indices, uint32_t offset, uint32_t count)
+    {
+        m_gather_indices = indices;
+        m_gather_offset = offset;
+        m_gather_count = count;
+    }
+
     /// Clear internal data for garbage collection
     void garbage_collect()
     {
@@ -643,6 +776,38 @@ private:
     nb::object m_this{nb::none()};
     NativeHandle m_cuda_stream;
     bool m_is_ray_tracing{false};
+    ref<Buffer> m_indirect_count;
+    uint32_t m_indirect_offset{0};
+    ref<ComputeKernel> m_indirect_args_kernel;
+    ref<Buffer> m_indirect_args;
+    ref<Buffer> m_gather_indices;
+    uint32_t m_gather_offset{0};
+    uint32_t m_gather_count{0};
+};
+
+/// Wall time (in seconds) spent in each phase of a call, recorded when profiling is enabled.
+struct NativeCallTimings {
+    /// Unpacking arguments, calculating the call shape and allocating outputs.
+    double prepare{0.0};
+    /// Binding the pipeline and writing call data/uniforms.
+    double encode{0.0};
+    /// Submitting the command buffer (zero when appending to a command encoder).
+    double submit{0.0};
+    /// Reading back results and packing return values (zero when appending to a command encoder).
+    double read_back{0.0};
+};
+
+/// State of a call appended to a command encoder with NativeCallData::append_pending, needed
+/// to read its results once the command encoder has been submitted.
+class NativePendingCall : public Object {
+    SGL_OBJECT(NativePendingCall)
+public:
+    ref<CallContext> context;
+    nb::list read_back;
+    nb::args args;
+    nb::kwargs kwargs;
+    nb::list unpacked_args;
+    nb::dict unpacked_kwargs;
 };
 
 /// Defines the common logging functions for a given log level.
@@ -749,6 +914,15 @@ public:
     /// Get the shape of call groups when a dispatch is made.
     const Shape& call_group_shape() const { return m_call_group_shape; }
 
+    /// Enable/disable recording of phase timings for every call (used for profiling).
+    static void set_profiling_enabled(bool enabled) { s_profiling_enabled = enabled; }
+
+    /// Check if recording of phase timings is enabled.
+    static bool is_profiling_enabled() { return s_profiling_enabled; }
+
+    /// Get the wall time (in seconds) spent in each phase of the last call, if profiling is enabled.
+    const NativeCallTimings& last_call_timings() const { return m_last_call_timings; }
+
     /// Call the compute kernel with the provided arguments and keyword arguments.
     nb::object call(ref<NativeCallRuntimeOptions> opts, nb::args args, nb::kwargs kwargs);
 
@@ -756,6 +930,18 @@ public:
     nb::object
     append_to(ref<NativeCallRuntimeOptions> opts, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
 
+    /// Append the compute kernel to a command encoder, allocating the return value as a call would.
+    /// The results are read back by read_pending once the command encoder has been submitted.
+    ref<NativePendingCall> append_pending(
+        ref<NativeCallRuntimeOptions> opts,
+        CommandEncoder* command_encoder,
+        nb::args args,
+        nb::kwargs kwargs
+    );
+
+    /// Read back the results of a call appended by append_pending and return its result.
+    nb::object read_pending(NativePendingCall* pending);
+
     /// Log a message, using either the provided logger or the default logger.
     void log(LogLevel level, const std::string_view msg, LogFrequency frequency = LogFrequency::always)
     {
@@ -808,9 +994,27 @@ private:
     Shape m_call_group_shape;
     bool m_torch_integration{false};
     bool m_torch_autograd{false};
+    NativeCallTimings m_last_call_timings;
+    ref<CallDataImage> m_call_data_image;
 
-    nb::object
-    exec(ref<NativeCallRuntimeOptions> opts, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
+    static inline bool s_profiling_enabled{false};
+
+    nb::object exec(
+        ref<NativeCallRuntimeOptions> opts,
+        CommandEncoder* command_encoder,
+        nb::args args,
+        nb::kwargs kwargs,
+        NativePendingCall* pending = nullptr
+    );
+
+    nb::object read_results(
+        CallContext* context,
+        nb::list read_back,
+        nb::args args,
+        nb::kwargs kwargs,
+        nb::list unpacked_args,
+        nb::dict unpacked_kwargs
+    );
 };
 #undef SGL_LOG_FUNC_FAMILY
 
@@ -829,28 +1033,128 @@ public:
 typedef std::function<bool(const ref<SignatureBuilder>& builder, nb::handle)> BuildSignatureFunc;
 
 /// Native side of system for caching call data info for given function signatures.
+/// The cache is optionally bounded, in which case the least recently used entries
+/// are evicted once the capacity is exceeded.
 class NativeCallDataCache : Object {
     SGL_OBJECT(NativeCallDataCache)
 
+    using LRUList = std::list<std::pair<std::string, ref<NativeCallData>>>;
+
 public:
-    NativeCallDataCache();
+    /// Handle to a cache entry. Only valid while the cache generation is unchanged.
+    using EntryHandle = LRUList::iterator;
+
+    NativeCallDataCache(size_t capacity = 0);
 
     void get_value_signature(const ref<SignatureBuilder> builder, nb::handle o);
 
     void get_args_signature(const ref<SignatureBuilder> builder, nb::args args, nb::kwargs kwargs);
 
+    /// Write the signature of a bound type with a native signature function (e.g. Buffer/Texture).
+    /// Returns false if there is none for the type.
+    bool get_type_table_signature(const ref<SignatureBuilder>& builder, nb::handle o) const
+    {
+        auto it = m_type_signature_table.find(nb::type_info(o.type()));
+        return it != m_type_signature_table.end() && it->second(builder, o);
+    }
+
     ref<NativeCallData> find_call_data(const std::string& signature)
     {
         auto it = m_cache.find(signature);
         if (it != m_cache.end()) {
-            return it->second;
+            // Move entry to the front of the LRU list.
+            m_lru.splice(m_lru.begin(), m_lru, it->second);
+            m_hits++;
+            return it->second->second;
         }
+        m_misses++;
         return nullptr;
     }
 
     void add_call_data(const std::string& signature, const ref<NativeCallData>& call_data)
     {
-        m_cache[signature] = call_data;
+        auto it = m_cache.find(signature);
+        if (it != m_cache.end()) {
+            it->second->second = call_data;
+            m_lru.splice(m_lru.begin(), m_lru, it->second);
+            m_generation++;
+            return;
+        }
+        m_lru.emplace_front(signature, call_data);
+        m_cache[signature] = m_lru.begin();
+        evict_to_capacity();
+    }
+
+    /// Get handle to the entry for a signature, without affecting stats or LRU order.
+    std::optional<EntryHandle> find_entry(const std::string& signature)
+    {
+        auto it = m_cache.find(signature);
+        if (it == m_cache.end())
+            return std::nullopt;
+        return it->second;
+    }
+
+    /// Look up call data via an entry handle, counting as a hit. The caller must have
+    /// checked the handle is still valid by comparing generations.
+    ref<NativeCallData> use_entry(EntryHandle entry)
+    {
+        m_lru.splice(m_lru.begin(), m_lru, entry);
+        m_hits++;
+        return entry->second;
+    }
+
+    /// Incremented whenever an entry is removed or replaced, invalidating entry handles.
+    uint64_t generation() const { return m_generation; }
+
+    /// Maximum number of entries held by the cache (0 = unbounded).
+    size_t capacity() const { return m_capacity; }
+
+    /// Set maximum number of entries held by the cache (0 = unbounded). Evicts immediately if needed.
+    void set_capacity(size_t capacity)
+    {
+        m_capacity = capacity;
+        evict_to_capacity();
+    }
+
+    /// Number of entries currently in the cache.
+    size_t size() const { return m_cache.size(); }
+
+    /// Number of successful lookups.
+    uint64_t hits() const { return m_hits; }
+
+    /// Number of failed lookups.
+    uint64_t misses() const { return m_misses; }
+
+    /// Number of entries evicted due to the capacity limit.
+    uint64_t evictions() const { return m_evictions; }
+
+    /// Reset hit/miss/eviction counters.
+    void reset_stats()
+    {
+        m_hits = 0;
+        m_misses = 0;
+        m_evictions = 0;
+    }
+
+    /// Remove the entry for a signature, if any, so the next call with it builds new call
+    /// data. Returns whether an entry was removed.
+    bool remove_call_data(const std::string& signature)
+    {
+        auto it = m_cache.find(signature);
+        if (it == m_cache.end())
+            return false;
+        m_lru.erase(it->second);
+        m_cache.erase(it);
+        m_generation++;
+        return true;
+    }
+
+    /// Remove all entries from the cache (does not reset counters).
+    void clear()
+    {
+        m_cache.clear();
+        m_lru.clear();
+        m_generation++;
     }
 
     virtual std::optional<std::string> lookup_value_signature(nb::handle o)
@@ -860,13 +1164,35 @@ public:
     }
 
 private:
-    std::unordered_map<std::string, ref<NativeCallData>> m_cache;
+    void evict_to_capacity()
+    {
+        if (m_capacity == 0)
+            return;
+        while (m_cache.size() > m_capacity) {
+            m_cache.erase(m_lru.back().first);
+            m_lru.pop_back();
+            m_evictions++;
+            m_generation++;
+        }
+    }
+
+    LRUList m_lru;
+    std::unordered_map<std::string, LRUList::iterator> m_cache;
     std::unordered_map<std::type_index, BuildSignatureFunc> m_type_signature_table;
+    size_t m_capacity{0};
+    uint64_t m_hits{0};
+    uint64_t m_misses{0};
+    uint64_t m_evictions{0};
+    uint64_t m_generation{0};
 };
 
 class PyNativeCallDataCache : public NativeCallDataCache {
 public:
     NB_TRAMPOLINE(NativeCallDataCache, 1);
+    PyNativeCallDataCache(size_t capacity = 0)
+        : NativeCallDataCache(capacity)
+    {
+    }
     std::optional<std::string> lookup_value_signature(nb::handle o) override { NB_OVERRIDE(lookup_value_signature, o); }
 };
 
@@ -7,6 +7,7 @@
 #include "sgl/device/buffer_cursor.h"
 
 #include "utils/slangpybuffer.h"
+#include "utils/slangpybufferpool.h"
 
 #include <fmt/format.h>
 
@@ -142,17 +143,26 @@ nb::object NativeNDBufferMarshall::create_output(CallContext* context, NativeBou
     return nb::cast(buffer);
 }
 
-ref<NativeNDBuffer> NativeNDBufferMarshall::create_buffer(Device* device, const Shape& shape) const
+ref<NativeNDBuffer>
+NativeNDBufferMarshall::create_buffer(Device* device, const Shape& shape, ref<Buffer> storage) const
 {
     NativeNDBufferDesc desc;
     desc.dtype = m_slang_element_type;
-    desc.element_layout = m_element_layout;
+    desc.element_layout = element_layout();
     desc.offset = 0;
     desc.shape = shape;
     desc.strides = desc.shape.calc_contiguous_strides();
     desc.usage = BufferUsage::shader_resource | BufferUsage::unordered_access;
     desc.memory_type = MemoryType::device_local;
-    return make_ref<NativeNDBuffer>(device, desc);
+    if (!storage) {
+        BufferDesc buffer_desc;
+        buffer_desc.element_count = desc.shape.element_count();
+        buffer_desc.struct_size = desc.element_layout->stride();
+        buffer_desc.usage = desc.usage;
+        buffer_desc.memory_type = desc.memory_type;
+        storage = BufferPool::create_buffer(device, buffer_desc);
+    }
+    return make_ref<NativeNDBuffer>(device, desc, std::move(storage));
 }
 
 nb::object NativeNDBufferMarshall::create_dispatchdata(nb::object data) const
@@ -219,8 +229,14 @@ void NativeNumpyMarshall::write_shader_cursor_pre_dispatch(
 
     Shape shape(shape_vec);
 
-    SGL_UNUSED(binding);
-    auto buffer = create_buffer(context->device(), shape);
+    // The storage is drawn from the device's buffer pool when staging buffers are pooled.
+    BufferDesc storage_desc;
+    storage_desc.element_count = shape.element_count();
+    storage_desc.struct_size = element_stride();
+    storage_desc.usage = BufferUsage::shader_resource | BufferUsage::unordered_access;
+    storage_desc.memory_type = MemoryType::device_local;
+    ref<NativeNDBuffer> buffer
+        = create_buffer(context->device(), shape, create_staging_buffer(context->device(), storage_desc));
     buffer_copy_from_numpy(buffer->storage().get(), ndarray);
 
     auto buffer_obj = nb::cast(buffer);
@@ -237,21 +253,45 @@ void NativeNumpyMarshall::read_calldata(
 ) const
 {
     SGL_UNUSED(context);
-    SGL_UNUSED(binding);
 
     auto ndarray = nb::cast<nb::ndarray<nb::numpy>>(data);
     auto buffer = nb::cast<NativeNDBuffer*>(result);
+    ref<Buffer> storage = buffer->storage();
 
-    size_t numpy_data_size = ndarray.nbytes();
-    size_t buffer_data_size = buffer->storage()->size();
-    SGL_CHECK(
-        numpy_data_size == buffer_data_size,
-        "numpy array size does not match the buffer ({} > {})",
-        numpy_data_size,
-        buffer_data_size
-    );
+    // Arrays that are only read by the kernel don't need copying back.
+    if (binding->access().first != AccessType::read) {
+        size_t numpy_data_size = ndarray.nbytes();
+        size_t buffer_data_size = storage->size();
+        SGL_CHECK(
+            numpy_data_size == buffer_data_size,
+            "numpy array size does not match the buffer ({} > {})",
+            numpy_data_size,
+            buffer_data_size
+        );
 
-    buffer->storage()->get_data(ndarray.data(), buffer_data_size);
+        if (s_staging_pool_enabled || BufferPool::is_enabled()) {
+            // Copy through a pooled read back buffer rather than a temporary one.
+            Device* device = storage->device();
+            BufferDesc desc;
+            desc.size = buffer_data_size;
+            desc.usage = BufferUsage::copy_destination;
+            desc.memory_type = MemoryType::read_back;
+            ref<Buffer> read_back = create_staging_buffer(device, desc);
+            ref<CommandEncoder> command_encoder = device->create_command_encoder();
+            command_encoder->copy_buffer(read_back.get(), 0, storage.get(), 0, buffer_data_size);
+            device->wait_for_submit(device->submit_command_buffer(command_encoder->finish()));
+            read_back->get_data(ndarray.data(), buffer_data_size);
+        } else {
+            storage->get_data(ndarray.data(), buffer_data_size);
+        }
+    }
+}
+
+ref<Buffer> NativeNumpyMarshall::create_staging_buffer(Device* device, const BufferDesc& desc)
+{
+    if (s_staging_pool_enabled)
+        return BufferPool::get(device)->acquire(desc);
+    return BufferPool::create_buffer(device, desc);
 }
 
 nb::object NativeNumpyMarshall::create_output(CallContext* context, NativeBoundVariableRuntime* binding) const
@@ -371,5 +411,16 @@ SGL_PY_EXPORT(utils_slangpy_buffer)
             "numpydtype"_a,
             D_NA(NativeNumpyMarshall, NativeNumpyMarshall)
         )
-        .def_prop_ro("dtype", &sgl::slangpy::NativeNumpyMarshall::dtype);
+        .def_prop_ro("dtype", &sgl::slangpy::NativeNumpyMarshall::dtype)
+        .def_static(
+            "set_staging_pool_enabled",
+            &NativeNumpyMarshall::set_staging_pool_enabled,
+            "enabled"_a,
+            D_NA(NativeNumpyMarshall, set_staging_pool_enabled)
+        )
+        .def_static(
+            "is_staging_pool_enabled",
+            &NativeNumpyMarshall::is_staging_pool_enabled,
+            D_NA(NativeNumpyMarshall, is_staging_pool_enabled)
+        );
 }
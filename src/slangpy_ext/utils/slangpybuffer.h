@@ -62,8 +62,16 @@ public:
     int dims() const { return m_dims; }
     bool writable() const { return m_writable; }
     ref<NativeSlangType> slang_element_type() const { return m_slang_element_type; }
-    ref<TypeLayoutReflection> element_layout() const { return m_element_layout; }
-    size_t element_stride() const { return m_element_layout->stride(); }
+    ref<TypeLayoutReflection> element_layout() const
+    {
+        // A hot reload invalidates all reflection, while the marshall lives on in the call
+        // data of modules the reload didn't affect. The element type's reflection is updated
+        // in place, so look the layout up from it again.
+        if (!m_element_layout->is_valid())
+            m_element_layout = m_slang_element_type->buffer_type_layout();
+        return m_element_layout;
+    }
+    size_t element_stride() const { return element_layout()->stride(); }
 
     Shape get_shape(nb::object data) const override;
 
@@ -89,13 +97,13 @@ public:
     nb::object read_output(CallContext* context, NativeBoundVariableRuntime* binding, nb::object data) const override;
 
 protected:
-    ref<NativeNDBuffer> create_buffer(Device* device, const Shape& shape) const;
+    ref<NativeNDBuffer> create_buffer(Device* device, const Shape& shape, ref<Buffer> storage = nullptr) const;
 
 private:
     int m_dims;
     bool m_writable;
     ref<NativeSlangType> m_slang_element_type;
-    ref<TypeLayoutReflection> m_element_layout;
+    mutable ref<TypeLayoutReflection> m_element_layout;
 };
 
 class NativeNumpyMarshall : public NativeNDBufferMarshall {
@@ -114,6 +122,14 @@ public:
 
     nb::dlpack::dtype dtype() const { return m_dtype; }
 
+    /// Enable/disable pooling of the device and read back buffers used to stage numpy arrays.
+    /// When enabled they're drawn from the device's buffer pool even if pooling of other
+    /// transient buffers is disabled.
+    static void set_staging_pool_enabled(bool enabled) { s_staging_pool_enabled = enabled; }
+
+    /// Check if pooling of staging buffers is enabled.
+    static bool is_staging_pool_enabled() { return s_staging_pool_enabled; }
+
     Shape get_shape(nb::object data) const override;
 
     void write_shader_cursor_pre_dispatch(
@@ -137,6 +153,11 @@ public:
 
 private:
     nb::dlpack::dtype m_dtype;
+
+    static inline bool s_staging_pool_enabled{false};
+
+    /// Create a staging buffer, from the device's buffer pool if staging buffers are pooled.
+    static ref<Buffer> create_staging_buffer(Device* device, const BufferDesc& desc);
 };
 
 } // namespace sgl::slangpy
@@ -0,0 +1,299 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include "nanobind.h"
+
+#include "sgl/device/device.h"
+#include "sgl/device/reflection.h"
+
+#include "utils/slangpybufferpool.h"
+
+#include <fmt/format.h>
+
+#include <algorithm>
+
+namespace sgl::slangpy {
+
+bool BufferPool::s_enabled = false;
+
+namespace {
+    std::mutex s_pools_mutex;
+    std::map<Device*, ref<BufferPool>> s_pools;
+} // namespace
+
+BufferPool::BufferPool(Device* device)
+    : m_device(device)
+{
+}
+
+ref<BufferPool> BufferPool::get(Device* device)
+{
+    std::lock_guard<std::mutex> lock(s_pools_mutex);
+    auto it = s_pools.find(device);
+    if (it != s_pools.end())
+        return it->second;
+
+    ref<BufferPool> pool = make_ref<BufferPool>(device);
+    s_pools[device] = pool;
+    device->register_device_close_callback(
+        [](Device* closing_device)
+        {
+            ref<BufferPool> closing_pool;
+            {
+                std::lock_guard<std::mutex> lock(s_pools_mutex);
+                auto closing_it = s_pools.find(closing_device);
+                if (closing_it == s_pools.end())
+                    return;
+                closing_pool = std::move(closing_it->second);
+                s_pools.erase(closing_it);
+            }
+            closing_pool->clear();
+        }
+    );
+    return pool;
+}
+
+ref<Buffer> BufferPool::create_buffer(Device* device, const BufferDesc& desc)
+{
+    // Buffers with initial data or debug labels are never pooled.
+    if (!s_enabled || desc.data || !desc.label.empty())
+        return device->create_buffer(desc);
+    return get(device)->acquire(desc);
+}
+
+ref<Buffer> BufferPool::acquire(const BufferDesc& desc)
+{
+    size_t size = desc.size;
+    size_t struct_size = desc.struct_size;
+    if (desc.resource_type_layout)
+        struct_size = desc.resource_type_layout->element_type_layout()->stride();
+    if (desc.element_count > 0)
+        size = desc.element_count * struct_size;
+
+    Key key{size, struct_size, desc.usage, desc.memory_type};
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    collect();
+
+    Bucket& bucket = m_buckets[key];
+    if (!bucket.free.empty()) {
+        Entry entry = std::move(bucket.free.back());
+        bucket.free.pop_back();
+        m_free_bytes -= entry.buffer->size();
+        m_hits++;
+        return bucket.in_use.emplace_back(std::move(entry)).buffer;
+    }
+
+    m_misses++;
+    Entry& entry = bucket.in_use.emplace_back();
+    entry.buffer = m_device->create_buffer(desc);
+    m_bytes += entry.buffer->size();
+    m_peak_bytes = std::max(m_peak_bytes, m_bytes);
+    return entry.buffer;
+}
+
+void BufferPool::collect()
+{
+    // Buffers released since the last submit can only be reused once the next submit
+    // finishes, so there is nothing to gain from looking for them more than once per submit.
+    uint64_t submit_id = m_device->last_submit_id();
+    if (submit_id == m_collect_id)
+        return;
+    m_collect_id = submit_id;
+
+    for (auto& [key, bucket] : m_buckets) {
+        for (auto it = bucket.in_use.begin(); it != bucket.in_use.end();) {
+            if (it->buffer->ref_count() == 1) {
+                // The last user may have encoded work with the buffer that has not been
+                // submitted yet, so it can only be reused once the next submit finishes.
+                it->release_id = submit_id + 1;
+                bucket.released.push_back(std::move(*it));
+                it = bucket.in_use.erase(it);
+            } else {
+                ++it;
+            }
+        }
+        update_released(bucket, submit_id);
+    }
+    evict(submit_id);
+}
+
+void BufferPool::update_released(Bucket& bucket, uint64_t submit_id)
+{
+    for (auto it = bucket.released.begin(); it != bucket.released.end();) {
+        if (m_device->is_submit_finished(it->release_id)) {
+            it->free_id = submit_id;
+            m_free_bytes += it->buffer->size();
+            bucket.free.push_back(std::move(*it));
+            it = bucket.released.erase(it);
+        } else {
+            ++it;
+        }
+    }
+}
+
+void BufferPool::evict(uint64_t submit_id)
+{
+    // Release buffers that have not been reused for a while, as the shapes using them are
+    // likely gone.
+    for (auto& [key, bucket] : m_buckets) {
+        auto idle = std::find_if(
+            bucket.free.begin(),
+            bucket.free.end(),
+            [&](const Entry& entry) { return submit_id - entry.free_id <= m_max_idle_submits; }
+        );
+        for (auto it = bucket.free.begin(); it != idle; ++it) {
+            m_bytes -= it->buffer->size();
+            m_free_bytes -= it->buffer->size();
+            m_evictions++;
+        }
+        bucket.free.erase(bucket.free.begin(), idle);
+    }
+
+    // Release the least recently freed buffers until the free buffers fit the limit.
+    while (m_free_bytes > m_max_free_bytes) {
+        Bucket* oldest = nullptr;
+        for (auto& [key, bucket] : m_buckets) {
+            if (!bucket.free.empty() && (!oldest || bucket.free.front().free_id < oldest->free.front().free_id))
+                oldest = &bucket;
+        }
+        if (!oldest)
+            break;
+        size_t size = oldest->free.front().buffer->size();
+        m_bytes -= size;
+        m_free_bytes -= size;
+        m_evictions++;
+        oldest->free.erase(oldest->free.begin());
+    }
+
+    for (auto it = m_buckets.begin(); it != m_buckets.end();) {
+        const Bucket& bucket = it->second;
+        bool empty = bucket.in_use.empty() && bucket.released.empty() && bucket.free.empty();
+        it = empty ? m_buckets.erase(it) : std::next(it);
+    }
+}
+
+void BufferPool::trim()
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    for (auto it = m_buckets.begin(); it != m_buckets.end();) {
+        Bucket& bucket = it->second;
+        for (auto entry = bucket.in_use.begin(); entry != bucket.in_use.end();) {
+            if (entry->buffer->ref_count() == 1) {
+                m_bytes -= entry->buffer->size();
+                entry = bucket.in_use.erase(entry);
+            } else {
+                ++entry;
+            }
+        }
+        for (const Entry& entry : bucket.released)
+            m_bytes -= entry.buffer->size();
+        for (const Entry& entry : bucket.free)
+            m_bytes -= entry.buffer->size();
+        bucket.released.clear();
+        bucket.free.clear();
+        it = bucket.in_use.empty() ? m_buckets.erase(it) : std::next(it);
+    }
+    m_free_bytes = 0;
+}
+
+void BufferPool::clear()
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_buckets.clear();
+    m_bytes = 0;
+    m_free_bytes = 0;
+}
+
+void BufferPool::reset_stats()
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_hits = 0;
+    m_misses = 0;
+    m_evictions = 0;
+    m_peak_bytes = m_bytes;
+}
+
+void BufferPool::set_max_free_bytes(size_t max_free_bytes)
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_max_free_bytes = max_free_bytes;
+    evict(m_collect_id);
+}
+
+void BufferPool::set_max_idle_submits(uint64_t max_idle_submits)
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_max_idle_submits = max_idle_submits;
+    evict(m_collect_id);
+}
+
+size_t BufferPool::buffer_count() const
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    size_t count = 0;
+    for (const auto& [key, bucket] : m_buckets)
+        count += bucket.in_use.size() + bucket.released.size() + bucket.free.size();
+    return count;
+}
+
+std::string BufferPool::to_string() const
+{
+    return fmt::format(
+        "BufferPool(\n"
+        "  buffer_count = {},\n"
+        "  bytes = {},\n"
+        "  free_bytes = {},\n"
+        "  peak_bytes = {},\n"
+        "  hits = {},\n"
+        "  misses = {},\n"
+        "  evictions = {}\n"
+        ")",
+        buffer_count(),
+        m_bytes,
+        m_free_bytes,
+        m_peak_bytes,
+        m_hits,
+        m_misses,
+        m_evictions
+    );
+}
+
+} // namespace sgl::slangpy
+
+SGL_PY_EXPORT(utils_slangpy_bufferpool)
+{
+    using namespace sgl;
+    using namespace sgl::slangpy;
+
+    nb::module_ slangpy = m.attr("slangpy");
+
+    nb::class_<BufferPool, Object>(slangpy, "BufferPool") //
+        .def_static("get", &BufferPool::get, "device"_a, D_NA(BufferPool, get))
+        .def_static("create_buffer", &BufferPool::create_buffer, "device"_a, "desc"_a, D_NA(BufferPool, create_buffer))
+        .def_static("set_enabled", &BufferPool::set_enabled, "enabled"_a, D_NA(BufferPool, set_enabled))
+        .def_static("is_enabled", &BufferPool::is_enabled, D_NA(BufferPool, is_enabled))
+        .def("acquire", &BufferPool::acquire, "desc"_a, D_NA(BufferPool, acquire))
+        .def("trim", &BufferPool::trim, D_NA(BufferPool, trim))
+        .def("clear", &BufferPool::clear, D_NA(BufferPool, clear))
+        .def("reset_stats", &BufferPool::reset_stats, D_NA(BufferPool, reset_stats))
+        .def_prop_ro("hits", &BufferPool::hits, D_NA(BufferPool, hits))
+        .def_prop_ro("misses", &BufferPool::misses, D_NA(BufferPool, misses))
+        .def_prop_ro("evictions", &BufferPool::evictions, D_NA(BufferPool, evictions))
+        .def_prop_ro("buffer_count", &BufferPool::buffer_count, D_NA(BufferPool, buffer_count))
+        .def_prop_ro("bytes", &BufferPool::bytes, D_NA(BufferPool, bytes))
+        .def_prop_ro("free_bytes", &BufferPool::free_bytes, D_NA(BufferPool, free_bytes))
+        .def_prop_ro("peak_bytes", &BufferPool::peak_bytes, D_NA(BufferPool, peak_bytes))
+        .def_prop_rw(
+            "max_free_bytes",
+            &BufferPool::max_free_bytes,
+            &BufferPool::set_max_free_bytes,
+            D_NA(BufferPool, max_free_bytes)
+        )
+        .def_prop_rw(
+            "max_idle_submits",
+            &BufferPool::max_idle_submits,
+            &BufferPool::set_max_idle_submits,
+            D_NA(BufferPool, max_idle_submits)
+        )
+        .def("__repr__", &BufferPool::to_string);
+}
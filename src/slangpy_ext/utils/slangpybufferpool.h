@@ -0,0 +1,140 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+#include <map>
+#include <mutex>
+#include <tuple>
+#include <vector>
+
+#include "nanobind.h"
+
+#include "sgl/core/macros.h"
+#include "sgl/core/fwd.h"
+#include "sgl/core/object.h"
+
+#include "sgl/device/fwd.h"
+#include "sgl/device/resource.h"
+
+namespace sgl::slangpy {
+
+/// Per device pool of transient buffers, used for implicit call outputs, numpy staging and
+/// interop temporaries. Buffers are bucketed by size, struct size, usage and memory type, and
+/// handed out again once the pool holds the only reference to them and the GPU has finished
+/// with them.
+///
+/// Released buffers are collected at most once per submit, as buffers released since the
+/// last submit can't be reused before the next one finishes anyway. Free buffers that
+/// haven't been reused for max_idle_submits submits are released, as are the least recently
+/// freed buffers while the free buffers exceed max_free_bytes.
+class BufferPool : public Object {
+public:
+    BufferPool(Device* device);
+
+    /// Get the pool for a device, creating it if need be. The pool is cleared when the
+    /// device closes.
+    static ref<BufferPool> get(Device* device);
+
+    /// Create a buffer, drawing from the device's pool if pooling is enabled.
+    static ref<Buffer> create_buffer(Device* device, const BufferDesc& desc);
+
+    /// Enable or disable pooling of transient buffers.
+    static void set_enabled(bool enabled) { s_enabled = enabled; }
+
+    /// Check whether pooling of transient buffers is enabled.
+    static bool is_enabled() { return s_enabled; }
+
+    /// Get a free buffer matching a description, or create a new one.
+    ref<Buffer> acquire(const BufferDesc& desc);
+
+    /// Release all buffers that are not in use.
+    void trim();
+
+    /// Release all buffers held by the pool.
+    void clear();
+
+    /// Reset hit and miss counts, and peak bytes to the current size of the pool.
+    void reset_stats();
+
+    /// Number of requests satisfied by an existing buffer.
+    uint64_t hits() const { return m_hits; }
+
+    /// Number of requests that allocated a new buffer.
+    uint64_t misses() const { return m_misses; }
+
+    /// Number of buffers released by the pool as they were idle or over the byte limit.
+    uint64_t evictions() const { return m_evictions; }
+
+    /// Number of buffers held by the pool, in use or not.
+    size_t buffer_count() const;
+
+    /// Total size of buffers held by the pool.
+    size_t bytes() const { return m_bytes; }
+
+    /// Total size of free buffers held by the pool.
+    size_t free_bytes() const { return m_free_bytes; }
+
+    /// Highest total size of buffers held by the pool.
+    size_t peak_bytes() const { return m_peak_bytes; }
+
+    /// Maximum total size of free buffers kept for reuse.
+    size_t max_free_bytes() const { return m_max_free_bytes; }
+    void set_max_free_bytes(size_t max_free_bytes);
+
+    /// Number of submits after which a free buffer that hasn't been reused is released.
+    uint64_t max_idle_submits() const { return m_max_idle_submits; }
+    void set_max_idle_submits(uint64_t max_idle_submits);
+
+    std::string to_string() const override;
+
+private:
+    // Size, struct size, usage, memory type.
+    using Key = std::tuple<size_t, size_t, BufferUsage, MemoryType>;
+
+    struct Entry {
+        ref<Buffer> buffer;
+        // Submit that must finish before a released buffer can be reused.
+        uint64_t release_id{0};
+        // Last submit when the buffer became free, for idle and least recently freed eviction.
+        uint64_t free_id{0};
+    };
+
+    struct Bucket {
+        // Buffers handed out, which may still be referenced.
+        std::vector<Entry> in_use;
+        // Buffers no longer referenced, waiting for the GPU to finish with them.
+        std::vector<Entry> released;
+        // Buffers ready for reuse, most recently freed last.
+        std::vector<Entry> free;
+    };
+
+    /// Find buffers released since the last collect, move released buffers the GPU has
+    /// finished with to the free lists, and evict free buffers over the limits.
+    void collect();
+
+    /// Move released buffers of a bucket the GPU has finished with to its free list.
+    void update_released(Bucket& bucket, uint64_t submit_id);
+
+    /// Release free buffers that have been idle too long or are over the byte limit.
+    void evict(uint64_t submit_id);
+
+    Device* m_device;
+    std::map<Key, Bucket> m_buckets;
+    mutable std::mutex m_mutex;
+
+    // Submit id when released buffers were last collected.
+    uint64_t m_collect_id{0};
+
+    uint64_t m_hits{0};
+    uint64_t m_misses{0};
+    uint64_t m_evictions{0};
+    size_t m_bytes{0};
+    size_t m_free_bytes{0};
+    size_t m_peak_bytes{0};
+    size_t m_max_free_bytes{256ull * 1024 * 1024};
+    uint64_t m_max_idle_submits{64};
+
+    static bool s_enabled;
+};
+
+} // namespace sgl::slangpy
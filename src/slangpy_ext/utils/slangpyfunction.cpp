@@ -22,59 +22,218 @@ struct GcHelper<slangpy::NativeFunctionNode> {
 namespace sgl::slangpy {
 
 
-ref<NativeCallData> NativeFunctionNode::build_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+bool NativeFunctionNode::s_call_guards_enabled = true;
+
+std::unique_ptr<CallGuard> CallGuard::create(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
 {
-    auto options = make_ref<NativeCallRuntimeOptions>();
-    gather_runtime_options(options);
+    auto guard = std::make_unique<CallGuard>();
+    guard->m_cache = ref<NativeCallDataCache>(cache);
+    guard->m_args.reserve(args.size());
+    for (const auto& arg : args) {
+        if (!guard->make_arg_guard(arg, guard->m_args.emplace_back()))
+            return nullptr;
+    }
+    guard->m_kwargs.reserve(kwargs.size());
+    for (const auto& [k, v] : kwargs) {
+        auto& [name, arg_guard] = guard->m_kwargs.emplace_back();
+        name = nb::borrow(k);
+        if (!guard->make_arg_guard(v, arg_guard))
+            return nullptr;
+    }
+    return guard;
+}
 
-    nb::tuple full_args;
-    if (!options->get_this().is_none()) {
-        args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
+void CallGuard::bind(uint64_t generation, std::optional<NativeCallDataCache::EntryHandle> entry)
+{
+    m_generation = generation;
+    if (entry)
+        m_entry = *entry;
+}
+
+bool CallGuard::make_arg_guard(nb::handle o, ArgGuard& guard) const
+{
+    // Mirrors NativeCallDataCache::get_value_signature for the types whose signature can
+    // be checked cheaply. Anything else (containers, python objects) can't be guarded,
+    // so always takes the full signature path.
+    nb::handle type = o.type();
+    guard.type = nb::borrow(type);
+
+    if (nb::type_check(type)) {
+        const NativeObject* native_object;
+        if (nb::try_cast<const NativeObject*>(o, native_object)) {
+            // Objects implemented in python may generate their signature dynamically.
+            if (dynamic_cast<const PyNativeObject*>(native_object)
+                || dynamic_cast<const NativeFunctionNode*>(native_object))
+                return false;
+            guard.kind = ArgKind::native_object;
+            guard.signature = native_object->slangpy_signature();
+            return true;
+        }
+        auto builder = make_ref<SignatureBuilder>();
+        if (m_cache->get_type_table_signature(builder, o)) {
+            guard.kind = ArgKind::type_table;
+            guard.signature = builder->str();
+            return true;
+        }
+        return false;
     }
 
+    if (type.is((PyObject*)&PyLong_Type) || type.is((PyObject*)&PyFloat_Type) || type.is((PyObject*)&PyBool_Type)
+        || type.is((PyObject*)&PyUnicode_Type)) {
+        guard.kind = ArgKind::type_only;
+        return true;
+    }
+
+    if (strcmp(nb::type_name(type).c_str(), "numpy.ndarray") == 0) {
+        guard.kind = ArgKind::numpy;
+        guard.ndim = nb::cast<size_t>(o.attr("ndim"));
+        guard.dtype = o.attr("dtype");
+        return true;
+    }
+
+    return false;
+}
+
+bool CallGuard::check_arg(const ArgGuard& guard, nb::handle o) const
+{
+    if (!o.type().is(guard.type))
+        return false;
+    switch (guard.kind) {
+    case ArgKind::type_only:
+        return true;
+    case ArgKind::native_object:
+        return nb::cast<const NativeObject*>(o)->slangpy_signature() == guard.signature;
+    case ArgKind::type_table: {
+        auto builder = make_ref<SignatureBuilder>();
+        return m_cache->get_type_table_signature(builder, o) && builder->str() == guard.signature;
+    }
+    case ArgKind::numpy:
+        return o.attr("dtype").is(guard.dtype) && nb::cast<size_t>(o.attr("ndim")) == guard.ndim;
+    }
+    return false;
+}
+
+bool CallGuard::check(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs) const
+{
+    if (cache != m_cache.get() || cache->generation() != m_generation)
+        return false;
+    return matches(args, kwargs);
+}
+
+bool CallGuard::matches(nb::args args, nb::kwargs kwargs) const
+{
+    if (args.size() != m_args.size() || kwargs.size() != m_kwargs.size())
+        return false;
+
+    size_t i = 0;
+    for (const auto& arg : args) {
+        if (!check_arg(m_args[i++], arg))
+            return false;
+    }
+    i = 0;
+    for (const auto& [k, v] : kwargs) {
+        const auto& [name, arg_guard] = m_kwargs[i++];
+        if (!k.is(name) && !k.equal(name))
+            return false;
+        if (!check_arg(arg_guard, v))
+            return false;
+    }
+    return true;
+}
+
+ref<NativeCallData> NativeFunctionNode::lookup_call_data(
+    NativeCallDataCache* cache,
+    nb::args args,
+    nb::kwargs kwargs,
+    std::string& signature
+)
+{
     auto builder = make_ref<SignatureBuilder>();
     read_signature(builder);
     cache->get_args_signature(builder, args, kwargs);
 
-    std::string sig = builder->str();
-    ref<NativeCallData> result = cache->find_call_data(sig);
+    signature = builder->str();
+    ref<NativeCallData> result = cache->find_call_data(signature);
     if (!result) {
         result = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, result);
+        cache->add_call_data(signature, result);
     }
     return result;
 }
 
-nb::object NativeFunctionNode::call(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+ref<NativeCallData> NativeFunctionNode::resolve_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+{
+    if (s_call_guards_enabled && m_guard && m_guard->check(cache, args, kwargs))
+        return cache->use_entry(m_guard->entry());
+
+    std::string sig;
+    ref<NativeCallData> result = lookup_call_data(cache, args, kwargs, sig);
+
+    // Install a guard so the next call with matching arguments can skip the signature.
+    m_guard.reset();
+    if (s_call_guards_enabled && result) {
+        // Take the generation with the entry, as creating the guard can run Python code
+        // that clears the cache. The guard then fails its first check instead of binding
+        // a stale entry to the new generation.
+        uint64_t generation = cache->generation();
+        auto entry = cache->find_entry(sig);
+        if (entry) {
+            m_guard = CallGuard::create(cache, args, kwargs);
+            if (m_guard)
+                m_guard->bind(generation, entry);
+        }
+    }
+    return result;
+}
+
+nb::object NativeFunctionNode::find_dispatch_data(NativeCallDataCache* cache, nb::dict kwargs) const
+{
+    if (s_call_guards_enabled && m_dispatch_guard
+        && m_dispatch_guard->check(cache, nb::cast<nb::args>(nb::tuple()), nb::cast<nb::kwargs>(kwargs)))
+        return m_dispatch_data;
+    return nb::none();
+}
+
+void NativeFunctionNode::set_dispatch_data(NativeCallDataCache* cache, nb::object dispatch_data, nb::dict kwargs)
+{
+    m_dispatch_guard.reset();
+    m_dispatch_data = nb::none();
+    if (!s_call_guards_enabled)
+        return;
+    uint64_t generation = cache->generation();
+    m_dispatch_guard = CallGuard::create(cache, nb::cast<nb::args>(nb::tuple()), nb::cast<nb::kwargs>(kwargs));
+    if (m_dispatch_guard) {
+        m_dispatch_guard->bind(generation);
+        m_dispatch_data = dispatch_data;
+    }
+}
+
+ref<NativeCallData> NativeFunctionNode::build_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
 {
     auto options = make_ref<NativeCallRuntimeOptions>();
     gather_runtime_options(options);
 
-    nb::tuple full_args;
     if (!options->get_this().is_none()) {
         args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
 
-    auto builder = make_ref<SignatureBuilder>();
-    read_signature(builder);
-    cache->get_args_signature(builder, args, kwargs);
+    return resolve_call_data(cache, args, kwargs);
+}
 
-    std::string sig = builder->str();
-    ref<NativeCallData> call_data = cache->find_call_data(sig);
+nb::object NativeFunctionNode::call(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+{
+    auto options = make_ref<NativeCallRuntimeOptions>();
+    gather_runtime_options(options);
 
-    if (call_data) {
-        if (call_data->is_torch_integration())
-            return call_data->_py_torch_call(this, options, args, kwargs);
-        else
-            return call_data->call(options, args, kwargs);
-    } else {
-        ref<NativeCallData> new_call_data = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, new_call_data);
-        if (new_call_data->is_torch_integration())
-            return new_call_data->_py_torch_call(this, options, args, kwargs);
-        else
-            return new_call_data->call(options, args, kwargs);
+    if (!options->get_this().is_none()) {
+        args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
+
+    ref<NativeCallData> call_data = resolve_call_data(cache, args, kwargs);
+    if (call_data->is_torch_integration())
+        return call_data->_py_torch_call(this, options, args, kwargs);
+    else
+        return call_data->call(options, args, kwargs);
 }
 
 void NativeFunctionNode::append_to(
@@ -87,26 +246,69 @@ void NativeFunctionNode::append_to(
     auto options = make_ref<NativeCallRuntimeOptions>();
     gather_runtime_options(options);
 
-    nb::tuple full_args;
     if (!options->get_this().is_none()) {
         args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
 
-    auto builder = make_ref<SignatureBuilder>();
-    read_signature(builder);
-    cache->get_args_signature(builder, args, kwargs);
+    ref<NativeCallData> call_data = resolve_call_data(cache, args, kwargs);
+    call_data->append_to(options, command_encoder, args, kwargs);
+}
 
+NativeCompiledCall::NativeCompiledCall(
+    ref<NativeFunctionNode> function,
+    ref<NativeCallDataCache> cache,
+    nb::args args,
+    nb::kwargs kwargs
+)
+    : m_function(std::move(function))
+    , m_cache(std::move(cache))
+{
+    m_options = make_ref<NativeCallRuntimeOptions>();
+    m_function->gather_runtime_options(m_options);
 
-    std::string sig = builder->str();
-    NativeCallData* call_data = cache->find_call_data(sig);
+    if (!m_options->get_this().is_none()) {
+        args = nb::cast<nb::args>(nb::make_tuple(m_options->get_this()) + args);
+    }
 
-    if (call_data) {
-        call_data->append_to(options, command_encoder, args, kwargs);
+    m_call_data = m_function->lookup_call_data(m_cache.get(), args, kwargs, m_signature);
+    SGL_CHECK(m_call_data, "Failed to generate call data for compiled call");
+    m_guard = CallGuard::create(m_cache.get(), args, kwargs);
+}
+
+nb::args NativeCompiledCall::prepare_args(nb::args args, nb::kwargs kwargs) const
+{
+    if (!m_options->get_this().is_none()) {
+        args = nb::cast<nb::args>(nb::make_tuple(m_options->get_this()) + args);
+    }
+
+    // Arguments that can't be guarded cheaply are checked against the full signature.
+    bool matches;
+    if (m_guard) {
+        matches = m_guard->matches(args, kwargs);
     } else {
-        ref<NativeCallData> new_call_data = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, new_call_data);
-        new_call_data->append_to(options, command_encoder, args, kwargs);
+        auto builder = make_ref<SignatureBuilder>();
+        m_function->read_signature(builder);
+        m_cache->get_args_signature(builder, args, kwargs);
+        matches = builder->str() == m_signature;
     }
+    if (!matches)
+        throw nb::type_error("Arguments do not match the types the call was compiled for");
+    return args;
+}
+
+nb::object NativeCompiledCall::call(nb::args args, nb::kwargs kwargs)
+{
+    args = prepare_args(args, kwargs);
+    if (m_call_data->is_torch_integration())
+        return m_call_data->_py_torch_call(m_function.get(), m_options, args, kwargs);
+    else
+        return m_call_data->call(m_options, args, kwargs);
+}
+
+void NativeCompiledCall::append_to(CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs)
+{
+    args = prepare_args(args, kwargs);
+    m_call_data->append_to(m_options, command_encoder, args, kwargs);
 }
 
 std::string NativeFunctionNode::to_string() const
@@ -176,6 +378,21 @@ SGL_PY_EXPORT(utils_slangpy_function)
             "kwargs"_a,
             D_NA(NativeFunctionNode, append_to)
         )
+        .def(
+            "_native_find_dispatch_data",
+            &NativeFunctionNode::find_dispatch_data,
+            "cache"_a,
+            "kwargs"_a,
+            D_NA(NativeFunctionNode, find_dispatch_data)
+        )
+        .def(
+            "_native_set_dispatch_data",
+            &NativeFunctionNode::set_dispatch_data,
+            "cache"_a,
+            "dispatch_data"_a,
+            "kwargs"_a,
+            D_NA(NativeFunctionNode, set_dispatch_data)
+        )
         .def(
             "generate_call_data",
             &NativeFunctionNode::generate_call_data,
@@ -195,5 +412,47 @@ SGL_PY_EXPORT(utils_slangpy_function)
             "options"_a,
             D_NA(NativeFunctionNode, gather_runtime_options)
         )
+        .def_static(
+            "set_call_guards_enabled",
+            &NativeFunctionNode::set_call_guards_enabled,
+            "enabled"_a,
+            D_NA(NativeFunctionNode, set_call_guards_enabled)
+        )
+        .def_static(
+            "is_call_guards_enabled",
+            &NativeFunctionNode::is_call_guards_enabled,
+            D_NA(NativeFunctionNode, is_call_guards_enabled)
+        )
         .def("__repr__", &NativeFunctionNode::to_string);
+
+    nb::class_<NativeCompiledCall, Object>(slangpy, "NativeCompiledCall") //
+        .def(
+            "__init__",
+            [](NativeCompiledCall* self,
+               ref<NativeFunctionNode> function,
+               ref<NativeCallDataCache> cache,
+               nb::tuple args,
+               nb::dict kwargs)
+            {
+                new (self)
+                    NativeCompiledCall(function, cache, nb::cast<nb::args>(args), nb::cast<nb::kwargs>(kwargs));
+            },
+            "function"_a,
+            "cache"_a,
+            "args"_a,
+            "kwargs"_a,
+            D_NA(NativeCompiledCall, NativeCompiledCall)
+        )
+        .def_prop_ro("function", &NativeCompiledCall::function, D_NA(NativeCompiledCall, function))
+        .def_prop_ro("call_data", &NativeCompiledCall::call_data, D_NA(NativeCompiledCall, call_data))
+        .def_prop_ro("signature", &NativeCompiledCall::signature, D_NA(NativeCompiledCall, signature))
+        .def("__call__", &NativeCompiledCall::call, "args"_a, "kwargs"_a, D_NA(NativeCompiledCall, call))
+        .def(
+            "append_to",
+            &NativeCompiledCall::append_to,
+            "command_encoder"_a,
+            "args"_a,
+            "kwargs"_a,
+            D_NA(NativeCompiledCall, append_to)
+        );
 }
@@ -4,6 +4,7 @@
 
 #include <vector>
 #include <map>
+#include <memory>
 
 #include "nanobind.h"
 
@@ -26,6 +27,8 @@ enum class FunctionNodeType {
     this_,
     cuda_stream,
     ray_tracing,
+    indirect,
+    gather,
 };
 SGL_ENUM_INFO(
     FunctionNodeType,
@@ -36,10 +39,64 @@ SGL_ENUM_INFO(
         {FunctionNodeType::this_, "this"},
         {FunctionNodeType::cuda_stream, "cuda_stream"},
         {FunctionNodeType::ray_tracing, "ray_tracing"},
+        {FunctionNodeType::indirect, "indirect"},
+        {FunctionNodeType::gather, "gather"},
     }
 );
 SGL_ENUM_REGISTER(FunctionNodeType);
 
+/// Cheap check that a set of call arguments would produce the same signature as the
+/// arguments a call data was resolved for. Installed on a function node after a full
+/// signature lookup, so repeat calls with the same argument types skip building the
+/// signature string. Only created when every argument's signature can be checked
+/// without calling into Python signature code.
+class CallGuard {
+public:
+    static std::unique_ptr<CallGuard> create(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
+
+    /// Record the cache generation (and optionally an entry) the guard is valid for, so the
+    /// guard fails once the cache changes. The generation must be read before the guard is
+    /// created, as creating it can run Python code.
+    void bind(uint64_t generation, std::optional<NativeCallDataCache::EntryHandle> entry = std::nullopt);
+
+    /// Check the cache is unchanged since the guard was bound and the arguments match.
+    bool check(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs) const;
+
+    /// Check whether the arguments match those the guard was created for.
+    bool matches(nb::args args, nb::kwargs kwargs) const;
+
+    NativeCallDataCache::EntryHandle entry() const { return m_entry; }
+
+private:
+    enum class ArgKind {
+        /// Signature depends only on the Python type (int/float/bool/str).
+        type_only,
+        /// Native object with a fixed signature string.
+        native_object,
+        /// Bound type with a native signature function (e.g. Buffer/Texture).
+        type_table,
+        /// Numpy array, whose signature depends on dtype and dimensionality.
+        numpy,
+    };
+
+    struct ArgGuard {
+        nb::object type;
+        ArgKind kind;
+        std::string signature;
+        size_t ndim{0};
+        nb::object dtype;
+    };
+
+    bool make_arg_guard(nb::handle o, ArgGuard& guard) const;
+    bool check_arg(const ArgGuard& guard, nb::handle o) const;
+
+    ref<NativeCallDataCache> m_cache;
+    uint64_t m_generation{0};
+    NativeCallDataCache::EntryHandle m_entry;
+    std::vector<ArgGuard> m_args;
+    std::vector<std::pair<nb::object, ArgGuard>> m_kwargs;
+};
+
 class NativeFunctionNode : NativeObject {
     SGL_OBJECT(NativeFunctionNode)
 public:
@@ -86,6 +143,27 @@ public:
         case sgl::slangpy::FunctionNodeType::ray_tracing:
             options->set_is_ray_tracing(true);
             break;
+        case sgl::slangpy::FunctionNodeType::indirect: {
+            // (count buffer, count index, args kernel, args buffer)
+            auto indirect = nb::cast<nb::tuple>(m_data);
+            options->set_indirect(
+                nb::cast<ref<Buffer>>(indirect[0]),
+                nb::cast<uint32_t>(indirect[1]),
+                nb::cast<ref<ComputeKernel>>(indirect[2]),
+                nb::cast<ref<Buffer>>(indirect[3])
+            );
+            break;
+        }
+        case sgl::slangpy::FunctionNodeType::gather: {
+            // (index buffer, first index, index count)
+            auto gather = nb::cast<nb::tuple>(m_data);
+            options->set_gather(
+                nb::cast<ref<Buffer>>(gather[0]),
+                nb::cast<uint32_t>(gather[1]),
+                nb::cast<uint32_t>(gather[2])
+            );
+            break;
+        }
         default:
             break;
         }
@@ -108,6 +186,11 @@ public:
 
     ref<NativeCallData> build_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
 
+    /// Build the signature for a set of arguments (including this), then find or generate
+    /// the matching call data.
+    ref<NativeCallData>
+    lookup_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs, std::string& signature);
+
     nb::object call(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
 
     void append_to(NativeCallDataCache* cache, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
@@ -122,16 +205,74 @@ public:
         return nullptr;
     }
 
+    /// Find the dispatch data stored by a previous raw dispatch with matching arguments.
+    nb::object find_dispatch_data(NativeCallDataCache* cache, nb::dict kwargs) const;
+
+    /// Store dispatch data so later raw dispatches with matching arguments can skip the
+    /// signature lookup. Cleared whenever the call data cache changes.
+    void set_dispatch_data(NativeCallDataCache* cache, nb::object dispatch_data, nb::dict kwargs);
+
     void garbage_collect()
     {
         m_parent = nullptr;
         m_data = nb::none();
+        m_guard.reset();
+        m_dispatch_guard.reset();
+        m_dispatch_data = nb::none();
     }
 
+    /// Enable/disable call guards, which skip signature building for repeat calls.
+    static void set_call_guards_enabled(bool enabled) { s_call_guards_enabled = enabled; }
+
+    /// Check if call guards are enabled.
+    static bool is_call_guards_enabled() { return s_call_guards_enabled; }
+
 private:
     ref<NativeFunctionNode> m_parent;
     FunctionNodeType m_type;
     nb::object m_data;
+    std::unique_ptr<CallGuard> m_guard;
+    std::unique_ptr<CallGuard> m_dispatch_guard;
+    nb::object m_dispatch_data;
+
+    static bool s_call_guards_enabled;
+
+    /// Find or generate the call data for a set of arguments (including this).
+    ref<NativeCallData> resolve_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
+};
+
+/// Function call bound to the argument types it was compiled for. The function node
+/// chain, runtime options and call data are resolved once, so calls skip straight to
+/// dispatch. Arguments are still checked against the compiled signature, and calls
+/// with different argument types fail rather than generating a new kernel.
+class NativeCompiledCall : public Object {
+    SGL_OBJECT(NativeCompiledCall)
+public:
+    NativeCompiledCall(ref<NativeFunctionNode> function, ref<NativeCallDataCache> cache, nb::args args, nb::kwargs kwargs);
+
+    /// Function node the call was compiled from.
+    ref<NativeFunctionNode> function() const { return m_function; }
+
+    /// Call data the call dispatches.
+    ref<NativeCallData> call_data() const { return m_call_data; }
+
+    /// Signature the call was compiled for.
+    const std::string& signature() const { return m_signature; }
+
+    nb::object call(nb::args args, nb::kwargs kwargs);
+
+    void append_to(CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
+
+private:
+    ref<NativeFunctionNode> m_function;
+    ref<NativeCallDataCache> m_cache;
+    ref<NativeCallRuntimeOptions> m_options;
+    ref<NativeCallData> m_call_data;
+    std::string m_signature;
+    std::unique_ptr<CallGuard> m_guard;
+
+    /// Prepend this (if bound) and check the arguments match the compiled signature.
+    nb::args prepare_args(nb::args args, nb::kwargs kwargs) const;
 };
 
 struct PyNativeFunctionNode : NativeFunctionNode {
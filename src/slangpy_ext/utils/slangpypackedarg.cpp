@@ -54,8 +54,18 @@ SGL_PY_EXPORT(utils_slangpy_packedarg)
             "python_object"_a,
             D_NA(NativePackedArg, NativePackedArg)
         )
-        .def_prop_ro("python", &NativePackedArg::python, D_NA(NativePackedArg, python))
-        .def_prop_ro("shader_object", &NativePackedArg::shader_object, D_NA(NativePackedArg, shader_object))
-        .def_prop_ro("python_object", &NativePackedArg::python_object, D_NA(NativePackedArg, python_object))
+        .def_prop_rw("python", &NativePackedArg::python, &NativePackedArg::set_python, D_NA(NativePackedArg, python))
+        .def_prop_rw(
+            "shader_object",
+            &NativePackedArg::shader_object,
+            &NativePackedArg::set_shader_object,
+            D_NA(NativePackedArg, shader_object)
+        )
+        .def_prop_rw(
+            "python_object",
+            &NativePackedArg::python_object,
+            &NativePackedArg::set_python_object,
+            D_NA(NativePackedArg, python_object)
+        )
         .def("__repr__", &NativePackedArg::to_string);
 }
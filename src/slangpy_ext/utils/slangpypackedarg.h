@@ -30,12 +30,21 @@ public:
     /// Get the Python marshall.
     ref<NativeMarshall> python() const { return m_python; }
 
+    /// Set the Python marshall.
+    void set_python(ref<NativeMarshall> python) { m_python = std::move(python); }
+
     /// Get the shader object.
     ref<ShaderObject> shader_object() const { return m_shader_object; }
 
+    /// Set the shader object.
+    void set_shader_object(ref<ShaderObject> shader_object) { m_shader_object = std::move(shader_object); }
+
     /// Get the Python object.
     nb::object python_object() const { return m_python_object; }
 
+    /// Set the Python object.
+    void set_python_object(nb::object python_object) { m_python_object = python_object; }
+
     /// Get string representation of the packed arg.
     std::string to_string() const override;
 
@@ -8,6 +8,7 @@
 #include "sgl/device/buffer_cursor.h"
 
 #include "utils/slangpytensor.h"
+#include "utils/slangpybufferpool.h"
 
 namespace sgl {
 
@@ -410,7 +411,7 @@ nb::object NativeTensorMarshall::create_output(CallContext* context, NativeBound
 
     // Get type, buffer layout and shape.
     ref<NativeSlangType> dtype = m_slang_element_type;
-    ref<TypeLayoutReflection> layout = m_element_layout;
+    ref<TypeLayoutReflection> layout = element_layout();
     auto& shape = context->call_shape();
 
     // Create a new structured buffer for storage.
@@ -418,7 +419,7 @@ nb::object NativeTensorMarshall::create_output(CallContext* context, NativeBound
     buffer_desc.usage = BufferUsage::shader_resource | BufferUsage::unordered_access | BufferUsage::shared;
     buffer_desc.struct_size = layout->stride();
     buffer_desc.element_count = shape.element_count();
-    ref<Buffer> buffer = context->device()->create_buffer(buffer_desc);
+    ref<Buffer> buffer = BufferPool::create_buffer(context->device(), buffer_desc);
 
     NativeTensorDesc desc;
     desc.dtype = dtype;
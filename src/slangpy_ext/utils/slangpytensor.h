@@ -97,8 +97,16 @@ public:
     int dims() const { return m_dims; }
     bool writable() const { return m_writable; }
     ref<NativeSlangType> slang_element_type() const { return m_slang_element_type; }
-    ref<TypeLayoutReflection> element_layout() const { return m_element_layout; }
-    size_t element_stride() const { return m_element_layout->stride(); }
+    ref<TypeLayoutReflection> element_layout() const
+    {
+        // A hot reload invalidates all reflection, while the marshall lives on in the call
+        // data of modules the reload didn't affect. The element type's reflection is updated
+        // in place, so look the layout up from it again.
+        if (!m_element_layout->is_valid())
+            m_element_layout = m_slang_element_type->buffer_type_layout();
+        return m_element_layout;
+    }
+    size_t element_stride() const { return element_layout()->stride(); }
     bool has_derivative() const { return m_d_in != nullptr || m_d_out != nullptr; }
     ref<NativeTensorMarshall> d_in() const { return m_d_in; }
     ref<NativeTensorMarshall> d_out() const { return m_d_out; }
@@ -130,7 +138,7 @@ private:
     int m_dims;
     bool m_writable;
     ref<NativeSlangType> m_slang_element_type;
-    ref<TypeLayoutReflection> m_element_layout;
+    mutable ref<TypeLayoutReflection> m_element_layout;
     ref<NativeTensorMarshall> m_d_in;
     ref<NativeTensorMarshall> m_d_out;
 